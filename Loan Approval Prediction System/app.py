@@ -4,12 +4,17 @@ Flask application for Loan Approval Prediction System.
 
 import os
 import sys
+import atexit
 import logging
-from flask import Flask, render_template, request, jsonify, send_from_directory
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
 from pathlib import Path
-import traceback
-import pandas as pd
 
 # Load environment variables from .env file
 try:
@@ -25,7 +30,6 @@ if sys.platform == 'win32':
     except:
         pass
 
-from models.loan_model import LoanModelTrainer
 from utils.validators import LoanApplicationValidator
 from utils.loan_schemas import (
     EducationLoanApplication, HomeLoanApplication, CarLoanApplication,
@@ -35,64 +39,248 @@ from utils.loan_validators import (
     EducationLoanValidator, HomeLoanValidator, CarLoanValidator,
     PersonalLoanValidator, BusinessLoanValidator
 )
-from utils.loan_storage import save_application, get_all_applications, get_applications_by_type, get_application_by_id, update_application_status, delete_application
+from utils.loan_storage import save_application, save_applications, get_all_applications, get_applications_by_type, get_applications_page, get_application_by_id, update_application_status, delete_application
 from utils.emi_calculator import calculate_emi_for_loan_type, get_loan_details
 from utils.email_service import email_service
 from utils.approval_engine import check_loan_approval
+from utils.json_provider import OrjsonProvider, ORJSON_AVAILABLE
+from utils.batch_scorer import BatchScorer
+from utils.log_sampling import SampledTracebackFormatter
 
-# Configure logging
+# Configure logging (set LOG_LEVEL=WARNING in production to skip info logs).
+# force=True because imported utility modules may already have configured
+# the root logger.
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format=LOG_FORMAT,
+    force=True
+)
+# Repeated errors from the same line keep one traceback in TRACEBACK_SAMPLE_RATE
+_traceback_formatter = SampledTracebackFormatter(
+    LOG_FORMAT, rate=int(os.environ.get('TRACEBACK_SAMPLE_RATE', '100'))
 )
+for _handler in logging.getLogger().handlers:
+    _handler.setFormatter(_traceback_formatter)
 logger = logging.getLogger(__name__)
 
+# Per-loan-type configuration for the application endpoints. Validators are
+# stateless, so a single instance per loan type is shared across requests.
+LOAN_CONFIG = {
+    'education': {
+        'message': 'Education loan application submitted successfully',
+        'schema': EducationLoanApplication,
+        'validator': EducationLoanValidator(),
+        'tenure_attr': 'repayment_period',
+        'tenure_unit': 'years',
+        'name_attr': 'full_name'
+    },
+    'home': {
+        'message': 'Home loan application submitted successfully',
+        'schema': HomeLoanApplication,
+        'validator': HomeLoanValidator(),
+        'tenure_attr': 'loan_tenure',
+        'tenure_unit': 'years',
+        'name_attr': 'full_name'
+    },
+    'car': {
+        'message': 'Car loan application submitted successfully',
+        'schema': CarLoanApplication,
+        'validator': CarLoanValidator(),
+        'tenure_attr': 'loan_tenure',
+        'tenure_unit': 'months',
+        'name_attr': 'full_name'
+    },
+    'personal': {
+        'message': 'Personal loan application submitted successfully',
+        'schema': PersonalLoanApplication,
+        'validator': PersonalLoanValidator(),
+        'tenure_attr': 'loan_tenure',
+        'tenure_unit': 'months',
+        'name_attr': 'full_name'
+    },
+    'business': {
+        'message': 'Business loan application submitted successfully',
+        'schema': BusinessLoanApplication,
+        'validator': BusinessLoanValidator(),
+        'tenure_attr': 'loan_tenure',
+        'tenure_unit': 'years',
+        'name_attr': 'owner_name'
+    }
+}
+
+PREDICT_VALIDATOR = LoanApplicationValidator()
+
+# Emails are sent in the background so responses don't wait on SMTP.
+# Pending messages are drained on interpreter shutdown, then the pooled
+# SMTP connections are closed (atexit runs handlers in reverse order).
+# One worker per pooled SMTP connection, so every send reuses a session.
+EMAIL_POOL = ThreadPoolExecutor(max_workers=max(1, email_service.pool_size), thread_name_prefix='email')
+atexit.register(email_service.close)
+atexit.register(EMAIL_POOL.shutdown, wait=True)
+
 app = Flask(__name__)
 CORS(app)
 
+# Use orjson for request parsing and jsonify() when it is installed
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
 # Enable better error reporting
 app.config['PROPAGATE_EXCEPTIONS'] = True
 
-# Global variables for model
-model_trainer = None
+# Cache compiled templates on disk so new workers skip Jinja compilation.
+# Defaults to a per-user directory under the system temp dir.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.environ.get('JINJA_CACHE_DIR'))
+
+# Load and warm the model when the app is imported rather than on the first
+# prediction request (see the bottom of this module)
+WARMUP_ON_START = os.environ.get('WARMUP_ON_START', '0') == '1'
+
+# joblib mmap mode for the saved model arrays: 'c' (copy-on-write, default),
+# 'r' (read-only; SVC can't score from read-only buffers) or 'none' to read
+# them into memory
+MODEL_MMAP_MODE = os.environ.get('MODEL_MMAP_MODE', 'c').lower()
+
+# Global variables for model, populated once by load_model()
 model = None
 preprocessor = None
 model_info = None
+forest_scorer = None
+_model_load_attempted = False
+_model_load_lock = threading.Lock()
 
 
 def load_model():
-    """Load the trained model and preprocessor."""
-    global model, preprocessor, model_info, model_trainer
+    """
+    Load the trained model and preprocessor.
     
-    try:
-        model_dir = Path('models/trained_models')
-        if not (model_dir / 'best_model.joblib').exists():
-            logger.warning("Trained model not found. Training new model...")
-            # Train model if not exists
-            dataset_path = Path('data/loan_dataset.csv')
-            if dataset_path.exists():
-                model_trainer = LoanModelTrainer()
-                model_trainer.train_models(str(dataset_path))
-                model_trainer.save_models()
-                model = model_trainer.best_model
-                preprocessor = model_trainer.preprocessor
-                model_info = {
-                    'best_model_name': model_trainer.best_model_name,
-                    'metrics': model_trainer.model_metrics,
-                    'feature_names': model_trainer.feature_names
-                }
-            else:
-                logger.error("Dataset not found. Please generate dataset first.")
-                return False
-        else:
-            model, preprocessor, model_info = LoanModelTrainer.load_model()
-            logger.info("Model loaded successfully")
+    Runs at most once per process; later calls return whether the first
+    attempt produced a model.
+    """
+    global model, preprocessor, model_info, forest_scorer, _model_load_attempted
+    
+    with _model_load_lock:
+        if _model_load_attempted:
+            return model is not None
+        _model_load_attempted = True
         
-        return True
+        try:
+            # Imported here so the web workers don't pay for pandas/sklearn/xgboost
+            # until a model is actually needed
+            from models.loan_model import LoanModelTrainer
+            from models.tree_scorer import ForestScorer
+            
+            if not LoanModelTrainer.saved_model_exists():
+                logger.warning("Trained model not found. Training new model...")
+                # Train model if not exists
+                dataset_path = Path('data/loan_dataset.csv')
+                if dataset_path.exists():
+                    trainer = LoanModelTrainer()
+                    trainer.train_models(str(dataset_path))
+                    trainer.save_models()
+                    model_info = {
+                        'best_model_name': trainer.best_model_name,
+                        'metrics': trainer.model_metrics,
+                        'feature_names': trainer.feature_names
+                    }
+                    preprocessor = trainer.preprocessor
+                    model = trainer.best_model
+                else:
+                    logger.error("Dataset not found. Please generate dataset first.")
+                    return False
+            else:
+                loaded_model, preprocessor, model_info = LoanModelTrainer.load_model(
+                    mmap_mode=None if MODEL_MMAP_MODE == 'none' else MODEL_MMAP_MODE
+                )
+                model = loaded_model
+                logger.info("Model loaded successfully")
+            
+            _prepare_model_info()
+            _response_cache.clear()
+            forest_scorer = ForestScorer.from_model(model)
+            if WARMUP_ON_START:
+                _warmup_model()
+            return True
+        except Exception as e:
+            logger.exception("Error loading model: %s", e)
+            return False
+
+
+# Rounding applied once at load time to the values the endpoints serve
+METRIC_DECIMALS = 4
+IMPORTANCE_DECIMALS = 6  # about float32 precision
+
+
+def _prepare_model_info(top_n=5):
+    """
+    Precompute the ready-to-serialize views of the loaded model: the ranked
+    feature importances (full and top features) and the rounded metrics.
+    """
+    ranked = {}
+    if hasattr(model, 'feature_importances_'):
+        feature_names = preprocessor.get_feature_names_out()
+        values = [round(value, IMPORTANCE_DECIMALS) for value in model.feature_importances_.tolist()]
+        # Stable descending sort: ties keep feature order, like sorted()
+        order = np.argsort(-np.array(values), kind='stable')
+        ranked = {feature_names[i]: values[i] for i in order}
+    model_info['sorted_feature_importance'] = ranked
+    model_info['top_feature_importance'] = dict(list(ranked.items())[:top_n])
+    
+    model_info['metrics_rounded'] = {
+        model_name: {
+            'accuracy': round(metrics['accuracy'], METRIC_DECIMALS),
+            'precision': round(metrics['precision'], METRIC_DECIMALS),
+            'recall': round(metrics['recall'], METRIC_DECIMALS),
+            'f1_score': round(metrics['f1_score'], METRIC_DECIMALS),
+            'roc_auc': round(metrics.get('roc_auc', 0), METRIC_DECIMALS),
+            'confusion_matrix': metrics['confusion_matrix']
+        }
+        for model_name, metrics in model_info.get('metrics', {}).items()
+    }
+
+
+def _warmup_model(passes=3):
+    """
+    Run a few throwaway predictions so the first real request doesn't pay
+    for lazy initialisation in pandas/sklearn/xgboost.
+    
+    Scores directly rather than through PREDICTION_SCORER: with gunicorn
+    --preload this runs in the master, which must not start the scorer
+    thread before forking the workers.
+    """
+    # Known category values keep the dummy row on the normal encoding path
+    categories = preprocessor.category_classes()
+    dummy = {
+        col: categories[col][0] if col in categories else 0
+        for col in model_info.get('feature_names', [])
+    }
+    try:
+        for _ in range(passes):
+            _score_predictions([dummy])
+        logger.info("Model warmed up with %d dummy predictions", passes)
     except Exception as e:
-        logger.error(f"Error loading model: {str(e)}")
-        logger.error(traceback.format_exc())
-        return False
+        logger.warning("Model warmup failed: %s", e)
+
+
+# Serialized JSON bodies for GET endpoints (health, model info/performance,
+# loan details) whose data only changes when the model is (re)loaded
+_response_cache = {}
+
+
+def _cached_json_response(key, build):
+    """Return a JSON response for key, serializing build() only on the first call."""
+    body = _response_cache.get(key)
+    if body is None:
+        body = _response_cache[key] = app.json.dumps(build())
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+def _ensure_model_loaded():
+    """Lazily load the model on first use; returns True if a model is available."""
+    if _model_load_attempted:
+        return model is not None
+    return load_model()
 
 
 @app.route('/')
@@ -101,91 +289,80 @@ def index():
     return render_template('home.html')
 
 
+def _template_exists(name):
+    """Check whether a template can be loaded."""
+    try:
+        app.jinja_env.loader.get_source(app.jinja_env, name)
+        return True
+    except TemplateNotFound:
+        return False
+
+
+_FALLBACK_FORM_HTML = """
+        <html>
+        <head><title>{title} Application</title></head>
+        <body>
+            <h1>{title} Application Form</h1>
+            <p>Form template not found. Please create templates/{template}</p>
+            <a href="/">Back to Home</a>
+        </body>
+        </html>
+        """
+
+# Loan form templates are checked once at startup; missing ones are served
+# a prebuilt placeholder page instead of failing on every request.
+LOAN_FORMS = {
+    template: (_template_exists(template), _FALLBACK_FORM_HTML.format(title=title, template=template))
+    for template, title in (
+        ('loans/education_loan.html', 'Education Loan'),
+        ('loans/home_loan.html', 'Home Loan'),
+        ('loans/car_loan.html', 'Car Loan'),
+        ('loans/personal_loan.html', 'Personal Loan'),
+        ('loans/business_loan.html', 'Business Loan')
+    )
+}
+
+for _template, (_exists, _) in LOAN_FORMS.items():
+    if not _exists:
+        logger.error("Loan form template not found: templates/%s", _template)
+
+
+def _render_loan_form(template):
+    """Render a loan form, or its placeholder page if the template is missing."""
+    exists, fallback_html = LOAN_FORMS[template]
+    if exists:
+        return render_template(template)
+    return fallback_html, 200
+
+
 @app.route('/apply/education-loan')
 def education_loan_form():
     """Render education loan application form."""
-    return render_template('loans/education_loan.html')
+    return _render_loan_form('loans/education_loan.html')
 
 
 @app.route('/apply/home-loan')
 def home_loan_form():
     """Render home loan application form."""
-    try:
-        return render_template('loans/home_loan.html')
-    except Exception as e:
-        logger.error(f"Error rendering home loan form: {e}")
-        # Return a simple message if template doesn't exist
-        return f"""
-        <html>
-        <head><title>Home Loan Application</title></head>
-        <body>
-            <h1>Home Loan Application Form</h1>
-            <p>Form template not found. Please create templates/loans/home_loan.html</p>
-            <p>Error: {str(e)}</p>
-            <a href="/">Back to Home</a>
-        </body>
-        </html>
-        """, 200
+    return _render_loan_form('loans/home_loan.html')
 
 
 @app.route('/apply/car-loan')
 def car_loan_form():
     """Render car loan application form."""
-    try:
-        return render_template('loans/car_loan.html')
-    except Exception as e:
-        logger.error(f"Error rendering car loan form: {e}")
-        return f"""
-        <html>
-        <head><title>Car Loan Application</title></head>
-        <body>
-            <h1>Car Loan Application Form</h1>
-            <p>Form template not found. Please create templates/loans/car_loan.html</p>
-            <p>Error: {str(e)}</p>
-            <a href="/">Back to Home</a>
-        </body>
-        </html>
-        """, 200
+    return _render_loan_form('loans/car_loan.html')
 
 
 @app.route('/apply/personal-loan')
 def personal_loan_form():
     """Render personal loan application form."""
-    try:
-        return render_template('loans/personal_loan.html')
-    except Exception as e:
-        logger.error(f"Error rendering personal loan form: {e}")
-        return f"""
-        <html>
-        <head><title>Personal Loan Application</title></head>
-        <body>
-            <h1>Personal Loan Application Form</h1>
-            <p>Form template not found. Please create templates/loans/personal_loan.html</p>
-            <p>Error: {str(e)}</p>
-            <a href="/">Back to Home</a>
-        </body>
-        </html>
-        """, 200
+    return _render_loan_form('loans/personal_loan.html')
 
 
 @app.route('/apply/business-loan')
 def business_loan_form():
     """Render business loan application form."""
-    try:
-        return render_template('loans/business_loan.html')
-    except Exception as e:
-        logger.error(f"Error rendering business loan form: {e}")
-        return f"""
-        <html>
-        <head><title>Business Loan Application</title></head>
-        <body>
-            <h1>Business Loan Application Form</h1>
-            <p>Form template not found. Please create templates/loans/business_loan.html</p>
-            <p>Error: {str(e)}</p>
-            <a href="/">Back to Home</a>
-        </body>
-        </html>
-        """, 200
+    return _render_loan_form('loans/business_loan.html')
 
 
 @app.route('/admin')
@@ -200,475 +377,289 @@ def dashboard():
     return render_template('dashboard.html')
 
 
-@app.route('/api/apply/education-loan', methods=['POST'])
-def apply_education_loan():
-    """Handle education loan application submission."""
+def _log_email_result(future, kind, to_email):
+    """Log the outcome of a background email send."""
+    error = future.exception()
+    if error is not None:
+        # Email is best-effort; only pay for traceback formatting when debugging
+        if app.debug:
+            logger.error("Failed to send %s email to %s", kind, to_email, exc_info=error)
+        else:
+            logger.warning("Failed to send %s email to %s: %s", kind, to_email, error)
+    elif future.result():
+        logger.info("%s email sent successfully to %s", kind.capitalize(), to_email)
+    else:
+        logger.warning("%s email failed to send to %s", kind.capitalize(), to_email)
+
+
+def _dispatch_email(kind, send, **kwargs):
+    """Queue an email on the background pool without waiting for delivery."""
+    future = EMAIL_POOL.submit(send, **kwargs)
+    future.add_done_callback(lambda f: _log_email_result(f, kind, kwargs['to_email']))
+    return future
+
+
+def _evaluate_application(loan_type, data, submitted_at=None):
+    """
+    Validate an application payload and apply the approval rules.
+    
+    Builds the schema object, calculates EMI and records the approval
+    decision on the result dict. Nothing is saved or sent. submitted_at
+    is used for applications that don't carry their own.
+    
+    Returns:
+        Tuple of (evaluated application or None, error message or None)
+    """
+    config = LOAN_CONFIG[loan_type]
+    
+    # Validate
+    is_valid, error_message = config['validator'].validate(data)
+    if not is_valid:
+        return None, error_message
+    
+    # Create application object
+    try:
+        application = config['schema'](**data)
+    except Exception as schema_error:
+        logger.exception("Error creating %s loan application object: %s", loan_type, schema_error)
+        return None, f'Invalid application data: {str(schema_error)}'
+    
+    # Calculate EMI
+    emi_info = None
+    try:
+        emi_info = calculate_emi_for_loan_type(
+            loan_type,
+            application.loan_amount_required,
+            getattr(application, config['tenure_attr']),
+            config['tenure_unit']
+        )
+    except Exception as emi_error:
+        logger.warning("EMI calculation failed: %s, continuing without EMI info", emi_error)
+    application_dict = application.as_result_dict(emi_info, submitted_at)
+    
+    # Check approval using rules engine
+    approval_result = check_loan_approval(loan_type, application_dict)
+    if approval_result['approved']:
+        application_dict['status'] = 'approved'
+        application_dict['approval_reason'] = approval_result['reason']
+    else:
+        application_dict['status'] = 'rejected'
+        application_dict['rejection_reason'] = approval_result['reason']
+    
+    return {
+        'application': application,
+        'record': application_dict,
+        'emi_info': emi_info,
+        'reason': approval_result['reason']
+    }, None
+
+
+def _notify_applicant(loan_type, evaluated):
+    """Send the confirmation and status (approved/rejected) email for a saved application."""
+    application = evaluated['application']
+    _dispatch_email(
+        'application',
+        email_service.send_application_result,
+        to_email=application.email,
+        applicant_name=getattr(application, LOAN_CONFIG[loan_type]['name_attr']),
+        application_id=evaluated['record']['application_id'],
+        loan_type=loan_type,
+        loan_amount=application.loan_amount_required,
+        status=evaluated['record']['status'],
+        emi_info=evaluated['emi_info'],
+        approval_reason=evaluated['reason']
+    )
+
+
+def _application_summary(evaluated):
+    """Response fields describing one evaluated application."""
+    return {
+        'application_id': evaluated['record']['application_id'],
+        'emi_info': evaluated['emi_info'],
+        'approval_status': evaluated['record']['status'],
+        'approval_reason': evaluated['reason']
+    }
+
+
+def _handle_application(loan_type):
+    """
+    Run the shared application pipeline for a loan type.
+    
+    Validates the payload, builds the schema object, calculates EMI, applies
+    the approval rules, saves the application and notifies the applicant.
+    """
+    config = LOAN_CONFIG[loan_type]
     try:
         data = request.get_json()
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Validate
-        validator = EducationLoanValidator()
-        is_valid, error_message = validator.validate(data)
-        if not is_valid:
+        evaluated, error_message = _evaluate_application(loan_type, data)
+        if error_message:
             return jsonify({'error': error_message}), 400
-        
-        # Create application object
-        try:
-            application = EducationLoanApplication(**data)
-            application_dict = application.to_dict()
-        except Exception as schema_error:
-            logger.error(f"Error creating application object: {schema_error}")
-            logger.error(traceback.format_exc())
-            return jsonify({'error': f'Invalid application data: {str(schema_error)}'}), 400
-        
-        # Calculate EMI
-        try:
-            emi_info = calculate_emi_for_loan_type(
-                'education',
-                application.loan_amount_required,
-                application.repayment_period,
-                'years'
-            )
-            application_dict['emi_info'] = emi_info
-        except Exception as emi_error:
-            logger.warning(f"EMI calculation failed: {emi_error}, continuing without EMI info")
-            application_dict['emi_info'] = None
-        
-        # Check approval using rules engine
-        approval_result = check_loan_approval('education', application_dict)
-        if approval_result['approved']:
-            application_dict['status'] = 'approved'
-            application_dict['approval_reason'] = approval_result['reason']
-        else:
-            application_dict['status'] = 'rejected'
-            application_dict['rejection_reason'] = approval_result['reason']
+        application_dict = evaluated['record']
         
         # Save application
-        save_result = save_application(application_dict)
-        if save_result:
-            # Send confirmation email
-            try:
-                email_service.send_application_confirmation(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='education',
-                    loan_amount=application.loan_amount_required,
-                    emi_info=emi_info
-                )
-            except Exception as email_error:
-                logger.warning(f"Failed to send confirmation email: {email_error}")
-            
-            # Send status update email (approved/rejected) with reason
-            try:
-                logger.info(f"Sending status update email for application {application_dict['application_id']} - Status: {application_dict['status']}")
-                email_sent = email_service.send_status_update(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='education',
-                    status=application_dict['status'],
-                    approval_reason=approval_result['reason']
-                )
-                if email_sent:
-                    logger.info(f"Status update email sent successfully to {application.email}")
-                else:
-                    logger.warning(f"Status update email failed to send to {application.email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send status update email: {email_error}")
-                logger.error(traceback.format_exc())
-            
+        if not save_application(application_dict):
+            logger.error("Failed to save %s loan application: %s", loan_type, application_dict.get('application_id', 'unknown'))
             return jsonify({
-                'success': True,
-                'message': 'Education loan application submitted successfully',
-                'application_id': application_dict['application_id'],
-                'emi_info': emi_info,
-                'approval_status': application_dict['status'],
-                'approval_reason': approval_result['reason']
-            }), 201
-        else:
-            logger.error(f"Failed to save application: {application_dict.get('application_id', 'unknown')}")
-            return jsonify({
-                'error': 'Failed to save application. Please check server logs for details.',
-                'debug': 'Check if data/applications directory is writable'
+                'error': 'Failed to save application. Please check server logs for details.'
             }), 500
-            
+        
+        _notify_applicant(loan_type, evaluated)
+        
+        return jsonify({
+            'success': True,
+            'message': config['message'],
+            **_application_summary(evaluated)
+        }), 201
+        
     except Exception as e:
-        logger.error(f"Error in education loan application: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in %s loan application: %s", loan_type, e)
         return jsonify({'error': f'Application failed: {str(e)}'}), 500
 
 
-@app.route('/api/apply/home-loan', methods=['POST'])
-def apply_home_loan():
-    """Handle home loan application submission."""
+# Upper bound on applications accepted by a single bulk submission
+APPLICATIONS_BULK_MAX = int(os.environ.get('APPLICATIONS_BULK_MAX', '1000'))
+
+
+@app.route('/api/applications/bulk', methods=['POST'])
+def submit_applications_bulk():
+    """
+    Submit many applications of one loan type in a single request.
+    
+    Expected JSON:
+    {
+        "loan_type": "home",
+        "applications": [{...}, {...}]
+    }
+    
+    Every application is validated first; if any is invalid nothing is
+    saved. Valid batches are written to storage in one write and share
+    one submitted_at timestamp.
+    """
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Validate
-        validator = HomeLoanValidator()
-        is_valid, error_message = validator.validate(data)
-        if not is_valid:
-            return jsonify({'error': error_message}), 400
-        
-        # Create application object
-        try:
-            application = HomeLoanApplication(**data)
-            application_dict = application.to_dict()
-        except Exception as schema_error:
-            logger.error(f"Error creating home loan application object: {schema_error}")
-            logger.error(traceback.format_exc())
-            return jsonify({'error': f'Invalid application data: {str(schema_error)}'}), 400
+        data = request.get_json(silent=True) or {}
+        loan_type = data.get('loan_type')
+        applications = data.get('applications')
+        if loan_type not in LOAN_CONFIG:
+            return jsonify({'error': f'Invalid loan_type. Must be one of: {list(LOAN_CONFIG)}'}), 400
+        if not isinstance(applications, list) or not applications:
+            return jsonify({'error': 'Expected a non-empty "applications" list'}), 400
+        if len(applications) > APPLICATIONS_BULK_MAX:
+            return jsonify({'error': f'At most {APPLICATIONS_BULK_MAX} applications per request'}), 400
+        
+        submitted_at = datetime.now().isoformat()
+        evaluated_list = []
+        for index, application in enumerate(applications):
+            if not isinstance(application, dict) or not application:
+                return jsonify({'error': f'Application {index}: expected an object'}), 400
+            evaluated, error_message = _evaluate_application(loan_type, application, submitted_at)
+            if error_message:
+                return jsonify({'error': f'Application {index}: {error_message}'}), 400
+            evaluated_list.append(evaluated)
+        
+        if not save_applications([evaluated['record'] for evaluated in evaluated_list]):
+            logger.error("Failed to save %d %s loan applications", len(evaluated_list), loan_type)
+            return jsonify({
+                'error': 'Failed to save applications. Please check server logs for details.'
+            }), 500
         
-        # Calculate EMI
-        emi_info = None
-        try:
-            emi_info = calculate_emi_for_loan_type(
-                'home',
-                application.loan_amount_required,
-                application.loan_tenure,
-                'years'
-            )
-            application_dict['emi_info'] = emi_info
-        except Exception as emi_error:
-            logger.warning(f"EMI calculation failed: {emi_error}, continuing without EMI info")
-            application_dict['emi_info'] = None
+        for evaluated in evaluated_list:
+            _notify_applicant(loan_type, evaluated)
         
-        # Check approval using rules engine
-        approval_result = check_loan_approval('home', application_dict)
-        if approval_result['approved']:
-            application_dict['status'] = 'approved'
-            application_dict['approval_reason'] = approval_result['reason']
-        else:
-            application_dict['status'] = 'rejected'
-            application_dict['rejection_reason'] = approval_result['reason']
+        logger.info("Bulk submission saved %d %s loan applications", len(evaluated_list), loan_type)
+        return jsonify({
+            'success': True,
+            'count': len(evaluated_list),
+            'applications': [_application_summary(evaluated) for evaluated in evaluated_list]
+        }), 201
         
-        # Save application
-        save_result = save_application(application_dict)
-        if save_result:
-            # Send confirmation email
-            try:
-                email_service.send_application_confirmation(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='home',
-                    loan_amount=application.loan_amount_required,
-                    emi_info=emi_info
-                )
-            except Exception as email_error:
-                logger.warning(f"Failed to send confirmation email: {email_error}")
-            
-            # Send status update email (approved/rejected) with reason
-            try:
-                logger.info(f"Sending status update email for application {application_dict['application_id']} - Status: {application_dict['status']}")
-                email_sent = email_service.send_status_update(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='home',
-                    status=application_dict['status'],
-                    approval_reason=approval_result['reason']
-                )
-                if email_sent:
-                    logger.info(f"Status update email sent successfully to {application.email}")
-                else:
-                    logger.warning(f"Status update email failed to send to {application.email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send status update email: {email_error}")
-                logger.error(traceback.format_exc())
-            
-            return jsonify({
-                'success': True,
-                'message': 'Home loan application submitted successfully',
-                'application_id': application_dict['application_id'],
-                'emi_info': emi_info if emi_info else None,
-                'approval_status': application_dict['status'],
-                'approval_reason': approval_result['reason']
-            }), 201
-        else:
-            logger.error(f"Failed to save home loan application: {application_dict.get('application_id', 'unknown')}")
-            return jsonify({
-                'error': 'Failed to save application. Please check server logs for details.'
-            }), 500
-            
     except Exception as e:
-        logger.error(f"Error in home loan application: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({'error': f'Application failed: {str(e)}'}), 500
+        logger.exception("Error in bulk application submission: %s", e)
+        return jsonify({'error': f'Bulk submission failed: {str(e)}'}), 500
+
+
+@app.route('/api/apply/education-loan', methods=['POST'])
+def apply_education_loan():
+    """Handle education loan application submission."""
+    return _handle_application('education')
+
+
+@app.route('/api/apply/home-loan', methods=['POST'])
+def apply_home_loan():
+    """Handle home loan application submission."""
+    return _handle_application('home')
 
 
 @app.route('/api/apply/car-loan', methods=['POST'])
 def apply_car_loan():
     """Handle car loan application submission."""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Validate
-        validator = CarLoanValidator()
-        is_valid, error_message = validator.validate(data)
-        if not is_valid:
-            return jsonify({'error': error_message}), 400
-        
-        # Create application object
-        application = CarLoanApplication(**data)
-        application_dict = application.to_dict()
-        
-        # Calculate EMI
-        emi_info = calculate_emi_for_loan_type(
-            'car',
-            application.loan_amount_required,
-            application.loan_tenure,
-            'months'
-        )
-        application_dict['emi_info'] = emi_info
-        
-        # Check approval using rules engine
-        approval_result = check_loan_approval('car', application_dict)
-        if approval_result['approved']:
-            application_dict['status'] = 'approved'
-            application_dict['approval_reason'] = approval_result['reason']
-        else:
-            application_dict['status'] = 'rejected'
-            application_dict['rejection_reason'] = approval_result['reason']
-        
-        # Save application
-        if save_application(application_dict):
-            # Send confirmation email
-            try:
-                email_service.send_application_confirmation(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='car',
-                    loan_amount=application.loan_amount_required,
-                    emi_info=emi_info
-                )
-            except Exception as email_error:
-                logger.warning(f"Failed to send confirmation email: {email_error}")
-            
-            # Send status update email (approved/rejected) with reason
-            try:
-                logger.info(f"Sending status update email for application {application_dict['application_id']} - Status: {application_dict['status']}")
-                email_sent = email_service.send_status_update(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='car',
-                    status=application_dict['status'],
-                    approval_reason=approval_result['reason']
-                )
-                if email_sent:
-                    logger.info(f"Status update email sent successfully to {application.email}")
-                else:
-                    logger.warning(f"Status update email failed to send to {application.email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send status update email: {email_error}")
-                logger.error(traceback.format_exc())
-            
-            return jsonify({
-                'success': True,
-                'message': 'Car loan application submitted successfully',
-                'application_id': application_dict['application_id'],
-                'emi_info': emi_info,
-                'approval_status': application_dict['status'],
-                'approval_reason': approval_result['reason']
-            }), 201
-        else:
-            return jsonify({'error': 'Failed to save application'}), 500
-            
-    except Exception as e:
-        logger.error(f"Error in car loan application: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({'error': f'Application failed: {str(e)}'}), 500
+    return _handle_application('car')
 
 
 @app.route('/api/apply/personal-loan', methods=['POST'])
 def apply_personal_loan():
     """Handle personal loan application submission."""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Validate
-        validator = PersonalLoanValidator()
-        is_valid, error_message = validator.validate(data)
-        if not is_valid:
-            return jsonify({'error': error_message}), 400
-        
-        # Create application object
-        application = PersonalLoanApplication(**data)
-        application_dict = application.to_dict()
-        
-        # Calculate EMI
-        emi_info = calculate_emi_for_loan_type(
-            'personal',
-            application.loan_amount_required,
-            application.loan_tenure,
-            'months'
-        )
-        application_dict['emi_info'] = emi_info
-        
-        # Check approval using rules engine
-        approval_result = check_loan_approval('personal', application_dict)
-        if approval_result['approved']:
-            application_dict['status'] = 'approved'
-            application_dict['approval_reason'] = approval_result['reason']
-        else:
-            application_dict['status'] = 'rejected'
-            application_dict['rejection_reason'] = approval_result['reason']
-        
-        # Save application
-        if save_application(application_dict):
-            # Send confirmation email
-            try:
-                email_service.send_application_confirmation(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='personal',
-                    loan_amount=application.loan_amount_required,
-                    emi_info=emi_info
-                )
-            except Exception as email_error:
-                logger.warning(f"Failed to send confirmation email: {email_error}")
-            
-            # Send status update email (approved/rejected) with reason
-            try:
-                logger.info(f"Sending status update email for application {application_dict['application_id']} - Status: {application_dict['status']}")
-                email_sent = email_service.send_status_update(
-                    to_email=application.email,
-                    applicant_name=application.full_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='personal',
-                    status=application_dict['status'],
-                    approval_reason=approval_result['reason']
-                )
-                if email_sent:
-                    logger.info(f"Status update email sent successfully to {application.email}")
-                else:
-                    logger.warning(f"Status update email failed to send to {application.email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send status update email: {email_error}")
-                logger.error(traceback.format_exc())
-            
-            return jsonify({
-                'success': True,
-                'message': 'Personal loan application submitted successfully',
-                'application_id': application_dict['application_id'],
-                'emi_info': emi_info,
-                'approval_status': application_dict['status'],
-                'approval_reason': approval_result['reason']
-            }), 201
-        else:
-            return jsonify({'error': 'Failed to save application'}), 500
-            
-    except Exception as e:
-        logger.error(f"Error in personal loan application: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({'error': f'Application failed: {str(e)}'}), 500
+    return _handle_application('personal')
 
 
 @app.route('/api/apply/business-loan', methods=['POST'])
 def apply_business_loan():
     """Handle business loan application submission."""
+    return _handle_application('business')
+
+
+# Default and maximum page sizes for paged /api/applications requests
+APPLICATIONS_PAGE_SIZE = 50
+APPLICATIONS_PAGE_MAX = int(os.environ.get('APPLICATIONS_PAGE_MAX', '500'))
+
+
+def _stream_applications_page(loan_type):
+    """
+    Stream one page of applications as NDJSON, newest first.
+    
+    The cursor for the next page is returned in the X-Next-Cursor header
+    and is absent on the last page. A cursor naming no stored application
+    (e.g. one deleted between pages) is rejected with 400.
+    """
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Validate
-        validator = BusinessLoanValidator()
-        is_valid, error_message = validator.validate(data)
-        if not is_valid:
-            return jsonify({'error': error_message}), 400
-        
-        # Create application object
-        application = BusinessLoanApplication(**data)
-        application_dict = application.to_dict()
-        
-        # Calculate EMI
-        emi_info = calculate_emi_for_loan_type(
-            'business',
-            application.loan_amount_required,
-            application.loan_tenure,
-            'years'
-        )
-        application_dict['emi_info'] = emi_info
-        
-        # Check approval using rules engine
-        approval_result = check_loan_approval('business', application_dict)
-        if approval_result['approved']:
-            application_dict['status'] = 'approved'
-            application_dict['approval_reason'] = approval_result['reason']
-        else:
-            application_dict['status'] = 'rejected'
-            application_dict['rejection_reason'] = approval_result['reason']
-        
-        # Save application
-        if save_application(application_dict):
-            # Send confirmation email
-            try:
-                email_service.send_application_confirmation(
-                    to_email=application.email,
-                    applicant_name=application.owner_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='business',
-                    loan_amount=application.loan_amount_required,
-                    emi_info=emi_info
-                )
-            except Exception as email_error:
-                logger.warning(f"Failed to send confirmation email: {email_error}")
-            
-            # Send status update email (approved/rejected) with reason
-            try:
-                logger.info(f"Sending status update email for application {application_dict['application_id']} - Status: {application_dict['status']}")
-                email_sent = email_service.send_status_update(
-                    to_email=application.email,
-                    applicant_name=application.owner_name,
-                    application_id=application_dict['application_id'],
-                    loan_type='business',
-                    status=application_dict['status'],
-                    approval_reason=approval_result['reason']
-                )
-                if email_sent:
-                    logger.info(f"Status update email sent successfully to {application.email}")
-                else:
-                    logger.warning(f"Status update email failed to send to {application.email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send status update email: {email_error}")
-                logger.error(traceback.format_exc())
-            
-            return jsonify({
-                'success': True,
-                'message': 'Business loan application submitted successfully',
-                'application_id': application_dict['application_id'],
-                'emi_info': emi_info,
-                'approval_status': application_dict['status'],
-                'approval_reason': approval_result['reason']
-            }), 201
-        else:
-            return jsonify({'error': 'Failed to save application'}), 500
-            
-    except Exception as e:
-        logger.error(f"Error in business loan application: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({'error': f'Application failed: {str(e)}'}), 500
+        limit = int(request.args.get('limit', APPLICATIONS_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    if not 1 <= limit <= APPLICATIONS_PAGE_MAX:
+        return jsonify({'error': f'limit must be between 1 and {APPLICATIONS_PAGE_MAX}'}), 400
+    
+    page = get_applications_page(request.args.get('after'), limit, loan_type)
+    if page is None:
+        # Returning an empty page would look like the end of the list
+        return jsonify({'error': 'Unknown cursor: no application with that ID'}), 400
+    
+    def generate():
+        for application in page:
+            yield app.json.dumps(application) + '\n'
+    
+    response = Response(generate(), mimetype='application/x-ndjson')
+    if len(page) == limit:
+        response.headers['X-Next-Cursor'] = page[-1].get('application_id', '')
+    return response
 
 
 @app.route('/api/applications', methods=['GET'])
 def get_applications():
-    """Get all applications (admin endpoint)."""
+    """
+    Get applications (admin endpoint).
+    
+    Without paging parameters all applications are returned in one JSON
+    document. With ?limit=<n> and/or ?after=<application_id> a single page
+    is streamed as NDJSON instead.
+    """
     try:
         loan_type = request.args.get('type')
         
+        if 'limit' in request.args or 'after' in request.args:
+            return _stream_applications_page(loan_type)
+        
         if loan_type:
             applications = get_applications_by_type(loan_type)
         else:
@@ -681,7 +672,7 @@ def get_applications():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting applications: {str(e)}")
+        logger.error("Error getting applications: %s", e)
         return jsonify({'error': f'Failed to get applications: {str(e)}'}), 500
 
 
@@ -700,7 +691,7 @@ def get_application(application_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting application: {str(e)}")
+        logger.error("Error getting application: %s", e)
         return jsonify({'error': f'Failed to get application: {str(e)}'}), 500
 
 
@@ -728,23 +719,19 @@ def update_status(application_id):
         if not success:
             return jsonify({'error': 'Failed to update application status'}), 500
         
-        # Send status update email
-        try:
-            applicant_email = application.get('email')
-            applicant_name = application.get('full_name') or application.get('owner_name', 'Applicant')
-            loan_type = application.get('loan_type', 'loan')
-            
-            if applicant_email:
-                email_service.send_status_update(
-                    to_email=applicant_email,
-                    applicant_name=applicant_name,
-                    application_id=application_id,
-                    loan_type=loan_type,
-                    status=status,
-                    remarks=remarks
-                )
-        except Exception as email_error:
-            logger.warning(f"Failed to send status update email: {email_error}")
+        # Send status update email in the background
+        applicant_email = application.get('email')
+        if applicant_email:
+            _dispatch_email(
+                'status update',
+                email_service.send_status_update,
+                to_email=applicant_email,
+                applicant_name=application.get('full_name') or application.get('owner_name', 'Applicant'),
+                application_id=application_id,
+                loan_type=application.get('loan_type', 'loan'),
+                status=status,
+                remarks=remarks
+            )
         
         return jsonify({
             'success': True,
@@ -754,8 +741,7 @@ def update_status(application_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error updating application status: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error updating application status: %s", e)
         return jsonify({'error': f'Failed to update status: {str(e)}'}), 500
 
 
@@ -773,7 +759,7 @@ def delete_application_endpoint(application_id):
         if not success:
             return jsonify({'error': 'Failed to delete application'}), 500
         
-        logger.info(f"Application deleted: {application_id}")
+        logger.info("Application deleted: %s", application_id)
         return jsonify({
             'success': True,
             'message': 'Application deleted successfully',
@@ -781,8 +767,7 @@ def delete_application_endpoint(application_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error deleting application: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error deleting application: %s", e)
         return jsonify({'error': f'Failed to delete application: {str(e)}'}), 500
 
 
@@ -794,14 +779,20 @@ def get_loan_type_details(loan_type):
         if not details:
             return jsonify({'error': 'Invalid loan type'}), 404
         
-        return jsonify({
-            'success': True,
-            'loan_type': loan_type,
-            'details': details
-        }), 200
+        def payload():
+            return {
+                'success': True,
+                'loan_type': loan_type,
+                'details': details
+            }
+        
+        # The response echoes loan_type, so only cache the canonical spelling
+        if loan_type != loan_type.lower():
+            return jsonify(payload()), 200
+        return _cached_json_response(f'loan-details:{loan_type}', payload), 200
         
     except Exception as e:
-        logger.error(f"Error getting loan details: {str(e)}")
+        logger.error("Error getting loan details: %s", e)
         return jsonify({'error': f'Failed to get loan details: {str(e)}'}), 500
 
 
@@ -829,10 +820,47 @@ def calculate_emi_endpoint():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error calculating EMI: {str(e)}")
+        logger.error("Error calculating EMI: %s", e)
         return jsonify({'error': f'Failed to calculate EMI: {str(e)}'}), 500
 
 
+def _score_predictions(records):
+    """Score a batch of sanitized applications; returns (prediction, probability) per record."""
+    X_processed = preprocessor.preprocess_batch(records)
+    if forest_scorer is not None:
+        # Random forests are walked by the compiled scorer instead of sklearn
+        predictions, positive = forest_scorer.predict(X_processed)
+    else:
+        # One pass over the model: the predicted class is the most probable one,
+        # which is what predict() would compute with a second traversal
+        probabilities = model.predict_proba(X_processed)
+        predictions = model.classes_[probabilities.argmax(axis=1)]
+        positive = probabilities[:, 1] if probabilities.shape[1] > 1 else probabilities[:, 0]
+    return [(int(p), float(prob)) for p, prob in zip(predictions, positive)]
+
+
+# Concurrent /api/predict calls are coalesced into one model call. Raising
+# PREDICT_BATCH_WAIT_MS (e.g. to 5-10) trades a little single-request latency
+# for larger batches under heavy load.
+PREDICTION_SCORER = BatchScorer(
+    _score_predictions,
+    max_batch=int(os.environ.get('PREDICT_BATCH_SIZE', '16')),
+    max_wait_ms=float(os.environ.get('PREDICT_BATCH_WAIT_MS', '0'))
+)
+
+# Upper bound on applications accepted by a single bulk prediction request
+PREDICT_BULK_MAX = int(os.environ.get('PREDICT_BULK_MAX', '1000'))
+
+
+def _prediction_result(prediction_int, probability):
+    """Format a scored application for the API response."""
+    return {
+        'prediction': 'Approved' if prediction_int == 1 else 'Rejected',
+        'probability': round(probability * 100, 2),
+        'status': 'approved' if prediction_int == 1 else 'rejected'
+    }
+
+
 @app.route('/api/predict', methods=['POST'])
 def predict():
     """
@@ -854,7 +882,7 @@ def predict():
     }
     """
     try:
-        if model is None or preprocessor is None:
+        if not _ensure_model_loaded():
             return jsonify({
                 'error': 'Model not loaded. Please ensure model is trained and available.'
             }), 500
@@ -864,79 +892,93 @@ def predict():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Sanitize input
-        validator = LoanApplicationValidator()
-        sanitized_data = validator.sanitize_input(data)
-        
-        # Validate input
-        is_valid, error_message = validator.validate_application(sanitized_data)
-        if not is_valid:
+        # Sanitize and validate input in one pass
+        sanitized_data, error_message = PREDICT_VALIDATOR.parse_application(data)
+        if error_message:
             return jsonify({'error': error_message}), 400
         
-        # Predict
-        if model_trainer:
-            prediction, probability, feature_importance = model_trainer.predict(sanitized_data)
-        else:
-            # Direct prediction using loaded model
-            X_processed = preprocessor.preprocess_single(sanitized_data)
-            prediction_proba = model.predict_proba(X_processed)[0]
-            prediction_int = model.predict(X_processed)[0]
-            prediction = 'Approved' if prediction_int == 1 else 'Rejected'
-            probability = float(prediction_proba[1] if len(prediction_proba) > 1 else prediction_proba[0])
-            
-            # Get feature importance if available
-            feature_importance = {}
-            if hasattr(model, 'feature_importances_'):
-                importances = model.feature_importances_
-                feature_names = model_info.get('feature_names', [])
-                feature_importance = dict(zip(feature_names, importances))
-                feature_importance = dict(sorted(feature_importance.items(), key=lambda x: x[1], reverse=True))
+        # Predict (concurrent requests are scored together in one batch)
+        prediction_int, probability = PREDICTION_SCORER.score(sanitized_data)
         
-        # Prepare response
-        response = {
-            'prediction': prediction,
-            'probability': round(probability * 100, 2),
-            'status': 'approved' if prediction == 'Approved' else 'rejected',
-            'feature_importance': {k: float(v) for k, v in list(feature_importance.items())[:5]}  # Top 5 features
-        }
+        response = _prediction_result(prediction_int, probability)
+        response['feature_importance'] = model_info.get('top_feature_importance', {})
         
-        logger.info(f"Prediction made: {prediction} (probability: {probability:.2%})")
+        logger.info("Prediction made: %s (probability: %.2f%%)", response['prediction'], probability * 100)
         return jsonify(response), 200
         
     except Exception as e:
-        logger.error(f"Error in prediction: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in prediction: %s", e)
         return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
 
 
+@app.route('/api/predict/bulk', methods=['POST'])
+def predict_bulk():
+    """
+    Predict loan approval for many applications in one call.
+    
+    Expected JSON:
+    {
+        "applications": [{...}, {...}]
+    }
+    
+    Each application has the same fields as /api/predict. All applications
+    are preprocessed and scored together in a single model call.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        applications = data.get('applications')
+        if not isinstance(applications, list) or not applications:
+            return jsonify({'error': 'Expected a non-empty "applications" list'}), 400
+        if len(applications) > PREDICT_BULK_MAX:
+            return jsonify({'error': f'At most {PREDICT_BULK_MAX} applications per request'}), 400
+        
+        records = []
+        for index, application in enumerate(applications):
+            if not isinstance(application, dict):
+                return jsonify({'error': f'Application {index}: expected an object'}), 400
+            sanitized_data, error_message = PREDICT_VALIDATOR.parse_application(application)
+            if error_message:
+                return jsonify({'error': f'Application {index}: {error_message}'}), 400
+            records.append(sanitized_data)
+        
+        if not _ensure_model_loaded():
+            return jsonify({
+                'error': 'Model not loaded. Please ensure model is trained and available.'
+            }), 500
+        
+        results = [_prediction_result(p, prob) for p, prob in _score_predictions(records)]
+        
+        logger.info("Bulk prediction made for %d applications", len(results))
+        return jsonify({
+            'predictions': results,
+            'count': len(results),
+            'feature_importance': model_info.get('top_feature_importance', {})
+        }), 200
+        
+    except Exception as e:
+        logger.exception("Error in bulk prediction: %s", e)
+        return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
+
+
+def _model_performance():
+    """Build the model performance payload from model_info."""
+    return {
+        'best_model': model_info.get('best_model_name'),
+        'models': model_info.get('metrics_rounded', {})
+    }
+
+
 @app.route('/api/model/performance', methods=['GET'])
 def get_model_performance():
     """Get model performance metrics."""
     try:
-        if model_info is None:
+        if not _ensure_model_loaded() or model_info is None:
             return jsonify({'error': 'Model info not available'}), 404
         
-        # Get metrics for all models
-        all_metrics = {}
-        for model_name, metrics in model_info.get('metrics', {}).items():
-            all_metrics[model_name] = {
-                'accuracy': round(metrics['accuracy'], 4),
-                'precision': round(metrics['precision'], 4),
-                'recall': round(metrics['recall'], 4),
-                'f1_score': round(metrics['f1_score'], 4),
-                'roc_auc': round(metrics.get('roc_auc', 0), 4),
-                'confusion_matrix': metrics['confusion_matrix']
-            }
-        
-        response = {
-            'best_model': model_info.get('best_model_name'),
-            'models': all_metrics
-        }
-        
-        return jsonify(response), 200
+        return _cached_json_response('model-performance', _model_performance), 200
         
     except Exception as e:
-        logger.error(f"Error getting model performance: {str(e)}")
+        logger.error("Error getting model performance: %s", e)
         return jsonify({'error': f'Failed to get performance metrics: {str(e)}'}), 500
 
 
@@ -944,31 +986,17 @@ def get_model_performance():
 def get_model_info():
     """Get model information and feature importance."""
     try:
-        if model is None or model_info is None:
+        if not _ensure_model_loaded() or model_info is None:
             return jsonify({'error': 'Model not loaded'}), 404
         
-        # Get feature importance
-        feature_importance = {}
-        if hasattr(model, 'feature_importances_'):
-            importances = model.feature_importances_
-            feature_names = model_info.get('feature_names', [])
-            feature_importance = {
-                name: float(importance) 
-                for name, importance in zip(feature_names, importances)
-            }
-            # Sort by importance
-            feature_importance = dict(sorted(feature_importance.items(), key=lambda x: x[1], reverse=True))
-        
-        response = {
+        return _cached_json_response('model-info', lambda: {
             'model_name': model_info.get('best_model_name'),
-            'feature_importance': feature_importance,
+            'feature_importance': model_info.get('sorted_feature_importance', {}),
             'feature_count': len(model_info.get('feature_names', []))
-        }
-        
-        return jsonify(response), 200
+        }), 200
         
     except Exception as e:
-        logger.error(f"Error getting model info: {str(e)}")
+        logger.error("Error getting model info: %s", e)
         return jsonify({'error': f'Failed to get model info: {str(e)}'}), 500
 
 
@@ -977,7 +1005,8 @@ def health_check():
     """Health check endpoint."""
     try:
         model_status = 'loaded' if model is not None else 'not_loaded'
-        return jsonify({
+        # Liveness probes poll this; the body only changes with the model status
+        return _cached_json_response(f'health:{model_status}', lambda: {
             'status': 'healthy',
             'model_status': model_status,
             'service': 'Loan Approval Prediction System'
@@ -995,33 +1024,34 @@ def not_found(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    import traceback
-    error_details = traceback.format_exc()
-    logger.error(f"Internal server error: {error}")
-    logger.error(error_details)
+    logger.error("Internal server error: %s", error, exc_info=True)
     
     # In debug mode, return more details
     if app.debug:
         return jsonify({
             'error': 'Internal server error',
             'details': str(error),
-            'traceback': error_details
+            'traceback': traceback.format_exc()
         }), 500
     else:
         return jsonify({'error': 'Internal server error. Please check server logs for details.'}), 500
 
 
+if WARMUP_ON_START:
+    load_model()
+
+
 if __name__ == '__main__':
     # Load model on startup (optional for ML prediction feature)
     logger.info("Starting Multi-Loan Application System...")
     try:
         load_model()  # Try to load model, but don't fail if it doesn't exist
     except Exception as e:
-        logger.warning(f"ML model not loaded: {e}. System will continue without prediction feature.")
+        logger.warning("ML model not loaded: %s. System will continue without prediction feature.", e)
     
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'  # Default to True for better error messages
     app.config['DEBUG'] = debug
-    logger.info(f"Starting server on port {port} (debug={debug})")
+    logger.info("Starting server on port %s (debug=%s)", port, debug)
     app.run(host='0.0.0.0', port=port, debug=debug)
 
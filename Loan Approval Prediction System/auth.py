@@ -5,7 +5,6 @@ Handles user registration, login, logout, and account management.
 
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 import logging
 
@@ -33,11 +32,16 @@ def login():
         user = User.query.filter_by(email=email).first()
         
         # Check if user exists and password is correct
-        if not user or not check_password_hash(user.password_hash, password):
+        if not user or not user.check_password(password):
             flash('Please check your login details and try again.', 'danger')
             logger.warning(f'Failed login attempt for email: {email}')
             return redirect(url_for('auth.login'))
         
+        # Move legacy hashes to the current scheme now that we have the plaintext
+        if user.password_needs_rehash():
+            user.set_password(password)
+            db.session.commit()
+        
         # Log the user in
         login_user(user, remember=remember)
         logger.info(f'User {user.email} logged in successfully')
@@ -71,9 +75,9 @@ def signup():
         new_user = User(
             email=email,
             name=name,
-            password_hash=generate_password_hash(password, method='sha256'),
             role='applicant'  # Default role
         )
+        new_user.set_password(password)
         
         # Add the new user to the database
         db.session.add(new_user)
@@ -109,7 +113,7 @@ def change_password():
         confirm_password = request.form.get('confirm_password')
         
         # Verify current password
-        if not check_password_hash(current_user.password_hash, current_password):
+        if not current_user.check_password(current_password):
             flash('Current password is incorrect', 'danger')
             return redirect(url_for('auth.change_password'))
         
@@ -119,7 +123,7 @@ def change_password():
             return redirect(url_for('auth.change_password'))
         
         # Update password
-        current_user.password_hash = generate_password_hash(new_password, method='sha256')
+        current_user.set_password(new_password)
         db.session.commit()
         
         flash('Password updated successfully!', 'success')
@@ -1,7 +1,7 @@
 from datetime import datetime
 from app import db, login_manager
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from utils import passwords
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -17,20 +17,29 @@ class User(UserMixin, db.Model):
     applications = db.relationship('LoanApplication', backref='applicant', lazy=True)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = passwords.hash_password(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return passwords.check_password(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        # Legacy werkzeug and plain bcrypt hashes are upgraded on login
+        return passwords.needs_rehash(self.password_hash)
 
 class LoanApplication(db.Model):
+    # Admin and per-user listings filter by owner and status
+    __table_args__ = (
+        db.Index('ix_loanapp_user_status', 'user_id', 'status'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     loan_type = db.Column(db.String(50), nullable=False)  # education, home, car, personal, business
     amount = db.Column(db.Float, nullable=False)
     term = db.Column(db.Integer, nullable=False)  # in months
     purpose = db.Column(db.Text)
-    status = db.Column(db.String(20), default='pending')  # pending, approved, rejected, processing
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    status = db.Column(db.String(20), default='pending', index=True)  # pending, approved, rejected, processing
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Applicant details
@@ -50,17 +59,36 @@ class LoanApplication(db.Model):
     processed_by = db.Column(db.Integer, db.ForeignKey('user.id'))
     processed_at = db.Column(db.DateTime)
     
+    # Columns exposed by to_dict() and the list views
+    LIST_COLUMNS = (
+        'id', 'loan_type', 'amount', 'term', 'status', 'created_at',
+        'applicant_name', 'applicant_email', 'phone_number'
+    )
+
     def to_dict(self):
+        return self.row_to_dict(self)
+
+    @classmethod
+    def list_projection(cls):
+        """
+        Query only the columns used by list views, so rows come back as plain
+        tuples without loading additional_data, admin_notes or other wide columns.
+        """
+        return cls.query.with_entities(*(getattr(cls, name) for name in cls.LIST_COLUMNS))
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a model instance or a list_projection() row."""
         return {
-            'id': self.id,
-            'loan_type': self.loan_type,
-            'amount': self.amount,
-            'term': self.term,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'applicant_name': self.applicant_name,
-            'applicant_email': self.applicant_email,
-            'phone_number': self.phone_number
+            'id': row.id,
+            'loan_type': row.loan_type,
+            'amount': row.amount,
+            'term': row.term,
+            'status': row.status,
+            'created_at': row.created_at.isoformat() if row.created_at else None,
+            'applicant_name': row.applicant_name,
+            'applicant_email': row.applicant_email,
+            'phone_number': row.phone_number
         }
 
     def __repr__(self):
@@ -4,8 +4,13 @@ Machine Learning model training and prediction for loan approval.
 
 import pandas as pd
 import numpy as np
+import copy
 import logging
+import os
+import pickle
+import tempfile
 import joblib
+from joblib import Parallel, delayed
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from sklearn.model_selection import train_test_split
@@ -24,8 +29,85 @@ from models.preprocessor import LoanPreprocessor, handle_missing_values
 from utils.data_loader import load_dataset, split_features_target
 
 logging.basicConfig(level=logging.INFO)
+try:
+    import lz4  # noqa: F401  (enables joblib's 'lz4' compressor)
+    ARCHIVE_COMPRESS = ('lz4', 3)
+except ImportError:
+    ARCHIVE_COMPRESS = ('zlib', 3)  # lz4 not installed, fall back to zlib
+
 logger = logging.getLogger(__name__)
 
+# Number of candidate models fitted by LoanModelTrainer.train_models
+N_MODELS = 4
+
+# Single-file archive holding the best model, preprocessor and model info
+BUNDLE_FILE = 'bundle.joblib'
+
+# Preprocessed training matrices at least this large are spilled to a .npy
+# file and memory-mapped, so only the pages in use stay resident
+TRAIN_MMAP_MIN_BYTES = int(os.environ.get('TRAIN_MMAP_MIN_BYTES', str(64 * 1024 * 1024)))
+
+# Fitted attributes only used for training diagnostics, not for predict
+TRAINING_ONLY_ATTRIBUTES = ('oob_score_', 'oob_decision_function_', 'oob_prediction_')
+
+
+def _archive_copy(model):
+    """
+    The model as it is saved: a shallow copy when anything is changed for
+    the archive, so saving leaves the trainer's fitted models untouched.
+    """
+    if isinstance(model, LogisticRegression):
+        # Linear model weights don't need float64 precision; float32 halves
+        # their size and matches the float32 features from the preprocessor.
+        # Tree ensembles already store their split thresholds as float32.
+        model = copy.copy(model)
+        model.coef_ = model.coef_.astype(np.float32)
+        model.intercept_ = model.intercept_.astype(np.float32)
+    return model
+
+
+def _without_training_attributes(model):
+    """model without TRAINING_ONLY_ATTRIBUTES, as a shallow copy if it has any."""
+    present = [attr for attr in TRAINING_ONLY_ATTRIBUTES if hasattr(model, attr)]
+    if present:
+        model = copy.copy(model)
+        for attr in present:
+            delattr(model, attr)
+    return model
+
+
+def _memmap_array(array: np.ndarray, directory: str, name: str) -> np.ndarray:
+    """Write array to directory/name.npy and reopen it as a read-only memory map."""
+    path = Path(directory) / f'{name}.npy'
+    np.save(path, array)
+    return np.load(path, mmap_mode='r')
+
+
+def _fit_and_score(name: str, model, X_train, y_train, X_test, y_test) -> Tuple[str, object, Dict]:
+    """
+    Fit one model and evaluate it on the test split.
+    
+    Returns:
+        Tuple of (name, fitted model, metrics)
+    """
+    logger.info(f"Training {name}...")
+    model.fit(X_train, y_train)
+    
+    # Evaluate model
+    y_pred = model.predict(X_test)
+    y_pred_proba = model.predict_proba(X_test)[:, 1]
+    
+    metrics = {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'precision': precision_score(y_test, y_pred, zero_division=0),
+        'recall': recall_score(y_test, y_pred, zero_division=0),
+        'f1_score': f1_score(y_test, y_pred, zero_division=0),
+        'roc_auc': roc_auc_score(y_test, y_pred_proba) if len(np.unique(y_test)) > 1 else 0.0,
+        'confusion_matrix': confusion_matrix(y_test, y_pred).tolist(),
+        'classification_report': classification_report(y_test, y_pred, output_dict=True)
+    }
+    return name, model, metrics
+
 
 class LoanModelTrainer:
     """Trainer for loan approval prediction models."""
@@ -38,20 +120,28 @@ class LoanModelTrainer:
         self.model_metrics = {}
         self.feature_names = None
         
-    def train_models(self, dataset_path: str, test_size: float = 0.2, random_state: int = 42) -> Dict:
+    def train_models(self, dataset_path: str, test_size: float = 0.2, random_state: int = 42,
+                     n_jobs: Optional[int] = None, encoding: str = 'label') -> Dict:
         """
         Train multiple ML models on the loan dataset.
         
+        The models are independent, so they are fitted concurrently in
+        separate processes.
+        
         Args:
             dataset_path: Path to the training dataset CSV
             test_size: Proportion of data for testing
             random_state: Random seed for reproducibility
+            n_jobs: Number of models trained at once (default: one per CPU core,
+                up to one per model; 1 trains sequentially in-process)
+            encoding: Categorical encoding, 'label' or 'onehot' (sparse)
             
         Returns:
             Dictionary with model performance metrics
         """
         logger.info("Loading dataset...")
-        df = load_dataset(dataset_path)
+        # Loan_ID is dropped from the features anyway, so it isn't parsed
+        df = load_dataset(dataset_path, exclude_columns=['Loan_ID'])
         
         # Handle missing values
         df = handle_missing_values(df)
@@ -71,38 +161,38 @@ class LoanModelTrainer:
         logger.info(f"Training set: {len(X_train)} samples, Test set: {len(X_test)} samples")
         
         # Initialize preprocessor
-        self.preprocessor = LoanPreprocessor()
+        self.preprocessor = LoanPreprocessor(encoding=encoding)
         X_train_processed = self.preprocessor.fit_transform(X_train)
         X_test_processed = self.preprocessor.transform(X_test)
         
-        # Define models
+        # Train up to one model per core. Forest/boosting threads are capped
+        # so the concurrently trained models don't oversubscribe the CPU.
+        cpu_count = os.cpu_count() or 1
+        n_jobs = n_jobs or min(N_MODELS, cpu_count)
+        model_threads = max(1, cpu_count // n_jobs)
         models_config = {
             'Logistic Regression': LogisticRegression(random_state=random_state, max_iter=1000),
-            'Random Forest': RandomForestClassifier(n_estimators=100, random_state=random_state, n_jobs=-1),
-            'XGBoost': XGBClassifier(random_state=random_state, eval_metric='logloss'),
+            'Random Forest': RandomForestClassifier(n_estimators=100, random_state=random_state, n_jobs=model_threads),
+            'XGBoost': XGBClassifier(random_state=random_state, eval_metric='logloss', n_jobs=model_threads),
             'SVM': SVC(probability=True, random_state=random_state)
         }
         
-        # Train each model
-        for name, model in models_config.items():
-            logger.info(f"Training {name}...")
-            model.fit(X_train_processed, y_train)
-            self.models[name] = model
-            
-            # Evaluate model
-            y_pred = model.predict(X_test_processed)
-            y_pred_proba = model.predict_proba(X_test_processed)[:, 1]
-            
-            metrics = {
-                'accuracy': accuracy_score(y_test, y_pred),
-                'precision': precision_score(y_test, y_pred, zero_division=0),
-                'recall': recall_score(y_test, y_pred, zero_division=0),
-                'f1_score': f1_score(y_test, y_pred, zero_division=0),
-                'roc_auc': roc_auc_score(y_test, y_pred_proba) if len(np.unique(y_test)) > 1 else 0.0,
-                'confusion_matrix': confusion_matrix(y_test, y_pred).tolist(),
-                'classification_report': classification_report(y_test, y_pred, output_dict=True)
-            }
+        with tempfile.TemporaryDirectory(prefix='loan_train_', ignore_cleanup_errors=True) as mmap_dir:
+            # Large dense matrices are trained from a memory map; the loky
+            # workers then share its pages instead of each receiving a copy
+            if isinstance(X_train_processed, np.ndarray) and X_train_processed.nbytes >= TRAIN_MMAP_MIN_BYTES:
+                logger.info(f"Memory-mapping {X_train_processed.nbytes / 1e6:.0f} MB training matrix")
+                X_train_processed = _memmap_array(X_train_processed, mmap_dir, 'X_train')
+                X_test_processed = _memmap_array(X_test_processed, mmap_dir, 'X_test')
             
+            # Train and evaluate the models in parallel (results keep config order)
+            results = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_fit_and_score)(name, model, X_train_processed, y_train, X_test_processed, y_test)
+                for name, model in models_config.items()
+            )
+        
+        for name, model, metrics in results:
+            self.models[name] = model
             self.model_metrics[name] = metrics
             logger.info(f"{name} - Accuracy: {metrics['accuracy']:.4f}, F1: {metrics['f1_score']:.4f}")
         
@@ -131,20 +221,15 @@ class LoanModelTrainer:
         if self.best_model is None or self.preprocessor is None:
             raise ValueError("Model not trained. Call train_models() first.")
         
-        # Preprocess input
+        # Preprocess input (encoded straight from the dict, no DataFrame)
         X_processed = self.preprocessor.preprocess_single(data)
         
-        # Predict
+        # Predict in one pass: the predicted class is the most probable one
         prediction_proba = self.best_model.predict_proba(X_processed)[0]
-        prediction = self.best_model.predict(X_processed)[0]
+        prediction = self.best_model.classes_[prediction_proba.argmax()]
         
         # Get feature importance if available
-        feature_importance = {}
-        if hasattr(self.best_model, 'feature_importances_'):
-            importances = self.best_model.feature_importances_
-            feature_importance = dict(zip(self.feature_names, importances))
-            # Sort by importance
-            feature_importance = dict(sorted(feature_importance.items(), key=lambda x: x[1], reverse=True))
+        feature_importance = self.get_feature_importance()
         
         # Convert prediction
         prediction_label = 'Approved' if prediction == 1 else 'Rejected'
@@ -157,56 +242,100 @@ class LoanModelTrainer:
         if self.best_model is None:
             raise ValueError("Model not trained.")
         
-        if not hasattr(self.best_model, 'feature_importances_'):
-            return {}
+        # Ranked once per best model; retraining replaces best_model
+        cached = getattr(self, '_feature_importance_cache', None)
+        if cached is not None and cached[0] is self.best_model:
+            return cached[1]
         
-        importances = self.best_model.feature_importances_
-        feature_importance = dict(zip(self.feature_names, importances))
-        return dict(sorted(feature_importance.items(), key=lambda x: x[1], reverse=True))
+        feature_importance = {}
+        if hasattr(self.best_model, 'feature_importances_'):
+            importances = self.best_model.feature_importances_
+            feature_names = self.preprocessor.get_feature_names_out()
+            # Stable descending sort: ties keep feature order, like sorted()
+            order = np.argsort(-importances, kind='stable')
+            feature_importance = {feature_names[i]: float(importances[i]) for i in order}
+        self._feature_importance_cache = (self.best_model, feature_importance)
+        return feature_importance
     
-    def save_models(self, directory: str = 'models/trained_models') -> None:
-        """Save all trained models and preprocessor."""
+    def save_models(self, directory: str = 'models/trained_models', save_all: bool = False) -> None:
+        """
+        Save the best model, preprocessor and model info.
+        
+        Everything needed to serve predictions goes into one uncompressed
+        bundle.joblib archive, so loading is a single sequential read that
+        can still be memory-mapped.
+        
+        Args:
+            directory: Output directory
+            save_all: Also write every candidate model to its own archive
+                (only BUNDLE_FILE is needed to serve predictions)
+        """
         Path(directory).mkdir(parents=True, exist_ok=True)
         
-        # Save preprocessor
-        preprocessor_path = Path(directory) / 'preprocessor.joblib'
-        self.preprocessor.save(str(preprocessor_path))
-        
-        # Save models
-        for name, model in self.models.items():
-            model_path = Path(directory) / f'{name.lower().replace(" ", "_")}.joblib'
-            joblib.dump(model, model_path)
-            logger.info(f"Saved {name} to {model_path}")
-        
-        # Save best model separately
-        if self.best_model:
-            best_model_path = Path(directory) / 'best_model.joblib'
-            joblib.dump(self.best_model, best_model_path)
-            logger.info(f"Saved best model ({self.best_model_name}) to {best_model_path}")
-        
-        # Save model info
-        model_info = {
-            'best_model_name': self.best_model_name,
-            'metrics': self.model_metrics,
-            'feature_names': self.feature_names
+        # Save models. The per-model archives are compressed; the bundle stays
+        # uncompressed so load_model can memory-map it.
+        if save_all:
+            for name, model in self.models.items():
+                model_path = Path(directory) / f'{name.lower().replace(" ", "_")}.joblib'
+                joblib.dump(_archive_copy(model), model_path, compress=ARCHIVE_COMPRESS,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                logger.info(f"Saved {name} to {model_path}")
+        
+        # Save the serving bundle
+        best_model = _without_training_attributes(_archive_copy(self.best_model))
+        bundle = {
+            'preprocessor': self.preprocessor,
+            'best_model': best_model,
+            'model_info': {
+                'best_model_name': self.best_model_name,
+                'metrics': self.model_metrics,
+                'feature_names': self.feature_names
+            }
         }
-        info_path = Path(directory) / 'model_info.joblib'
-        joblib.dump(model_info, info_path)
-        logger.info(f"Saved model info to {info_path}")
+        bundle_path = Path(directory) / BUNDLE_FILE
+        joblib.dump(bundle, bundle_path, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"Saved best model ({self.best_model_name}), preprocessor and model info to {bundle_path}")
     
     @staticmethod
-    def load_model(directory: str = 'models/trained_models') -> Tuple[object, LoanPreprocessor, Dict]:
+    def saved_model_exists(directory: str = 'models/trained_models') -> bool:
+        """Whether directory holds a saved model, as a bundle or legacy per-file artifacts."""
+        directory_path = Path(directory)
+        return (directory_path / BUNDLE_FILE).exists() or (directory_path / 'best_model.joblib').exists()
+    
+    @staticmethod
+    def load_model(directory: str = 'models/trained_models',
+                   mmap_mode: Optional[str] = 'c') -> Tuple[object, LoanPreprocessor, Dict]:
         """
         Load trained model and preprocessor.
         
+        Reads bundle.joblib when present, otherwise the per-file layout
+        (preprocessor.joblib, model_info.joblib, best_model.joblib) written
+        by earlier versions.
+        
+        Args:
+            directory: Directory containing the saved artifacts
+            mmap_mode: joblib memory-map mode for the model and preprocessor
+                arrays. The default 'c' maps them copy-on-write, so processes
+                share the same pages while estimators that need writable
+                buffers (e.g. SVC) still work; None reads them into memory.
+                Mapped arrays are shared with other processes, so callers
+                must not modify model or preprocessor arrays in place.
+        
         Returns:
             Tuple of (model, preprocessor, model_info)
         """
         directory_path = Path(directory)
         
+        bundle_path = directory_path / BUNDLE_FILE
+        if bundle_path.exists():
+            bundle = joblib.load(bundle_path, mmap_mode=mmap_mode)
+            model_info = bundle['model_info']
+            logger.info(f"Loaded model: {model_info['best_model_name']}")
+            return bundle['best_model'], bundle['preprocessor'], model_info
+        
         # Load preprocessor
         preprocessor_path = directory_path / 'preprocessor.joblib'
-        preprocessor = LoanPreprocessor.load(str(preprocessor_path))
+        preprocessor = LoanPreprocessor.load(str(preprocessor_path), mmap_mode=mmap_mode)
         
         # Load model info
         info_path = directory_path / 'model_info.joblib'
@@ -214,7 +343,7 @@ class LoanModelTrainer:
         
         # Load best model
         best_model_path = directory_path / 'best_model.joblib'
-        model = joblib.load(best_model_path)
+        model = joblib.load(best_model_path, mmap_mode=mmap_mode)
         
         logger.info(f"Loaded model: {model_info['best_model_name']}")
         
@@ -222,19 +351,21 @@ class LoanModelTrainer:
 
 
 def train_and_save_model(dataset_path: str = 'data/loan_dataset.csv', 
-                         output_dir: str = 'models/trained_models') -> LoanModelTrainer:
+                         output_dir: str = 'models/trained_models',
+                         save_all: bool = False) -> LoanModelTrainer:
     """
     Convenience function to train and save models.
     
     Args:
         dataset_path: Path to dataset
         output_dir: Directory to save models
+        save_all: Also save every candidate model, not just the best one
         
     Returns:
         Trained LoanModelTrainer instance
     """
     trainer = LoanModelTrainer()
     trainer.train_models(dataset_path)
-    trainer.save_models(output_dir)
+    trainer.save_models(output_dir, save_all=save_all)
     return trainer
 
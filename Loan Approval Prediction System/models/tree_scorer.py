@@ -0,0 +1,135 @@
+"""
+Compiled scoring of tree ensembles for low-latency predictions.
+
+A fitted scikit-learn forest is flattened into padded node arrays once, and
+a Numba-compiled loop walks every tree directly, bypassing sklearn's
+per-call validation and per-tree dispatch.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
+
+
+@njit(cache=True)
+def score_forest(X, thresholds, features, left, right, leaf_values):
+    """
+    Average positive-class probability over all trees for each row of X.
+
+    Args:
+        X: float32 feature matrix, one row per sample
+        thresholds: Split threshold per tree and node
+        features: Split feature index per tree and node
+        left: Left child per tree and node (-1 at leaves)
+        right: Right child per tree and node
+        leaf_values: Positive-class probability per tree and node
+
+    Returns:
+        Positive-class probability per row
+    """
+    n_rows = X.shape[0]
+    n_trees = leaf_values.shape[0]
+    out = np.empty(n_rows)
+    for i in range(n_rows):
+        total = 0.0
+        for t in range(n_trees):
+            node = 0
+            while left[t, node] != -1:
+                if X[i, features[t, node]] <= thresholds[t, node]:
+                    node = left[t, node]
+                else:
+                    node = right[t, node]
+            total += leaf_values[t, node]
+        out[i] = total / n_trees
+    return out
+
+
+def export_forest(model) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Flatten a fitted binary sklearn tree ensemble into padded node arrays.
+
+    Args:
+        model: Fitted RandomForestClassifier/ExtraTreesClassifier
+
+    Returns:
+        Tuple of (thresholds, features, left, right, leaf_values), or None if
+        the model is not a binary forest of sklearn trees
+    """
+    estimators = getattr(model, 'estimators_', None)
+    classes = getattr(model, 'classes_', None)
+    if not estimators or classes is None or len(classes) != 2:
+        return None
+    if not all(hasattr(est, 'tree_') for est in estimators):
+        return None
+
+    n_trees = len(estimators)
+    max_nodes = max(est.tree_.node_count for est in estimators)
+    thresholds = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    features = np.zeros((n_trees, max_nodes), dtype=np.int32)
+    left = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    right = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    leaf_values = np.zeros((n_trees, max_nodes), dtype=np.float64)
+
+    for t, est in enumerate(estimators):
+        tree = est.tree_
+        n = tree.node_count
+        thresholds[t, :n] = tree.threshold
+        features[t, :n] = np.maximum(tree.feature, 0)
+        left[t, :n] = tree.children_left
+        right[t, :n] = tree.children_right
+        # Normalise leaf class weights to probabilities, as predict_proba does
+        value = tree.value[:, 0, :]
+        totals = value.sum(axis=1)
+        totals[totals == 0] = 1.0
+        leaf_values[t, :n] = value[:, 1] / totals
+
+    return thresholds, features, left, right, leaf_values
+
+
+class ForestScorer:
+    """Scores a binary tree ensemble with the compiled tree walker."""
+
+    def __init__(self, arrays: Tuple[np.ndarray, ...], classes: np.ndarray):
+        self.arrays = arrays
+        self.classes = classes
+
+    @classmethod
+    def from_model(cls, model) -> Optional['ForestScorer']:
+        """Build a scorer for model, or None if it can't be compiled."""
+        if not NUMBA_AVAILABLE:
+            return None
+        arrays = export_forest(model)
+        if arrays is None:
+            return None
+        logger.info("Using compiled tree scorer for %d trees", arrays[0].shape[0])
+        return cls(arrays, model.classes_)
+
+    def predict_proba_positive(self, X: np.ndarray) -> np.ndarray:
+        """Positive-class probability for each row of X."""
+        if hasattr(X, 'toarray'):
+            X = X.toarray()
+        # sklearn compares float32 feature values against the split thresholds
+        X32 = np.ascontiguousarray(X, dtype=np.float32)
+        return score_forest(X32, *self.arrays)
+
+    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (predicted classes, positive-class probabilities) for X."""
+        positive = self.predict_proba_positive(X)
+        # Ties go to the first class, matching argmax over predict_proba
+        predictions = self.classes[(positive > 0.5).astype(np.intp)]
+        return predictions, positive
@@ -58,6 +58,32 @@ class TestAPIEndpoints:
         # May return 500 if model not loaded, which is acceptable for tests
         assert response.status_code in [200, 500]
     
+    def test_predict_bulk_endpoint_missing_data(self, client):
+        """Test bulk predict endpoint without an applications list."""
+        response = client.post('/api/predict/bulk', json={})
+        assert response.status_code == 400
+    
+    def test_predict_bulk_endpoint_invalid_data(self, client):
+        """Test bulk predict endpoint reports the invalid application."""
+        response = client.post('/api/predict/bulk', json={'applications': [{'Gender': 'Male'}]})
+        assert response.status_code == 400
+        assert 'Application 0' in response.get_json()['error']
+    
+    def test_applications_page_invalid_limit(self, client):
+        """Test paged applications endpoint rejects an invalid limit."""
+        response = client.get('/api/applications?limit=0')
+        assert response.status_code == 400
+    
+    def test_applications_page_unknown_cursor(self, client):
+        """Test paged applications endpoint rejects a cursor naming no application."""
+        response = client.get('/api/applications?limit=10&after=no-such-application')
+        assert response.status_code == 400
+    
+    def test_applications_bulk_invalid_loan_type(self, client):
+        """Test bulk application submission rejects an unknown loan type."""
+        response = client.post('/api/applications/bulk', json={'loan_type': 'boat', 'applications': [{}]})
+        assert response.status_code == 400
+    
     def test_model_performance_endpoint(self, client):
         """Test model performance endpoint."""
         response = client.get('/api/model/performance')
@@ -0,0 +1,84 @@
+"""
+Tests for the vectorized batch approval checks.
+"""
+
+import pytest
+import pandas as pd
+from utils.approval_batch import check_loans_batch
+from utils.approval_engine import check_loan_approval
+
+
+@pytest.fixture
+def home_applications():
+    """Home loan applications covering approval and each kind of rejection."""
+    base = {
+        'age': 35,
+        'annual_income': 1200000,
+        'loan_amount_required': 2500000,
+        'property_value': 5000000,
+        'credit_score': 750,
+        'loan_tenure': 20,
+        'co_applicant_income': 0
+    }
+    return [
+        base,
+        {**base, 'age': 65},
+        {**base, 'annual_income': 300000},
+        {**base, 'loan_amount_required': 400000},
+        {**base, 'credit_score': None},
+        {**base, 'credit_score': 600},
+        {**base, 'property_value': 2000000},
+        {**base, 'loan_amount_required': 5000000, 'property_value': 0},
+    ]
+
+
+class TestCheckLoansBatch:
+    """Test cases for vectorized loan approval."""
+    
+    def test_matches_single_application_checks(self, home_applications):
+        """Test that batch decisions and reasons match check_loan_approval."""
+        expected = [check_loan_approval('home', data) for data in home_applications]
+        
+        result = check_loans_batch('home', pd.DataFrame(home_applications))
+        
+        assert result['approved'].tolist() == [r['approved'] for r in expected]
+        assert result['reason'].tolist() == [r['reason'] for r in expected]
+    
+    def test_decisions_without_reasons(self, home_applications):
+        """Test that skipping reason formatting leaves the decisions unchanged."""
+        df = pd.DataFrame(home_applications)
+        
+        result = check_loans_batch('home', df, with_reasons=False)
+        
+        assert list(result.columns) == ['approved']
+        assert result['approved'].tolist() == check_loans_batch('home', df)['approved'].tolist()
+    
+    def test_parallel_matches_serial(self, home_applications):
+        """Test that splitting the rows across worker processes gives the same result."""
+        df = pd.DataFrame(home_applications * 3)
+        
+        result = check_loans_batch('home', df, n_jobs=2)
+        
+        pd.testing.assert_frame_equal(result, check_loans_batch('home', df))
+    
+    def test_education_parent_income_note(self):
+        """Test that a low parent income is prefixed to a later rejection reason."""
+        data = {
+            'age': 20,
+            'applicant_annual_income': 0,
+            'parent_guardian_income': 100000,
+            'course_name': 'BTech',
+            'institution_name': 'IIT'
+        }
+        
+        result = check_loans_batch('education', pd.DataFrame([data]))
+        
+        assert not result['approved'][0]
+        assert result['reason'][0] == check_loan_approval('education', data)['reason']
+    
+    def test_unknown_loan_type(self):
+        """Test that an unknown loan type rejects every row."""
+        result = check_loans_batch('boat', pd.DataFrame([{'age': 30}, {'age': 40}]))
+        
+        assert not result['approved'].any()
+        assert (result['reason'] == 'Unknown loan type: boat').all()
@@ -0,0 +1,144 @@
+"""
+Tests for the micro-batching scorer.
+"""
+
+import os
+import threading
+import time
+import pytest
+from utils.batch_scorer import BatchScorer
+
+
+class TestBatchScorer:
+    """Test cases for BatchScorer."""
+    
+    def test_single_record(self):
+        """Test scoring a single record."""
+        scorer = BatchScorer(lambda records: [r['x'] * 2 for r in records])
+        assert scorer.score({'x': 21}) == 42
+    
+    def test_concurrent_records_are_batched(self):
+        """Test that concurrent records are scored together and routed back correctly."""
+        batch_sizes = []
+        started = []
+        release = threading.Event()
+        
+        def score_batch(records):
+            started.append(len(records))
+            release.wait(timeout=5)
+            batch_sizes.append(len(records))
+            return [r['x'] + 1 for r in records]
+        
+        scorer = BatchScorer(score_batch, max_batch=32)
+        results = {}
+        
+        def worker(i):
+            results[i] = scorer.score({'x': i})
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        # Let the remaining records queue up behind the first batch
+        deadline = time.monotonic() + 5
+        while scorer._queue.qsize() + sum(started) < 10 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+        
+        assert results == {i: i + 1 for i in range(10)}
+        assert sum(batch_sizes) == 10
+        assert len(batch_sizes) < 10
+    
+    def test_error_only_fails_the_bad_record(self):
+        """Test that records batched with a failing one still get their results."""
+        started = []
+        release = threading.Event()
+        
+        def score_batch(records):
+            started.append(len(records))
+            release.wait(timeout=5)
+            if any(r['x'] < 0 for r in records):
+                raise ValueError("negative")
+            return [r['x'] for r in records]
+        
+        scorer = BatchScorer(score_batch, max_batch=32)
+        results = {}
+        
+        def worker(i):
+            try:
+                results[i] = scorer.score({'x': i})
+            except ValueError as e:
+                results[i] = e
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in (-1, 1, 2, 3)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while scorer._queue.qsize() + sum(started) < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+        
+        assert isinstance(results.pop(-1), ValueError)
+        assert results == {1: 1, 2: 2, 3: 3}
+    
+    def test_missing_results_are_errors(self):
+        """Test that callers get an error instead of waiting when results are missing."""
+        scorer = BatchScorer(lambda records: [])
+        with pytest.raises(RuntimeError):
+            scorer.score({'x': 1})
+    
+    def test_worker_exit_fails_waiting_callers(self):
+        """Test that a BaseException raised while scoring fails the caller and the worker is restarted."""
+        calls = []
+        
+        def score_batch(records):
+            calls.append(records)
+            if len(calls) == 1:
+                raise KeyboardInterrupt
+            return [r['x'] for r in records]
+        
+        scorer = BatchScorer(score_batch)
+        with pytest.raises(KeyboardInterrupt):
+            scorer.score({'x': 1})
+        assert scorer.score({'x': 2}) == 2
+    
+    def test_errors_propagate_to_caller(self):
+        """Test that scoring errors are raised in the calling thread."""
+        def score_batch(records):
+            raise ValueError("bad batch")
+        
+        scorer = BatchScorer(score_batch)
+        with pytest.raises(ValueError):
+            scorer.score({'x': 1})
+    
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    def test_scoring_after_fork(self):
+        """Test that a forked child starts its own worker instead of waiting on the parent's."""
+        scorer = BatchScorer(lambda records: [r['x'] * 2 for r in records])
+        assert scorer.score({'x': 1}) == 2
+        
+        pid = os.fork()
+        if pid == 0:
+            # Child: exit code 0 only if scoring completes; the parent kills it otherwise
+            code = 1
+            try:
+                code = 0 if scorer.score({'x': 21}) == 42 else 1
+            finally:
+                os._exit(code)
+        
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            time.sleep(0.01)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("scoring in the forked child did not complete")
+        
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        assert scorer.score({'x': 2}) == 4
@@ -0,0 +1,32 @@
+"""
+Tests for the EMI calculator.
+"""
+
+import numpy as np
+from utils.emi_calculator import calculate_emi, calculate_emi_batch
+
+
+class TestCalculateEmiBatch:
+    """Test cases for vectorized EMI calculation."""
+    
+    def test_matches_scalar_calculation(self):
+        """Test that every batch result equals calculate_emi for the same loan."""
+        rng = np.random.default_rng(0)
+        principals = rng.integers(10000, 5000000, 2000) + rng.integers(0, 100, 2000) / 100
+        rates = rng.choice([0.0, 8.5, 9.0, 10.5, 12.0, 11.5], 2000)
+        tenures = rng.integers(1, 361, 2000)
+        
+        result = calculate_emi_batch(principals, rates, tenures)
+        
+        for i in range(len(principals)):
+            expected = calculate_emi(float(principals[i]), float(rates[i]), int(tenures[i]))
+            for key in ('emi', 'total_amount', 'total_interest'):
+                assert result[key][i] == expected[key]
+    
+    def test_invalid_loans_are_zero(self):
+        """Test that non-positive principals or tenures give zero EMI, like calculate_emi."""
+        result = calculate_emi_batch([100000, 0, 100000], 9.0, [12, 12, 0])
+        
+        assert result['emi'][0] > 0
+        assert result['emi'][1:].tolist() == [0.0, 0.0]
+        assert result['total_interest'][1:].tolist() == [0.0, 0.0]
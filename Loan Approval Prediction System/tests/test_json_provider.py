@@ -0,0 +1,47 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+"""
+
+import pytest
+import numpy as np
+from flask import Flask, jsonify
+from utils.json_provider import OrjsonProvider, ORJSON_AVAILABLE
+
+pytestmark = pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+
+
+@pytest.fixture
+def app():
+    """Create a Flask app using the orjson provider."""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+class TestOrjsonProvider:
+    """Test cases for OrjsonProvider."""
+    
+    def test_jsonify_numpy_values(self, app):
+        """Test that numpy scalars and arrays serialize without coercion."""
+        with app.app_context():
+            response = jsonify({
+                'probability': np.float64(0.75),
+                'importances': np.array([0.5, 0.25], dtype=np.float32),
+                'count': np.int64(3)
+            })
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'probability': 0.75, 'importances': [0.5, 0.25], 'count': 3}
+    
+    def test_jsonify_keeps_key_order(self, app):
+        """Test that ranked dicts keep their insertion order."""
+        with app.app_context():
+            response = jsonify({'b': 2, 'a': 1})
+        assert response.get_data(as_text=True).replace(' ', '').startswith('{"b":2')
+    
+    def test_dumps_with_kwargs_uses_stdlib(self, app):
+        """Test that json.dumps-style keyword arguments still work."""
+        assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+    
+    def test_loads_bytes(self, app):
+        """Test that request bodies are parsed from bytes."""
+        assert app.json.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
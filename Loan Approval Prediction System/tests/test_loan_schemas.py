@@ -0,0 +1,50 @@
+"""
+Tests for the loan application schemas.
+"""
+
+import uuid
+
+from utils.loan_schemas import PersonalLoanApplication
+
+
+def make_application(**overrides):
+    """A personal loan application with the required fields filled in."""
+    fields = {
+        'full_name': 'Test Applicant', 'date_of_birth': '1990-01-01', 'gender': 'Male',
+        'phone': '9876543210', 'email': 'applicant@example.com', 'employment_type': 'Salaried',
+        'monthly_income': 80000.0, 'work_experience': 5.0, 'existing_emi': 'No',
+        'loan_amount_required': 300000.0, 'loan_tenure': 36, 'loan_purpose': 'Renovation'
+    }
+    fields.update(overrides)
+    return PersonalLoanApplication(**fields)
+
+
+class TestApplicationRecord:
+    """Test cases for the shared dictionary conversion."""
+    
+    def test_generated_application_id_is_uuid4(self):
+        """Test that a missing application_id is filled with a random UUID4 string."""
+        ids = {make_application().to_dict()['application_id'] for _ in range(50)}
+        
+        assert len(ids) == 50
+        for application_id in ids:
+            parsed = uuid.UUID(application_id)
+            assert str(parsed) == application_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+    
+    def test_given_metadata_is_kept(self):
+        """Test that a provided application_id and submitted_at are not replaced."""
+        record = make_application(application_id='abc', submitted_at='2024-01-01T00:00:00').as_result_dict(None)
+        
+        assert record['application_id'] == 'abc'
+        assert record['submitted_at'] == '2024-01-01T00:00:00'
+        assert record['emi_info'] is None
+        assert record['loan_type'] == 'personal'
+    
+    def test_shared_timestamp(self):
+        """Test that a batch timestamp fills in only a missing submitted_at."""
+        assert make_application().as_result_dict(None, '2024-05-01T10:00:00')['submitted_at'] == '2024-05-01T10:00:00'
+        
+        own = make_application(submitted_at='2024-01-01T00:00:00').as_result_dict(None, '2024-05-01T10:00:00')
+        assert own['submitted_at'] == '2024-01-01T00:00:00'
@@ -0,0 +1,144 @@
+"""
+Tests for loan application storage.
+"""
+
+import json
+import multiprocessing
+
+import pytest
+import utils.loan_storage as loan_storage
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Point the storage module at an empty temporary directory."""
+    monkeypatch.setattr(loan_storage, 'PROJECT_ROOT', tmp_path)
+    monkeypatch.setattr(loan_storage, 'PROJECT_STORAGE_FILE', tmp_path / 'applications.json')
+    monkeypatch.setattr(loan_storage, 'TEMP_STORAGE_FILE', tmp_path / 'temp' / 'loan_applications.json')
+    monkeypatch.setattr(loan_storage, '_cache', {})
+    loan_storage.save_applications([
+        {'application_id': 'a1', 'loan_type': 'home', 'status': 'pending'},
+        {'application_id': 'a2', 'loan_type': 'car', 'status': 'pending'},
+    ])
+    return tmp_path / 'applications.json'
+
+
+def restart():
+    """Forget everything read so far, as a freshly started process would."""
+    loan_storage._cache.clear()
+
+
+def save_from_worker(worker, count):
+    """Save count applications one at a time, as a separate worker process would."""
+    restart()
+    for i in range(count):
+        assert loan_storage.save_application(
+            {'application_id': f'w{worker}-{i}', 'loan_type': 'car', 'status': 'pending'}
+        )
+
+
+class TestLoanStorage:
+    """Test cases for the cached application store."""
+    
+    def test_lookups(self, storage):
+        """Test lookups by id and by loan type."""
+        assert loan_storage.get_application_by_id('a2')['loan_type'] == 'car'
+        assert loan_storage.get_application_by_id('missing') is None
+        assert [app['application_id'] for app in loan_storage.get_applications_by_type('home')] == ['a1']
+    
+    def test_update_status_is_persisted(self, storage):
+        """Test that a status update is written and earlier results are left unchanged."""
+        before = loan_storage.get_application_by_id('a1')
+        
+        assert loan_storage.update_application_status('a1', 'approved')
+        
+        assert before['status'] == 'pending'
+        assert loan_storage.get_application_by_id('a1')['status'] == 'approved'
+        restart()
+        assert loan_storage.get_application_by_id('a1')['status'] == 'approved'
+    
+    def test_unchanged_status_is_not_written(self, storage):
+        """Test that setting the current status again writes nothing."""
+        journal = storage.with_suffix('.ndjson')
+        size = journal.stat().st_size
+        
+        assert loan_storage.update_application_status('a1', 'pending')
+        
+        assert journal.stat().st_size == size
+        assert 'updated_at' not in loan_storage.get_application_by_id('a1')
+    
+    def test_external_changes_are_reloaded(self, storage):
+        """Test that changes journaled by another process are read."""
+        loan_storage.get_application_by_id('a1')
+        record = {'op': 'update', 'application_id': 'a1', 'fields': {'status': 'rejected'}}
+        with open(storage.with_suffix('.ndjson'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+        
+        assert loan_storage.get_application_by_id('a1')['status'] == 'rejected'
+    
+    def test_pages(self, storage):
+        """Test paging newest first, and that an unknown cursor is reported rather than ending the list."""
+        assert [app['application_id'] for app in loan_storage.get_applications_page(limit=1)] == ['a2']
+        assert [app['application_id'] for app in loan_storage.get_applications_page('a2', limit=1)] == ['a1']
+        assert loan_storage.get_applications_page('a1', limit=1) == []
+        
+        assert loan_storage.delete_application('a2')
+        assert loan_storage.get_applications_page('a2', limit=1) is None
+    
+    def test_delete(self, storage):
+        """Test that deleted applications are no longer returned."""
+        assert loan_storage.delete_application('a1')
+        
+        assert loan_storage.get_application_by_id('a1') is None
+        assert len(loan_storage.get_all_applications()) == 1
+        restart()
+        assert [app['application_id'] for app in loan_storage.get_all_applications()] == ['a2']
+    
+    def test_compaction(self, storage, monkeypatch):
+        """Test that the journal is folded into the storage file."""
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_MIN', 0)
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_RATIO', 0)
+        
+        assert loan_storage.update_application_status('a2', 'approved')
+        
+        assert not storage.with_suffix('.ndjson').exists()
+        applications = json.loads(storage.read_text(encoding='utf-8'))
+        assert [app['status'] for app in applications] == ['pending', 'approved']
+        assert loan_storage.get_application_by_id('a2')['status'] == 'approved'
+    
+    def test_replay_is_idempotent(self, storage):
+        """Test that journal records already in the storage file are not applied twice."""
+        journal = storage.with_suffix('.ndjson').read_bytes()
+        storage.write_text(json.dumps(loan_storage.load_applications()), encoding='utf-8')
+        storage.with_suffix('.ndjson').write_bytes(journal)
+        restart()
+        
+        assert [app['application_id'] for app in loan_storage.get_all_applications()] == ['a1', 'a2']
+    
+    def test_memory_mapped_read(self, storage, monkeypatch):
+        """Test that a storage file read through a memory map gives the same applications."""
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_MIN', 0)
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_RATIO', 0)
+        loan_storage.update_application_status('a1', 'approved')
+        monkeypatch.setattr(loan_storage, 'MMAP_MIN_BYTES', 0)
+        restart()
+        
+        assert [app['status'] for app in loan_storage.get_all_applications()] == ['approved', 'pending']
+    
+    @pytest.mark.skipif(not loan_storage.FCNTL_AVAILABLE, reason="requires fcntl")
+    def test_concurrent_processes(self, storage, monkeypatch):
+        """Test that saves from several processes survive each other's compactions."""
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_MIN', 5)
+        monkeypatch.setattr(loan_storage, 'JOURNAL_COMPACT_RATIO', 0)
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=save_from_worker, args=(worker, 40)) for worker in range(4)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        restart()
+        
+        ids = [app['application_id'] for app in loan_storage.get_all_applications()]
+        assert len(ids) == 2 + 4 * 40
+        assert set(ids) == {'a1', 'a2'} | {f'w{worker}-{i}' for worker in range(4) for i in range(40)}
@@ -0,0 +1,140 @@
+"""
+Tests for the per-loan-type application validators.
+"""
+
+import pytest
+from utils.loan_validators import (
+    EducationLoanValidator, HomeLoanValidator, PersonalLoanValidator, _compile_validator
+)
+
+
+@pytest.fixture
+def education_data():
+    """A valid education loan application."""
+    return {
+        'full_name': 'Test Student',
+        'age': 20,
+        'gender': 'Female',
+        'phone_number': '9876543210',
+        'email': 'student@example.com',
+        'course_name': 'B.Tech',
+        'course_duration': 4,
+        'institution_name': 'Test Institute',
+        'institution_type': 'Private',
+        'applicant_annual_income': 0,
+        'parent_guardian_income': 500000,
+        'co_borrower_name': 'Parent',
+        'co_borrower_occupation': 'Engineer',
+        'co_borrower_annual_income': 600000,
+        'existing_loan': 'No',
+        'loan_amount_required': 500000,
+        'repayment_period': 5,
+        'purpose': 'Tuition'
+    }
+
+
+class TestEducationLoanValidator:
+    """Test cases for EducationLoanValidator."""
+    
+    def test_valid_application(self, education_data):
+        """Test that a valid application with no applicant income passes."""
+        assert EducationLoanValidator.validate(education_data) == (True, None)
+    
+    def test_missing_field(self, education_data):
+        """Test that an empty required field is reported."""
+        education_data['course_name'] = ''
+    
+        assert EducationLoanValidator.validate(education_data) == (False, "Missing required field: course_name")
+    
+    def test_negative_income(self, education_data):
+        """Test that negative incomes are rejected before the range checks."""
+        education_data['parent_guardian_income'] = '-1'
+    
+        assert EducationLoanValidator.validate(education_data) == (False, "parent_guardian_income cannot be negative")
+    
+    def test_unparseable_income(self, education_data):
+        """Test that a non-numeric income is reported as invalid."""
+        education_data['co_borrower_annual_income'] = 'a lot'
+    
+        assert EducationLoanValidator.validate(education_data) == (False, "Invalid co_borrower_annual_income")
+    
+    def test_validate_email(self):
+        """Test email format checks, including input that skips the regex."""
+        assert EducationLoanValidator.validate_email('student@example.com')
+        assert EducationLoanValidator.validate_email('a' * 300 + '@example.com')
+        assert not EducationLoanValidator.validate_email('student.example.com')
+        assert not EducationLoanValidator.validate_email('student@@example.com')
+        assert not EducationLoanValidator.validate_email('student@example')
+        assert not EducationLoanValidator.validate_email(12345)
+    
+    def test_validate_phone(self):
+        """Test that at least 10 digits are required, ignoring separators."""
+        assert EducationLoanValidator.validate_phone('9876543210')
+        assert EducationLoanValidator.validate_phone('+91 98765-43210')
+        assert not EducationLoanValidator.validate_phone('98765-4321')
+        assert not EducationLoanValidator.validate_phone('12345')
+    
+    def test_out_of_range(self, education_data):
+        """Test that the first out-of-range field is reported with its bounds."""
+        education_data['repayment_period'] = 25
+    
+        assert EducationLoanValidator.validate(education_data) == (False, "repayment_period must be between 1 and 20")
+
+
+class TestHomeLoanValidator:
+    """Test cases for HomeLoanValidator."""
+    
+    def test_zero_co_applicant_income_is_allowed(self):
+        """Test that 0 counts as present for numeric required fields."""
+        data = {
+            'full_name': 'Test Buyer', 'age': 35, 'gender': 'Male', 'marital_status': 'Married',
+            'phone_number': '9876543210', 'email': 'buyer@example.com',
+            'employment_type': 'Salaried', 'company_business_name': 'Acme', 'work_experience': 10,
+            'annual_income': 1500000, 'property_type': 'Flat', 'property_location': 'Pune',
+            'property_value': 6000000, 'ownership_type': 'New', 'down_payment_amount': 1500000,
+            'co_applicant_income': 0, 'existing_emi': 'No',
+            'loan_amount_required': 4500000, 'loan_tenure': 20
+        }
+    
+        assert HomeLoanValidator.validate(data) == (True, None)
+    
+        data['loan_tenure'] = ''
+        assert HomeLoanValidator.validate(data) == (False, "Missing required field: loan_tenure")
+
+
+class TestPersonalLoanValidator:
+    """Test cases for PersonalLoanValidator."""
+    
+    def test_validate_date(self):
+        """Test that dates must exist on the calendar, padded or not."""
+        assert PersonalLoanValidator.validate_date('1990-05-17')
+        assert PersonalLoanValidator.validate_date('2000-02-29')
+        assert PersonalLoanValidator.validate_date('1990-5-7')
+        assert not PersonalLoanValidator.validate_date('1990-02-30')
+        assert not PersonalLoanValidator.validate_date('1990-13-01')
+        assert not PersonalLoanValidator.validate_date('17-05-1990')
+        assert not PersonalLoanValidator.validate_date('1990-05-1x')
+
+
+class TestCompileValidator:
+    """Test cases for compiling validation tables."""
+    
+    def test_steps_run_in_order(self):
+        """Test that the first failing step is reported."""
+        validate = _compile_validator((
+            ('required', ('name',), False),
+            ('any_of', ('monthly', 'annual'), "Income is required"),
+            ('optional_int_range', 'score', 300, 900, "Score out of range", "Invalid score"),
+            ('ranges', (('amount', 1, 10),)),
+        ), 'example')
+        
+        assert validate({}) == (False, "Missing required field: name")
+        assert validate({'name': 'x', 'amount': 5}) == (False, "Income is required")
+        assert validate({'name': 'x', 'annual': 1, 'score': 'high', 'amount': 5}) == (False, "Invalid score")
+        assert validate({'name': 'x', 'annual': 1, 'amount': 50}) == (False, "amount must be between 1 and 10")
+        assert validate({'name': 'x', 'annual': 1, 'score': 0, 'amount': 5}) == (True, None)
+    
+    def test_unknown_step(self):
+        """Test that an unknown step kind is rejected when compiling."""
+        with pytest.raises(ValueError):
+            _compile_validator((('unknown', 'name'),), 'example')
@@ -0,0 +1,79 @@
+"""
+Tests for traceback sampling.
+"""
+
+import io
+import logging
+import sys
+from utils.log_sampling import SampledTracebackFormatter
+
+
+def _error_record(lineno=10):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    return logging.LogRecord('test', logging.ERROR, 'app.py', lineno, 'Failed: %s', ('x',), exc_info)
+
+
+class TestSampledTracebackFormatter:
+    """Test cases for SampledTracebackFormatter."""
+    
+    def test_keeps_one_traceback_per_rate(self):
+        """Test that only every rate-th repeated record keeps its traceback."""
+        formatter = SampledTracebackFormatter('%(message)s', rate=3)
+        lines = [formatter.format(_error_record()) for _ in range(7)]
+        
+        kept = [i for i, line in enumerate(lines) if 'Traceback' in line]
+        assert kept == [0, 3, 6]
+        assert lines[1] == 'Failed: x (traceback sampled out, 2 occurrences)'
+    
+    def test_record_is_left_unchanged(self):
+        """Test that a sampled-out record keeps its message and exception for other formatters."""
+        formatter = SampledTracebackFormatter('%(message)s', rate=100)
+        formatter.format(_error_record())
+        record = _error_record()
+        
+        formatter.format(record)
+        
+        assert record.msg == 'Failed: %s'
+        assert record.exc_info is not None
+        assert 'Traceback' in logging.Formatter('%(message)s').format(record)
+    
+    def test_shared_by_several_handlers(self):
+        """Test that each record is counted once and suffixed once per handler."""
+        formatter = SampledTracebackFormatter('%(message)s', rate=2)
+        streams = [io.StringIO(), io.StringIO()]
+        logger = logging.getLogger('test_log_sampling.shared')
+        logger.propagate = False
+        handlers = [logging.StreamHandler(stream) for stream in streams]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        try:
+            for _ in range(3):
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    logger.exception("Failed")
+        finally:
+            for handler in handlers:
+                logger.removeHandler(handler)
+        
+        for stream in streams:
+            output = stream.getvalue()
+            assert output.count('Traceback') == 2
+            assert output.count('(traceback sampled out, 2 occurrences)') == 1
+    
+    def test_call_sites_counted_separately(self):
+        """Test that different call sites each keep their first traceback."""
+        formatter = SampledTracebackFormatter('%(message)s', rate=100)
+        assert 'Traceback' in formatter.format(_error_record(10))
+        assert 'Traceback' in formatter.format(_error_record(20))
+    
+    def test_records_without_exception_untouched(self):
+        """Test that plain records are formatted as usual."""
+        formatter = SampledTracebackFormatter('%(message)s', rate=2)
+        record = logging.LogRecord('test', logging.ERROR, 'app.py', 10, 'Plain', (), None)
+        for _ in range(3):
+            assert formatter.format(record) == 'Plain'
@@ -2,12 +2,15 @@
 Tests for loan model training and prediction.
 """
 
+import os
 import pytest
 import pandas as pd
 import numpy as np
+import joblib
 from pathlib import Path
+import models.loan_model as loan_model_module
 from models.loan_model import LoanModelTrainer
-from utils.data_loader import load_dataset
+from utils.data_loader import load_dataset, PYARROW_AVAILABLE
 
 
 class TestLoanModelTrainer:
@@ -94,6 +97,50 @@ class TestLoanModelTrainer:
         with pytest.raises(ValueError):
             trainer.predict(test_data)
     
+    def test_train_models_from_memmap(self, sample_data, tmp_path, monkeypatch):
+        """Test that training from memory-mapped feature matrices works."""
+        dataset_path = tmp_path / 'test_dataset.csv'
+        sample_data.to_csv(dataset_path, index=False)
+        monkeypatch.setattr(loan_model_module, 'TRAIN_MMAP_MIN_BYTES', 0)
+        
+        trainer = LoanModelTrainer()
+        metrics = trainer.train_models(str(dataset_path), test_size=0.3, n_jobs=1)
+        
+        assert len(metrics) == 4
+        assert trainer.best_model is not None
+    
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_load_dataset_parquet_cache(self, sample_data, tmp_path):
+        """Test that the Parquet cache returns the same frame as the CSV."""
+        dataset_path = tmp_path / 'test_dataset.csv'
+        sample_data.to_csv(dataset_path, index=False)
+        
+        from_csv = load_dataset(str(dataset_path), use_cache=False)
+        load_dataset(str(dataset_path))
+        assert (tmp_path / 'test_dataset.parquet').exists()
+        
+        pd.testing.assert_frame_equal(load_dataset(str(dataset_path)), from_csv)
+        pd.testing.assert_frame_equal(
+            load_dataset(str(dataset_path), exclude_columns=['Loan_ID']),
+            from_csv.drop(columns='Loan_ID')
+        )
+    
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_parquet_cache_ignores_replaced_csv(self, sample_data, tmp_path):
+        """Test that a CSV replaced by an older-dated file is not served from the cache."""
+        dataset_path = tmp_path / 'test_dataset.csv'
+        sample_data.to_csv(dataset_path, index=False)
+        load_dataset(str(dataset_path))
+        cache_mtime_ns = (tmp_path / 'test_dataset.parquet').stat().st_mtime_ns
+        
+        replaced = sample_data.copy()
+        replaced['ApplicantIncome'] = 1.0
+        replaced.to_csv(dataset_path, index=False)
+        os.utime(dataset_path, ns=(cache_mtime_ns - 10**9, cache_mtime_ns - 10**9))
+        
+        assert (load_dataset(str(dataset_path))['ApplicantIncome'] == 1.0).all()
+        assert (load_dataset(str(dataset_path))['ApplicantIncome'] == 1.0).all()
+    
     def test_save_and_load_models(self, sample_data, tmp_path):
         """Test saving and loading models."""
         dataset_path = tmp_path / 'test_dataset.csv'
@@ -107,8 +154,8 @@ class TestLoanModelTrainer:
         trainer.save_models(str(model_dir))
         
         # Check files exist
-        assert (model_dir / 'best_model.joblib').exists()
-        assert (model_dir / 'preprocessor.joblib').exists()
+        assert (model_dir / 'bundle.joblib').exists()
+        assert LoanModelTrainer.saved_model_exists(str(model_dir))
         
         # Load models
         model, preprocessor, model_info = LoanModelTrainer.load_model(str(model_dir))
@@ -117,4 +164,39 @@ class TestLoanModelTrainer:
         assert preprocessor is not None
         assert model_info is not None
         assert 'best_model_name' in model_info
-
+        
+        # Memory-mapped and fully loaded models score identically
+        X = preprocessor.preprocess_batch(sample_data.drop(columns=['Loan_ID', 'Loan_Status']))
+        in_memory, _, _ = LoanModelTrainer.load_model(str(model_dir), mmap_mode=None)
+        np.testing.assert_array_equal(model.predict_proba(X), in_memory.predict_proba(X))
+    
+    def test_saving_leaves_trainer_models_unchanged(self, sample_data, tmp_path):
+        """Test that the float32 weights are only applied to the saved copies."""
+        dataset_path = tmp_path / 'test_dataset.csv'
+        sample_data.to_csv(dataset_path, index=False)
+        trainer = LoanModelTrainer()
+        trainer.train_models(str(dataset_path), test_size=0.3, n_jobs=1)
+        linear = trainer.models['Logistic Regression']
+        coef, intercept = linear.coef_, linear.intercept_
+        
+        trainer.save_models(str(tmp_path / 'models'), save_all=True)
+        
+        assert linear.coef_ is coef and linear.intercept_ is intercept
+        saved = joblib.load(tmp_path / 'models' / 'logistic_regression.joblib')
+        assert saved.coef_.dtype == np.float32
+    
+    def test_bundle_strips_training_attributes_from_a_copy(self, sample_data, tmp_path):
+        """Test that out-of-bag results are left out of the bundle but kept on the trainer's model."""
+        dataset_path = tmp_path / 'test_dataset.csv'
+        sample_data.to_csv(dataset_path, index=False)
+        trainer = LoanModelTrainer()
+        trainer.train_models(str(dataset_path), test_size=0.3, n_jobs=1)
+        forest = trainer.models['Random Forest']
+        forest.oob_score_ = 0.9
+        trainer.best_model_name, trainer.best_model = 'Random Forest', forest
+        
+        trainer.save_models(str(tmp_path / 'models'))
+        
+        assert forest.oob_score_ == 0.9
+        model, _, _ = LoanModelTrainer.load_model(str(tmp_path / 'models'), mmap_mode=None)
+        assert not hasattr(model, 'oob_score_')
@@ -0,0 +1,74 @@
+"""
+Tests for user password hashing.
+"""
+
+import pytest
+from werkzeug.security import generate_password_hash
+import utils.passwords as passwords
+
+LONG_PASSWORD = 'correct horse battery staple ' * 4  # 116 bytes
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    """Use the minimum bcrypt cost so the tests run quickly."""
+    monkeypatch.setattr(passwords, 'BCRYPT_ROUNDS', 4)
+
+
+@pytest.mark.skipif(not passwords.BCRYPT_AVAILABLE, reason="bcrypt not installed")
+class TestBcryptPasswords:
+    """Test cases for bcrypt password hashes."""
+    
+    def test_round_trip(self):
+        """Test that a hashed password verifies and a wrong one doesn't."""
+        password_hash = passwords.hash_password('s3cret-password')
+        
+        assert password_hash.startswith(passwords.PREHASHED_PREFIX)
+        assert len(password_hash) <= 128
+        assert passwords.check_password(password_hash, 's3cret-password')
+        assert not passwords.check_password(password_hash, 's3cret-passwor')
+        assert not passwords.needs_rehash(password_hash)
+    
+    def test_password_longer_than_72_bytes(self):
+        """Test that long passwords hash, and that bytes after the 72nd still count."""
+        password_hash = passwords.hash_password(LONG_PASSWORD)
+        
+        assert passwords.check_password(password_hash, LONG_PASSWORD)
+        assert not passwords.check_password(password_hash, LONG_PASSWORD[:72])
+        assert not passwords.check_password(password_hash, LONG_PASSWORD + 'x')
+    
+    def test_plain_bcrypt_hash(self):
+        """Test that plain bcrypt hashes still verify and are marked for rehashing."""
+        password_hash = passwords.bcrypt.hashpw(b's3cret-password', passwords.bcrypt.gensalt(rounds=4)).decode('ascii')
+        
+        assert passwords.check_password(password_hash, 's3cret-password')
+        assert not passwords.check_password(password_hash, 'wrong')
+        assert not passwords.check_password(password_hash, LONG_PASSWORD)
+        assert passwords.needs_rehash(password_hash)
+    
+    def test_legacy_werkzeug_hash(self):
+        """Test that a long password with a werkzeug hash verifies and can be rehashed."""
+        password_hash = generate_password_hash(LONG_PASSWORD, method='pbkdf2:sha256')
+        
+        assert passwords.check_password(password_hash, LONG_PASSWORD)
+        assert passwords.needs_rehash(password_hash)
+        assert passwords.check_password(passwords.hash_password(LONG_PASSWORD), LONG_PASSWORD)
+
+
+class TestWithoutBcrypt:
+    """Test cases for the pbkdf2 fallback."""
+    
+    def test_fallback_hash(self, monkeypatch):
+        """Test that passwords are hashed with werkzeug when bcrypt is unavailable."""
+        monkeypatch.setattr(passwords, 'BCRYPT_AVAILABLE', False)
+        password_hash = passwords.hash_password(LONG_PASSWORD)
+        
+        assert password_hash.startswith('pbkdf2:sha256')
+        assert passwords.check_password(password_hash, LONG_PASSWORD)
+        assert not passwords.needs_rehash(password_hash)
+    
+    def test_missing_hash_or_password(self):
+        """Test that a missing hash or password never verifies."""
+        assert not passwords.check_password(None, 'password')
+        assert not passwords.check_password('', 'password')
+        assert not passwords.check_password(passwords.hash_password('password'), None)
@@ -5,6 +5,7 @@ Tests for data preprocessing module.
 import pytest
 import pandas as pd
 import numpy as np
+import models.preprocessor as preprocessor_module
 from models.preprocessor import LoanPreprocessor, handle_missing_values
 
 
@@ -66,6 +67,116 @@ class TestLoanPreprocessor:
         
         assert result.shape[0] == 1
         assert result.shape[1] == 2
+    
+    def test_preprocess_batch_matches_single(self):
+        """Test that batch preprocessing of records matches row-by-row preprocessing."""
+        preprocessor = LoanPreprocessor()
+        train_df = pd.DataFrame({
+            'Gender': ['Male', 'Female', 'Male'],
+            'ApplicantIncome': [5000, 6000, 7000]
+        })
+        preprocessor.fit(train_df)
+        
+        records = [
+            {'Gender': 'Male', 'ApplicantIncome': 5500},
+            {'Gender': 'Female', 'ApplicantIncome': 6500},
+            {'Gender': 'Female'}
+        ]
+        result = preprocessor.preprocess_batch(records)
+        
+        assert result.shape == (3, 2)
+        for row, record in zip(result, records[:2]):
+            np.testing.assert_allclose(row, preprocessor.preprocess_single(record)[0])
+        # A key missing from one record is imputed rather than failing
+        assert not np.isnan(result).any()
+    
+    def test_fast_path_matches_transform(self):
+        """Test that dict encoding without pandas matches the DataFrame transform."""
+        preprocessor = LoanPreprocessor()
+        train_df = pd.DataFrame({
+            'Gender': ['Male', 'Female', 'Male', 'Female'],
+            'ApplicantIncome': [5000, 6000, 7000, np.nan],
+            'LoanAmount': [100000, 150000, 200000, 120000]
+        })
+        preprocessor.fit(train_df)
+        
+        records = [
+            {'Gender': 'Female', 'ApplicantIncome': 5500, 'LoanAmount': 130000},
+            {'Gender': 'Unknown', 'ApplicantIncome': np.nan, 'LoanAmount': 90000}
+        ]
+        expected = preprocessor.transform(pd.DataFrame(records))
+        
+        np.testing.assert_allclose(preprocessor.preprocess_batch(records), expected)
+        np.testing.assert_allclose(preprocessor.preprocess_single(records[0]), expected[:1])
+        
+        # Numeric fields submitted as strings encode like the numbers themselves
+        as_strings = {'Gender': 'Female', 'ApplicantIncome': '5500', 'LoanAmount': '130000'}
+        np.testing.assert_allclose(preprocessor.preprocess_single(as_strings), expected[:1])
+    
+    def test_compiled_transform_matches_sklearn(self, monkeypatch):
+        """Test that the Numba impute-and-scale kernel matches the sklearn transform."""
+        preprocessor = LoanPreprocessor()
+        train_df = pd.DataFrame({
+            'Gender': ['Male', 'Female', 'Male', 'Female'],
+            'ApplicantIncome': [5000, 6000, 7000, np.nan],
+            'LoanAmount': [100000, 150000, 200000, 120000]
+        })
+        preprocessor.fit(train_df)
+        df = pd.DataFrame({
+            'Gender': ['Female', 'Unknown', 'Male'],
+            'ApplicantIncome': [5500, np.nan, 8000],
+            'LoanAmount': [130000, 90000, np.nan]
+        })
+        
+        compiled = preprocessor.transform(df)
+        monkeypatch.setattr(preprocessor_module, 'NUMBA_AVAILABLE', False)
+        expected = preprocessor.transform(df)
+        
+        np.testing.assert_array_equal(compiled, expected)
+    
+    def test_preprocess_batch_iter_matches_batch(self, tmp_path):
+        """Test that chunked preprocessing yields the same rows as one batch."""
+        preprocessor = LoanPreprocessor()
+        df = pd.DataFrame({
+            'Gender': ['Male', 'Female', 'Male', 'Female', 'Male'],
+            'ApplicantIncome': [5000, 6000, 7000, 8000, 9000]
+        })
+        preprocessor.fit(df)
+        expected = preprocessor.preprocess_batch(df)
+        
+        chunks = list(preprocessor.preprocess_batch_iter(df, chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        np.testing.assert_array_equal(np.vstack(chunks), expected)
+        
+        records = iter(df.to_dict('records'))
+        np.testing.assert_allclose(np.vstack(list(preprocessor.preprocess_batch_iter(records, chunk_size=2))), expected)
+        
+        csv_path = tmp_path / 'applications.csv'
+        df.assign(Loan_ID=range(5)).to_csv(csv_path, index=False)
+        np.testing.assert_array_equal(np.vstack(list(preprocessor.preprocess_csv_iter(str(csv_path), chunk_size=3))), expected)
+    
+    def test_onehot_encoding(self):
+        """Test one-hot encoding returns a sparse matrix with one column per category."""
+        preprocessor = LoanPreprocessor(encoding='onehot')
+        train_df = pd.DataFrame({
+            'Gender': ['Male', 'Female', 'Male'],
+            'Property_Area': ['Urban', 'Rural', 'Semiurban'],
+            'ApplicantIncome': [5000, 6000, 7000]
+        })
+        preprocessor.fit(train_df)
+        
+        result = preprocessor.preprocess_batch([
+            {'Gender': 'Female', 'Property_Area': 'Urban', 'ApplicantIncome': 5500},
+            {'Gender': 'Unknown', 'Property_Area': 'Rural', 'ApplicantIncome': 6500}
+        ])
+        
+        assert hasattr(result, 'tocsr')
+        assert result.shape == (2, 6)
+        assert 'Gender_Female' in preprocessor.get_feature_names_out()
+        dense = result.toarray()
+        # Unseen categories encode as all zeros
+        assert dense[1, preprocessor.get_feature_names_out().index('Gender_Female')] == 0
+        assert dense[1, preprocessor.get_feature_names_out().index('Gender_Male')] == 0
 
 
 class TestHandleMissingValues:
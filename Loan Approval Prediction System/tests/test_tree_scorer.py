@@ -0,0 +1,47 @@
+"""
+Tests for the compiled tree ensemble scorer.
+"""
+
+import pytest
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from models.tree_scorer import ForestScorer, NUMBA_AVAILABLE, export_forest
+
+
+@pytest.fixture
+def training_data():
+    """Create a small binary classification problem."""
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(200, 5))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int)
+    return X, y
+
+
+class TestForestScorer:
+    """Test cases for ForestScorer."""
+    
+    def test_matches_sklearn(self, training_data):
+        """Test that compiled scoring reproduces predict_proba and predict."""
+        X, y = training_data
+        model = RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+        scorer = ForestScorer(export_forest(model), model.classes_)
+        
+        predictions, positive = scorer.predict(X[:50])
+        
+        np.testing.assert_allclose(positive, model.predict_proba(X[:50])[:, 1])
+        np.testing.assert_array_equal(predictions, model.predict(X[:50]))
+    
+    def test_non_forest_not_exported(self, training_data):
+        """Test that models without sklearn trees are left to sklearn."""
+        X, y = training_data
+        model = LogisticRegression().fit(X, y)
+        assert export_forest(model) is None
+        assert ForestScorer.from_model(model) is None
+    
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_from_model(self, training_data):
+        """Test building a scorer straight from a fitted forest."""
+        X, y = training_data
+        model = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+        assert ForestScorer.from_model(model) is not None
@@ -95,4 +95,52 @@ class TestLoanApplicationValidator:
         assert sanitized['Married'] == 'yes'
         assert isinstance(sanitized['ApplicantIncome'], float)
         assert isinstance(sanitized['LoanAmount'], float)
+    
+    def test_parse_application_matches_sanitize_and_validate(self):
+        """Test that parse_application returns the same data and errors as the two-step path."""
+        valid_data = {
+            'Gender': ' Male ',
+            'Married': 'Yes',
+            'Dependents': 0,
+            'Education': 'Graduate',
+            'Self_Employed': 'No',
+            'ApplicantIncome': '5000',
+            'CoapplicantIncome': 2000,
+            'LoanAmount': 150000,
+            'Loan_Amount_Term': 360,
+            'Credit_History': 1,
+            'Property_Area': 'Urban'
+        }
+        cases = [
+            valid_data,
+            {**valid_data, 'Gender': 'Unknown'},
+            {**valid_data, 'ApplicantIncome': 'abc'},
+            {**valid_data, 'LoanAmount': 0},
+            {**valid_data, 'Credit_History': 0.5},
+            {k: v for k, v in valid_data.items() if k != 'Property_Area'},
+            {k: v for k, v in valid_data.items() if k not in ('Property_Area', 'Credit_History')},
+            {**valid_data, 'Dependents': ' 0'},
+            {**valid_data, 'Married': '\x1cYes\t'},
+            {**valid_data, 'Loan_Amount_Term': '\u0663\u0666\u0660'},  # Arabic-Indic 360
+            {**valid_data, 'Gender': 'Other', 'LoanAmount': -1},
+        ]
+        
+        for data in cases:
+            sanitized = LoanApplicationValidator.sanitize_input(data)
+            is_valid, error = LoanApplicationValidator.validate_application(sanitized)
+            expected = (sanitized, None) if is_valid else (None, error)
+            assert LoanApplicationValidator.parse_application(data) == expected
+    
+    def test_parse_application_accepts_nan_like_validate_application(self):
+        """Test that NaN amounts, which pass validate_application's range checks, are accepted."""
+        data = {
+            'Gender': 'Female', 'Married': 'No', 'Dependents': '1', 'Education': 'Graduate',
+            'Self_Employed': 'No', 'ApplicantIncome': 5000, 'CoapplicantIncome': 'nan',
+            'LoanAmount': 150000, 'Loan_Amount_Term': 360, 'Credit_History': 1.0, 'Property_Area': 'Rural'
+        }
+        
+        sanitized, error = LoanApplicationValidator.parse_application(data)
+        
+        assert error is None
+        assert sanitized['CoapplicantIncome'] != sanitized['CoapplicantIncome']  # NaN
 
@@ -0,0 +1,89 @@
+"""
+Smoke test for serving the app through wsgi.py under gunicorn.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+from models.loan_model import LoanModelTrainer
+
+try:
+    import gunicorn  # noqa: F401
+    GUNICORN_AVAILABLE = True
+except ImportError:
+    GUNICORN_AVAILABLE = False
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _request(url, payload=None, timeout=30):
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status, json.loads(response.read())
+
+
+@pytest.mark.skipif(not GUNICORN_AVAILABLE, reason="gunicorn not installed")
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="gunicorn requires os.fork")
+@pytest.mark.skipif(
+    not LoanModelTrainer.saved_model_exists(str(PROJECT_DIR / 'models' / 'trained_models')),
+    reason="no trained model"
+)
+class TestPreloadedGunicorn:
+    """Test the documented production command end to end."""
+    
+    def test_preloaded_workers_answer_predictions(self):
+        """Test that workers forked from a warmed-up master serve /api/predict."""
+        port = _free_port()
+        env = dict(os.environ, WARMUP_ON_START='1')
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-w', '2', '--preload',
+             '-b', f'127.0.0.1:{port}', 'wsgi:application'],
+            cwd=PROJECT_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        base = f'http://127.0.0.1:{port}'
+        try:
+            deadline = time.monotonic() + 60
+            while True:
+                try:
+                    _request(f'{base}/api/health', timeout=5)
+                    break
+                except (urllib.error.URLError, ConnectionError):
+                    if server.poll() is not None or time.monotonic() > deadline:
+                        pytest.fail("gunicorn did not start")
+                    time.sleep(0.2)
+            
+            application = {
+                'Gender': 'Male', 'Married': 'Yes', 'Dependents': '0',
+                'Education': 'Graduate', 'Self_Employed': 'No',
+                'ApplicantIncome': 5000, 'CoapplicantIncome': 2000,
+                'LoanAmount': 150000, 'Loan_Amount_Term': 360,
+                'Credit_History': 1.0, 'Property_Area': 'Urban'
+            }
+            # Several requests so both workers are likely to be exercised
+            for _ in range(4):
+                status, body = _request(f'{base}/api/predict', application)
+                assert status == 200
+                assert body['prediction'] in ('Approved', 'Rejected')
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
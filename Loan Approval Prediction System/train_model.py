@@ -4,6 +4,7 @@ Run this script after generating the dataset to train the models.
 """
 
 import logging
+import sys
 from pathlib import Path
 from models.loan_model import train_and_save_model
 
@@ -17,7 +18,7 @@ if __name__ == '__main__':
     if not dataset_path.exists():
         logger.error(f"Dataset not found at {dataset_path}")
         logger.info("Please run 'python generate_dataset.py' first to generate the dataset.")
-        exit(1)
+        sys.exit(1)
     
     logger.info("Starting model training...")
     logger.info(f"Dataset: {dataset_path}")
@@ -47,8 +48,6 @@ if __name__ == '__main__':
         logger.info("\nYou can now start the Flask application with: python app.py")
         
     except Exception as e:
-        logger.error(f"Error during training: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        exit(1)
+        logger.exception("Error during training: %s", e)
+        sys.exit(1)
 
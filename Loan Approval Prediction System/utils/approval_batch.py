@@ -0,0 +1,279 @@
+"""
+Vectorized loan approval checks for many applications at once (e.g.
+backtesting a CSV of applications).
+
+The batch feature builders derive the same features as the single-application
+checkers in utils.approval_engine, column-wise, and the same rule tables are
+evaluated over whole columns; reason strings are only formatted for the rows a
+rule rejects. Kept apart from the rules engine so the web app can check single
+applications without importing pandas.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.approval_engine import (
+    BUSINESS_RULES, CAR_RULES, EDUCATION_RULES, HOME_RULES, PERSONAL_RULES,
+    Rule, _COMPARISONS, _MONTHLY_RATES
+)
+
+
+def _numbers(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+    """Numeric column as an array, with default where it is missing (like data.get)."""
+    if column not in df:
+        return np.full(len(df), default)
+    return pd.to_numeric(df[column]).fillna(default).to_numpy()
+
+
+def _optional_numbers(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Numeric column as an array, NaN where no value was provided."""
+    if column not in df:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column]).to_numpy()
+
+
+def _as_written(values: np.ndarray) -> np.ndarray:
+    """
+    Values for reason text. Integer columns that held a missing value were
+    widened to float by pandas; their whole numbers are shown without '.0'.
+    """
+    if values.dtype.kind != 'f':
+        return values
+    shown = values.astype(object)
+    whole = np.isfinite(values) & (values == np.trunc(values))
+    shown[whole] = values[whole].astype(np.int64)
+    return shown
+
+
+def _stripped_lengths(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Length of each value in a text column after strip(); 0 where missing."""
+    if column not in df:
+        return np.zeros(len(df), dtype=int)
+    values = df[column]
+    if isinstance(values.dtype, pd.StringDtype):
+        # Already strings: strip in place of a filled copy, missing counts as 0
+        return values.str.strip().str.len().fillna(0).to_numpy(dtype=int)
+    return values.fillna('').astype(str).str.strip().str.len().to_numpy()
+
+
+def _emi_ratio(loan_amount: np.ndarray, monthly_rate: float, tenure_months: np.ndarray,
+               monthly_income: np.ndarray) -> np.ndarray:
+    """EMI as a percentage of monthly income (100 where there is no income)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = np.power(1 + monthly_rate, tenure_months)
+        emi = loan_amount * monthly_rate * growth / (growth - 1)
+        return np.where(monthly_income > 0, (emi / monthly_income) * 100, 100)
+
+
+def _rule_mask(rule: Rule, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Rows whose features fail rule (NaN, i.e. missing, never fails a comparison)."""
+    value = columns[rule.key]
+    if rule.op == 'missing':
+        return pd.isna(value)
+    threshold = columns[rule.threshold] if isinstance(rule.threshold, str) else rule.threshold
+    if rule.op == 'outside':
+        return (value < threshold[0]) | (value > threshold[1])
+    return _COMPARISONS[rule.op](value, threshold)
+
+
+def _apply_rules(rules: List[Rule], columns: Dict[str, np.ndarray],
+                 n_rows: int) -> Tuple[np.ndarray, Dict[int, np.ndarray]]:
+    """
+    Reject each row on the first final rule it fails, like the compiled
+    check does for a single application. Only masks are computed; reason strings are
+    left to _format_reasons.
+    
+    Args:
+        rules: Rule table for the loan type
+        columns: Feature arrays, one value per row
+        n_rows: Number of applications
+    
+    Returns:
+        Tuple of (index of the rule that rejected each row, -1 if approved;
+        mask of the rows each non-final rule noted, by rule index)
+    """
+    rejected_by = np.full(n_rows, -1)
+    noted = {}
+    pending = np.ones(n_rows, dtype=bool)
+    for index, rule in enumerate(rules):
+        failed = pending & _rule_mask(rule, columns)
+        if rule.final:
+            rejected_by[failed] = index
+            pending &= ~failed
+        else:
+            noted[index] = failed
+    return rejected_by, noted
+
+
+def _format_reasons(rules: List[Rule], columns: Dict[str, np.ndarray], rejected_by: np.ndarray,
+                    noted: Dict[int, np.ndarray]) -> List[Optional[str]]:
+    """Rejection reason per row (None if approved), formatted only for rows each rule rejected."""
+    reasons = np.full(len(rejected_by), None, dtype=object)
+    # Walk the rules backwards so notes end up in front of the reasons of
+    # later rejections, in rule order
+    for index in range(len(rules) - 1, -1, -1):
+        rule = rules[index]
+        if rule.final:
+            rows = np.flatnonzero(rejected_by == index)
+        else:
+            rows = np.flatnonzero(noted[index] & (rejected_by > index))
+        if rule.shown:
+            texts = [
+                rule.reason.format(*row)
+                for row in zip(*(_as_written(columns[name][rows]).tolist() for name in rule.shown))
+            ]
+        else:
+            texts = [rule.reason] * len(rows)
+        if rule.final:
+            reasons[rows] = texts
+        else:
+            reasons[rows] = [f'{note}; {reason}' for note, reason in zip(texts, reasons[rows])]
+    return reasons.tolist()
+
+
+def _education_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column-wise features of check_education_loan."""
+    applicant_income = _numbers(df, 'applicant_annual_income', 0)
+    parent_income = _numbers(df, 'parent_guardian_income', 0)
+    return {
+        'age': _numbers(df, 'age', 0),
+        'applicant_income': applicant_income,
+        'parent_income': parent_income,
+        'combined_income': applicant_income + parent_income,
+        'course_name_length': _stripped_lengths(df, 'course_name'),
+        'institution_name_length': _stripped_lengths(df, 'institution_name'),
+        'credit_history': _optional_numbers(df, 'credit_history'),
+        'loan_amount': _numbers(df, 'loan_amount_required', 0),
+        'max_loan_by_income': parent_income * 15,
+    }
+
+
+def _home_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column-wise features of check_home_loan."""
+    annual_income = _numbers(df, 'annual_income', 0)
+    loan_amount = _numbers(df, 'loan_amount_required', 0)
+    property_value = _numbers(df, 'property_value', 0)
+    monthly_income = np.where(annual_income > 0, annual_income / 12, 0)
+    total_monthly_income = monthly_income + (_numbers(df, 'co_applicant_income', 0) / 12)
+    return {
+        'age': _numbers(df, 'age', 0),
+        'total_monthly_income': total_monthly_income,
+        'loan_amount': loan_amount,
+        'credit_score': _optional_numbers(df, 'credit_score'),
+        'max_loan_by_property': np.where(property_value > 0, property_value * 0.80, np.inf),
+        'emi_ratio': _emi_ratio(loan_amount, _MONTHLY_RATES['home'], _numbers(df, 'loan_tenure', 20) * 12,
+                                total_monthly_income),
+    }
+
+
+def _car_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column-wise features of check_car_loan."""
+    monthly_income = _numbers(df, 'monthly_income', 0)
+    annual_income = _numbers(df, 'annual_income', 0)
+    monthly_income = np.where((monthly_income == 0) & (annual_income > 0), annual_income / 12, monthly_income)
+    car_price = _numbers(df, 'car_price', 0)
+    loan_amount = _numbers(df, 'loan_amount_required', 0)
+    return {
+        'monthly_income': monthly_income,
+        'credit_score': _optional_numbers(df, 'credit_score'),
+        'down_payment': _numbers(df, 'down_payment', 0),
+        'min_down_payment': np.where(car_price > 0, car_price * 0.10, -np.inf),
+        'work_experience': _numbers(df, 'work_experience', 0),
+        'emi_ratio': _emi_ratio(loan_amount, _MONTHLY_RATES['car'], _numbers(df, 'loan_tenure', 60), monthly_income),
+    }
+
+
+def _personal_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column-wise features of check_personal_loan."""
+    monthly_income = _numbers(df, 'monthly_income', 0)
+    loan_amount = _numbers(df, 'loan_amount_required', 0)
+    return {
+        'monthly_income': monthly_income,
+        'credit_score': _optional_numbers(df, 'credit_score'),
+        'work_experience': _numbers(df, 'work_experience', 0),
+        'loan_amount': loan_amount,
+        'max_loan_by_salary': monthly_income * 12,
+        'emi_ratio': _emi_ratio(loan_amount, _MONTHLY_RATES['personal'], _numbers(df, 'loan_tenure', 36),
+                                monthly_income),
+    }
+
+
+def _business_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column-wise features of check_business_loan."""
+    annual_turnover = _numbers(df, 'annual_turnover', 0)
+    estimated_profit = annual_turnover * 0.10
+    return {
+        'business_age': _numbers(df, 'business_age', 0),
+        'annual_turnover': annual_turnover,
+        'gst_number_length': _stripped_lengths(df, 'gst_number'),
+        'credit_score': _optional_numbers(df, 'credit_score'),
+        'loan_amount': _numbers(df, 'loan_amount_required', 0),
+        'max_loan_by_profit': estimated_profit * 3,
+    }
+
+
+_BATCH_CHECKS = {
+    'education': (EDUCATION_RULES, _education_columns),
+    'home': (HOME_RULES, _home_columns),
+    'car': (CAR_RULES, _car_columns),
+    'personal': (PERSONAL_RULES, _personal_columns),
+    'business': (BUSINESS_RULES, _business_columns),
+}
+
+
+def check_loans_batch(loan_type: str, df: pd.DataFrame, with_reasons: bool = True,
+                      n_jobs: Optional[int] = 1) -> pd.DataFrame:
+    """
+    Check loan approval for many applications of one loan type at once.
+    
+    Applies the same rules as check_loan_approval to every row of df, with
+    the threshold and EMI checks evaluated column-wise. Missing columns and
+    NaN values take the same defaults as missing keys do for a single
+    application (a NaN credit score counts as not provided).
+    
+    Args:
+        loan_type: Type of loan (education, home, car, personal, business)
+        df: One application per row, with the application dict fields as columns
+        with_reasons: Also build the reason strings; callers that only need
+            the decisions can skip all string formatting
+        n_jobs: Worker processes to split the rows across (-1: one per CPU
+            core). Worth it for large batches with reasons, where formatting
+            the reason strings dominates; the default checks in-process.
+    
+    Returns:
+        DataFrame indexed like df with an 'approved' (bool) column, plus a
+        'reason' (str) column if with_reasons
+    """
+    loan_type = loan_type.lower()
+    if loan_type not in _BATCH_CHECKS:
+        result = pd.DataFrame({'approved': np.zeros(len(df), dtype=bool)}, index=df.index)
+        if with_reasons:
+            result['reason'] = f'Unknown loan type: {loan_type}'
+        return result
+    
+    if n_jobs != 1:
+        # Only the parallel path needs joblib
+        from joblib import effective_n_jobs
+        n_jobs = min(effective_n_jobs(n_jobs), len(df))
+    if n_jobs > 1:
+        from joblib import Parallel, delayed
+        bounds = np.linspace(0, len(df), n_jobs + 1).astype(int)
+        parts = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(check_loans_batch)(loan_type, df.iloc[start:stop], with_reasons)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        )
+        return pd.concat(parts)
+    
+    rules, build_columns = _BATCH_CHECKS[loan_type]
+    columns = build_columns(df)
+    rejected_by, noted = _apply_rules(rules, columns, len(df))
+    result = pd.DataFrame({'approved': rejected_by < 0}, index=df.index)
+    if with_reasons:
+        approval_reason = f'Application meets all eligibility criteria for {loan_type} loan'
+        result['reason'] = [
+            approval_reason if reason is None else reason
+            for reason in _format_reasons(rules, columns, rejected_by, noted)
+        ]
+    return result
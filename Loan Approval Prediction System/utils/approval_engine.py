@@ -3,13 +3,196 @@ Loan Approval Rules Engine.
 
 This module contains the approval logic for different loan types based on
 threshold rules and eligibility criteria.
+
+Each loan type's criteria are a table of Rule entries, checked in order
+against features derived from the application. The same tables drive the
+single-application checks (compiled to straight-line functions at import)
+and the vectorized batch checks in utils.approval_batch.
 """
 
-from typing import Dict, Optional
+from typing import Callable, Dict, List, NamedTuple, Tuple
 import logging
+import operator
+
+from utils.emi_calculator import INTEREST_RATES
 
 logger = logging.getLogger(__name__)
 
+# Monthly interest rate per loan type, derived once from the annual rates
+_MONTHLY_RATES = {loan_type: (rate / 100) / 12 for loan_type, rate in INTEREST_RATES.items()}
+
+
+class Rule(NamedTuple):
+    """
+    One eligibility rule: the application fails it when feature `key`
+    compares true under `op` against `threshold`.
+    
+    op is '<', '>', '>=', 'outside' (threshold is a (low, high) range) or
+    'missing' (the feature was not provided). A string threshold names
+    another feature. A missing value never fails a comparison.
+    
+    reason is formatted with the `shown` features. A final rule rejects the
+    application; a non-final one only notes its reason in front of a later
+    rejection.
+    """
+    key: str
+    op: str
+    threshold: object
+    reason: str
+    shown: Tuple[str, ...] = ()
+    final: bool = True
+
+
+_COMPARISONS = {
+    '<': operator.lt,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def _monthly_emi(principal: float, monthly_rate: float, tenure_months: float) -> float:
+    """
+    EMI for a loan: P * r * (1+r)^n / ((1+r)^n - 1), with r the monthly
+    rate and n the tenure in months.
+    """
+    if monthly_rate > 0:
+        growth = (1 + monthly_rate) ** tenure_months
+        return principal * monthly_rate * growth / (growth - 1)
+    return principal / tenure_months
+
+
+def _compile_rules(rules: List[Rule], loan_type: str) -> Callable[[Dict], Dict]:
+    """
+    Compile a rule table into a function that checks an application's
+    features against it, stopping at the first rejection.
+    
+    The generated code tests each rule inline with its threshold as a
+    literal, instead of looking up and dispatching on the Rule fields for
+    every application.
+    """
+    has_notes = any(not rule.final for rule in rules)
+    namespace = {}
+    lines = [f'def _evaluate_{loan_type}(features):']
+    if has_notes:
+        lines.append("    notes = ''")
+    
+    for i, (key, op, threshold, reason, shown, final) in enumerate(rules):
+        value = f'features[{key!r}]'
+        if op == 'missing':
+            condition = f'{value} is None'
+        else:
+            if isinstance(threshold, str):
+                threshold = f'features[{threshold!r}]'
+            if op == 'outside':
+                low, high = threshold
+                test = f'value < {low!r} or value > {high!r}'
+            elif op in _COMPARISONS:
+                test = f'value {op} {threshold!s}'
+            else:
+                raise ValueError(f"Unknown rule operator: {op}")
+            lines.append(f'    value = {value}')
+            condition = f'value is not None and ({test})'
+        
+        namespace[f'_reason_{i}'] = reason
+        message = f"_reason_{i}.format({''.join(f'features[{name!r}], ' for name in shown)})"
+        lines.append(f'    if {condition}:')
+        if not final:
+            lines.append(f"        notes += {message} + '; '")
+        elif has_notes:
+            lines.append(f"        return {{'approved': False, 'reason': notes + {message}}}")
+        else:
+            lines.append(f"        return {{'approved': False, 'reason': {message}}}")
+    
+    # All checks passed
+    approved_reason = f'Application meets all eligibility criteria for {loan_type} loan'
+    lines.append(f"    return {{'approved': True, 'reason': {approved_reason!r}}}")
+    
+    exec(compile('\n'.join(lines), f'<{loan_type} rules>', 'exec'), namespace)
+    return namespace[f'_evaluate_{loan_type}']
+
+
+EDUCATION_RULES = [
+    Rule('age', '<', 18, "Applicant age ({}) is below minimum requirement (18 years)", ('age',)),
+    # No minimum applicant income - can be 0 for students
+    Rule('applicant_income', '<', 0, "Applicant income cannot be negative"),
+    Rule('parent_income', '<', 150000,
+         "Parent/Guardian income (₹{:,.0f}) is below minimum requirement (₹1,50,000/year)",
+         ('parent_income',), final=False),
+    Rule('combined_income', '<', 150000,
+         "Combined income (₹{:,.0f}) is below minimum requirement (₹1,50,000/year)", ('combined_income',)),
+    Rule('course_name_length', '<', 3, "Course name is invalid or missing"),
+    Rule('institution_name_length', '<', 3, "Institution name is invalid or missing"),
+    Rule('credit_history', '<', 0.5, "Credit history ({}) is below minimum requirement (0.5)",
+         ('credit_history',)),
+    Rule('loan_amount', '>', 'max_loan_by_income',
+         "Loan amount (₹{:,.0f}) exceeds maximum allowed (15× parent income = ₹{:,.0f})",
+         ('loan_amount', 'max_loan_by_income')),
+    # ₹15 Lakhs = 1,500,000
+    Rule('loan_amount', '>', 1500000, "Loan amount (₹{:,.0f}) exceeds maximum limit (₹15 Lakhs)",
+         ('loan_amount',)),
+]
+
+HOME_RULES = [
+    Rule('age', 'outside', (21, 60), "Applicant age ({}) is outside acceptable range (21-60 years)", ('age',)),
+    Rule('total_monthly_income', '<', 35000,
+         "Monthly income (₹{:,.0f}) is below minimum requirement (₹35,000/month)", ('total_monthly_income',)),
+    Rule('loan_amount', '<', 500000, "Loan amount (₹{:,.0f}) is below minimum requirement (₹5,00,000)",
+         ('loan_amount',)),
+    Rule('credit_score', 'missing', None, "Credit score is required but not provided"),
+    Rule('credit_score', '<', 650, "Credit score ({}) is below minimum requirement (650)", ('credit_score',)),
+    Rule('loan_amount', '>', 'max_loan_by_property',
+         "Loan amount (₹{:,.0f}) exceeds 80% of property value (₹{:,.0f})",
+         ('loan_amount', 'max_loan_by_property')),
+    Rule('emi_ratio', '>', 40, "EMI-to-income ratio ({:.1f}%) exceeds maximum allowed (40%)", ('emi_ratio',)),
+]
+
+CAR_RULES = [
+    Rule('monthly_income', '<', 20000,
+         "Monthly income (₹{:,.0f}) is below minimum requirement (₹20,000/month)", ('monthly_income',)),
+    Rule('credit_score', 'missing', None, "Credit score is required but not provided"),
+    Rule('credit_score', '<', 600, "Credit score ({}) is below minimum requirement (600)", ('credit_score',)),
+    Rule('down_payment', '<', 'min_down_payment',
+         "Down payment (₹{:,.0f}) is below minimum requirement (10% of car price = ₹{:,.0f})",
+         ('down_payment', 'min_down_payment')),
+    Rule('work_experience', '<', 1, "Work experience ({} years) is below minimum requirement (1 year)",
+         ('work_experience',)),
+    Rule('emi_ratio', '>', 40, "EMI-to-income ratio ({:.1f}%) exceeds maximum allowed (40%)", ('emi_ratio',)),
+]
+
+PERSONAL_RULES = [
+    Rule('monthly_income', '<', 25000,
+         "Monthly salary (₹{:,.0f}) is below minimum requirement (₹25,000/month)", ('monthly_income',)),
+    Rule('credit_score', 'missing', None, "Credit score is required but not provided"),
+    Rule('credit_score', '<', 650, "Credit score ({}) is below minimum requirement (650)", ('credit_score',)),
+    Rule('work_experience', '<', 1, "Work experience ({} years) is below minimum requirement (1 year)",
+         ('work_experience',)),
+    Rule('loan_amount', '>', 'max_loan_by_salary',
+         "Loan amount (₹{:,.0f}) exceeds maximum allowed (12× monthly salary = ₹{:,.0f})",
+         ('loan_amount', 'max_loan_by_salary')),
+    Rule('emi_ratio', '>=', 50, "EMI-to-income ratio ({:.1f}%) exceeds maximum allowed (50%)", ('emi_ratio',)),
+]
+
+BUSINESS_RULES = [
+    Rule('business_age', '<', 2, "Business age ({} years) is below minimum requirement (2 years)",
+         ('business_age',)),
+    # ₹10 Lakhs = 1,000,000
+    Rule('annual_turnover', '<', 1000000,
+         "Annual turnover (₹{:,.0f}) is below minimum requirement (₹10 Lakhs)", ('annual_turnover',)),
+    # Basic check - a GST number should be 15 characters
+    Rule('gst_number_length', '<', 15, "GST number is invalid or missing (should be 15 characters)"),
+    Rule('credit_score', 'missing', None, "Credit score is required but not provided"),
+    Rule('credit_score', '<', 600, "Credit score ({}) is below minimum requirement (600)", ('credit_score',)),
+    Rule('loan_amount', '>', 'max_loan_by_profit',
+         "Loan amount (₹{:,.0f}) exceeds maximum allowed (3× estimated annual profit = ₹{:,.0f})",
+         ('loan_amount', 'max_loan_by_profit')),
+]
+
+_evaluate_education = _compile_rules(EDUCATION_RULES, 'education')
+_evaluate_home = _compile_rules(HOME_RULES, 'home')
+_evaluate_car = _compile_rules(CAR_RULES, 'car')
+_evaluate_personal = _compile_rules(PERSONAL_RULES, 'personal')
+_evaluate_business = _compile_rules(BUSINESS_RULES, 'business')
+
 
 def check_education_loan(data: Dict) -> Dict:
     """
@@ -29,68 +212,20 @@ def check_education_loan(data: Dict) -> Dict:
     - Credit history ≥ 0.5 (if provided)
     - Loan ≤ ₹15 Lakhs
     """
-    reasons = []
-    
-    # Extract data
-    age = data.get('age', 0)
     applicant_income = data.get('applicant_annual_income', 0)
     parent_income = data.get('parent_guardian_income', 0)
-    course_name = data.get('course_name', '').strip()
-    institution_name = data.get('institution_name', '').strip()
-    institution_type = data.get('institution_type', '').strip()
-    loan_amount = data.get('loan_amount_required', 0)
-    credit_history = data.get('credit_history', None)  # Optional field
-    
-    # Check minimum age
-    if age < 18:
-        reasons.append(f"Applicant age ({age}) is below minimum requirement (18 years)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check applicant income (no minimum requirement - can be 0 for students)
-    if applicant_income < 0:
-        reasons.append(f"Applicant income cannot be negative")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check parent/guardian income
-    if parent_income < 150000:
-        reasons.append(f"Parent/Guardian income (₹{parent_income:,.0f}) is below minimum requirement (₹1,50,000/year)")
-    
-    # Check combined income
-    combined_income = applicant_income + parent_income
-    if combined_income < 150000:
-        reasons.append(f"Combined income (₹{combined_income:,.0f}) is below minimum requirement (₹1,50,000/year)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check course validity
-    if not course_name or len(course_name) < 3:
-        reasons.append("Course name is invalid or missing")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    if not institution_name or len(institution_name) < 3:
-        reasons.append("Institution name is invalid or missing")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check credit history if provided
-    if credit_history is not None and credit_history < 0.5:
-        reasons.append(f"Credit history ({credit_history}) is below minimum requirement (0.5)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check loan amount vs parent income
-    max_loan_by_income = parent_income * 15
-    if loan_amount > max_loan_by_income:
-        reasons.append(f"Loan amount (₹{loan_amount:,.0f}) exceeds maximum allowed (15× parent income = ₹{max_loan_by_income:,.0f})")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check loan amount limit (₹15 Lakhs = 1,500,000)
-    if loan_amount > 1500000:
-        reasons.append(f"Loan amount (₹{loan_amount:,.0f}) exceeds maximum limit (₹15 Lakhs)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # All checks passed
-    return {
-        'approved': True,
-        'reason': 'Application meets all eligibility criteria for education loan'
+    features = {
+        'age': data.get('age', 0),
+        'applicant_income': applicant_income,
+        'parent_income': parent_income,
+        'combined_income': applicant_income + parent_income,
+        'course_name_length': len(data.get('course_name', '').strip()),
+        'institution_name_length': len(data.get('institution_name', '').strip()),
+        'credit_history': data.get('credit_history', None),  # Optional field
+        'loan_amount': data.get('loan_amount_required', 0),
+        'max_loan_by_income': parent_income * 15,
     }
+    return _evaluate_education(features)
 
 
 def check_home_loan(data: Dict) -> Dict:
@@ -111,79 +246,28 @@ def check_home_loan(data: Dict) -> Dict:
     - Loan amount reasonable compared to property value
     - Income ≥ ₹35,000
     """
-    reasons = []
-    
-    # Extract data
-    age = data.get('age', 0)
     annual_income = data.get('annual_income', 0)
     monthly_income = annual_income / 12 if annual_income > 0 else 0
     loan_amount = data.get('loan_amount_required', 0)
     property_value = data.get('property_value', 0)
-    credit_score = data.get('credit_score', None)
-    existing_emi = data.get('existing_emi', 'No')
     loan_tenure = data.get('loan_tenure', 20)  # years
-    co_applicant_income = data.get('co_applicant_income', 0)
-    
-    # Calculate total monthly income (including co-applicant)
-    total_monthly_income = monthly_income + (co_applicant_income / 12)
     
-    # Check age
-    if age < 21 or age > 60:
-        reasons.append(f"Applicant age ({age}) is outside acceptable range (21-60 years)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
+    # Total monthly income includes the co-applicant's
+    total_monthly_income = monthly_income + (data.get('co_applicant_income', 0) / 12)
     
-    # Check minimum monthly income
-    if total_monthly_income < 35000:
-        reasons.append(f"Monthly income (₹{total_monthly_income:,.0f}) is below minimum requirement (₹35,000/month)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
+    # EMI at the 9% home loan rate, as a share of monthly income
+    emi = _monthly_emi(loan_amount, _MONTHLY_RATES['home'], loan_tenure * 12)
     
-    # Check minimum loan amount
-    if loan_amount < 500000:
-        reasons.append(f"Loan amount (₹{loan_amount:,.0f}) is below minimum requirement (₹5,00,000)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check credit score
-    if credit_score is None:
-        reasons.append("Credit score is required but not provided")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    if credit_score < 650:
-        reasons.append(f"Credit score ({credit_score}) is below minimum requirement (650)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check loan amount vs property value (should be ≤ 80%)
-    if property_value > 0:
-        max_loan_by_property = property_value * 0.80
-        if loan_amount > max_loan_by_property:
-            reasons.append(f"Loan amount (₹{loan_amount:,.0f}) exceeds 80% of property value (₹{max_loan_by_property:,.0f})")
-            return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Calculate EMI (using 9% interest rate for home loans)
-    # EMI = P * r * (1+r)^n / ((1+r)^n - 1)
-    monthly_rate = (9.0 / 100) / 12
-    tenure_months = loan_tenure * 12
-    if monthly_rate > 0:
-        emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        emi = loan_amount / tenure_months
-    
-    # Check EMI-to-income ratio (should be ≤ 40%)
-    emi_ratio = (emi / total_monthly_income) * 100 if total_monthly_income > 0 else 100
-    if emi_ratio > 40:
-        reasons.append(f"EMI-to-income ratio ({emi_ratio:.1f}%) exceeds maximum allowed (40%)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check existing EMI burden
-    if existing_emi.lower() == 'yes':
-        # If existing EMI info is not provided, we can't verify, so we'll be conservative
-        # For now, we'll just check that the new EMI doesn't exceed 40% of income
-        pass  # Already checked above
-    
-    # All checks passed
-    return {
-        'approved': True,
-        'reason': 'Application meets all eligibility criteria for home loan'
+    features = {
+        'age': data.get('age', 0),
+        'total_monthly_income': total_monthly_income,
+        'loan_amount': loan_amount,
+        'credit_score': data.get('credit_score', None),
+        # Loan should be ≤ 80% of the property value, when one is given
+        'max_loan_by_property': property_value * 0.80 if property_value > 0 else float('inf'),
+        'emi_ratio': (emi / total_monthly_income) * 100 if total_monthly_income > 0 else 100,
     }
+    return _evaluate_home(features)
 
 
 def check_car_loan(data: Dict) -> Dict:
@@ -202,70 +286,32 @@ def check_car_loan(data: Dict) -> Dict:
     - Credit Score ≥ 600
     - Down payment ≥ 10%
     - EMI ≤ 40% of income
-    """
-    reasons = []
     
-    # Extract data
+    Note: the vehicle age check would require the year of manufacture,
+    which is not in the schema, so it is skipped.
+    """
     monthly_income = data.get('monthly_income', 0)
     annual_income = data.get('annual_income', 0)
     if monthly_income == 0 and annual_income > 0:
         monthly_income = annual_income / 12
     
-    credit_score = data.get('credit_score', None)
     car_price = data.get('car_price', 0)
-    down_payment = data.get('down_payment', 0)
     loan_amount = data.get('loan_amount_required', 0)
-    car_type = data.get('car_type', '').strip()
-    work_experience = data.get('work_experience', 0)
     loan_tenure = data.get('loan_tenure', 60)  # months
     
-    # Check minimum monthly income
-    if monthly_income < 20000:
-        reasons.append(f"Monthly income (₹{monthly_income:,.0f}) is below minimum requirement (₹20,000/month)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check credit score
-    if credit_score is None:
-        reasons.append("Credit score is required but not provided")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    if credit_score < 600:
-        reasons.append(f"Credit score ({credit_score}) is below minimum requirement (600)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check down payment (should be ≥ 10% of car price)
-    if car_price > 0:
-        min_down_payment = car_price * 0.10
-        if down_payment < min_down_payment:
-            reasons.append(f"Down payment (₹{down_payment:,.0f}) is below minimum requirement (10% of car price = ₹{min_down_payment:,.0f})")
-            return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check work experience
-    if work_experience < 1:
-        reasons.append(f"Work experience ({work_experience} years) is below minimum requirement (1 year)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Calculate EMI (using 10.5% interest rate for car loans)
-    monthly_rate = (10.5 / 100) / 12
-    if monthly_rate > 0:
-        emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** loan_tenure) / (((1 + monthly_rate) ** loan_tenure) - 1)
-    else:
-        emi = loan_amount / loan_tenure
-    
-    # Check EMI-to-income ratio (should be ≤ 40%)
-    emi_ratio = (emi / monthly_income) * 100 if monthly_income > 0 else 100
-    if emi_ratio > 40:
-        reasons.append(f"EMI-to-income ratio ({emi_ratio:.1f}%) exceeds maximum allowed (40%)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Note: Vehicle age check would require additional data (year of manufacture)
-    # For now, we'll skip this check as it's not in the schema
-    
-    # All checks passed
-    return {
-        'approved': True,
-        'reason': 'Application meets all eligibility criteria for car loan'
+    # EMI at the 10.5% car loan rate, as a share of monthly income
+    emi = _monthly_emi(loan_amount, _MONTHLY_RATES['car'], loan_tenure)
+    
+    features = {
+        'monthly_income': monthly_income,
+        'credit_score': data.get('credit_score', None),
+        'down_payment': data.get('down_payment', 0),
+        # Down payment should be ≥ 10% of the car price, when one is given
+        'min_down_payment': car_price * 0.10 if car_price > 0 else float('-inf'),
+        'work_experience': data.get('work_experience', 0),
+        'emi_ratio': (emi / monthly_income) * 100 if monthly_income > 0 else 100,
     }
+    return _evaluate_car(features)
 
 
 def check_personal_loan(data: Dict) -> Dict:
@@ -284,64 +330,26 @@ def check_personal_loan(data: Dict) -> Dict:
     - Salary ≥ ₹25,000
     - EMI burden < 50%
     - Loan ≤ 12× monthly salary
-    """
-    reasons = []
     
-    # Extract data
+    Note: the existing EMI amount is not collected, so only the new EMI
+    is checked against the 50% limit.
+    """
     monthly_income = data.get('monthly_income', 0)
-    credit_score = data.get('credit_score', None)
-    work_experience = data.get('work_experience', 0)
     loan_amount = data.get('loan_amount_required', 0)
     loan_tenure = data.get('loan_tenure', 36)  # months
-    existing_emi = data.get('existing_emi', 'No')
     
-    # Check minimum monthly salary
-    if monthly_income < 25000:
-        reasons.append(f"Monthly salary (₹{monthly_income:,.0f}) is below minimum requirement (₹25,000/month)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
+    # EMI at the 12% personal loan rate, as a share of monthly income
+    emi = _monthly_emi(loan_amount, _MONTHLY_RATES['personal'], loan_tenure)
     
-    # Check credit score
-    if credit_score is None:
-        reasons.append("Credit score is required but not provided")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    if credit_score < 650:
-        reasons.append(f"Credit score ({credit_score}) is below minimum requirement (650)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check work experience
-    if work_experience < 1:
-        reasons.append(f"Work experience ({work_experience} years) is below minimum requirement (1 year)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check loan amount vs salary (should be ≤ 12× monthly salary)
-    max_loan_by_salary = monthly_income * 12
-    if loan_amount > max_loan_by_salary:
-        reasons.append(f"Loan amount (₹{loan_amount:,.0f}) exceeds maximum allowed (12× monthly salary = ₹{max_loan_by_salary:,.0f})")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Calculate EMI (using 12% interest rate for personal loans)
-    monthly_rate = (12.0 / 100) / 12
-    if monthly_rate > 0:
-        emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** loan_tenure) / (((1 + monthly_rate) ** loan_tenure) - 1)
-    else:
-        emi = loan_amount / loan_tenure
-    
-    # Check EMI-to-income ratio (should be < 50%)
-    emi_ratio = (emi / monthly_income) * 100 if monthly_income > 0 else 100
-    if emi_ratio >= 50:
-        reasons.append(f"EMI-to-income ratio ({emi_ratio:.1f}%) exceeds maximum allowed (50%)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check existing EMI burden (if yes, we need to ensure total EMI < 50%)
-    # Since we don't have the existing EMI amount, we'll be conservative
-    # and just ensure the new EMI alone is reasonable
-    
-    # All checks passed
-    return {
-        'approved': True,
-        'reason': 'Application meets all eligibility criteria for personal loan'
+    features = {
+        'monthly_income': monthly_income,
+        'credit_score': data.get('credit_score', None),
+        'work_experience': data.get('work_experience', 0),
+        'loan_amount': loan_amount,
+        'max_loan_by_salary': monthly_income * 12,
+        'emi_ratio': (emi / monthly_income) * 100 if monthly_income > 0 else 100,
     }
+    return _evaluate_personal(features)
 
 
 def check_business_loan(data: Dict) -> Dict:
@@ -363,56 +371,30 @@ def check_business_loan(data: Dict) -> Dict:
     - Loan amount ≤ 3× annual profit (we'll use turnover as proxy)
     - Credit score ≥ 600
     """
-    reasons = []
-    
-    # Extract data
-    business_age = data.get('business_age', 0)
     annual_turnover = data.get('annual_turnover', 0)
-    loan_amount = data.get('loan_amount_required', 0)
-    gst_number = data.get('gst_number', '').strip()
-    credit_score = data.get('credit_score', None)
     
-    # Check business age
-    if business_age < 2:
-        reasons.append(f"Business age ({business_age} years) is below minimum requirement (2 years)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check annual turnover (₹10 Lakhs = 1,000,000)
-    if annual_turnover < 1000000:
-        reasons.append(f"Annual turnover (₹{annual_turnover:,.0f}) is below minimum requirement (₹10 Lakhs)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check GST number validity (basic check - should be 15 characters)
-    if not gst_number or len(gst_number) < 15:
-        reasons.append("GST number is invalid or missing (should be 15 characters)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check credit score
-    if credit_score is None:
-        reasons.append("Credit score is required but not provided")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    if credit_score < 600:
-        reasons.append(f"Credit score ({credit_score}) is below minimum requirement (600)")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Check loan amount vs annual profit
     # Since we don't have profit data, we'll use a conservative estimate:
     # Assume profit is at least 10% of turnover, so loan should be ≤ 3× (10% of turnover)
     estimated_profit = annual_turnover * 0.10
-    max_loan_by_profit = estimated_profit * 3
-    if loan_amount > max_loan_by_profit:
-        reasons.append(f"Loan amount (₹{loan_amount:,.0f}) exceeds maximum allowed (3× estimated annual profit = ₹{max_loan_by_profit:,.0f})")
-        return {'approved': False, 'reason': '; '.join(reasons)}
-    
-    # Note: Profitability check would require profit/loss data
-    # For now, we'll assume positive cash flow if turnover is good
     
-    # All checks passed
-    return {
-        'approved': True,
-        'reason': 'Application meets all eligibility criteria for business loan'
+    features = {
+        'business_age': data.get('business_age', 0),
+        'annual_turnover': annual_turnover,
+        'gst_number_length': len(data.get('gst_number', '').strip()),
+        'credit_score': data.get('credit_score', None),
+        'loan_amount': data.get('loan_amount_required', 0),
+        'max_loan_by_profit': estimated_profit * 3,
     }
+    return _evaluate_business(features)
+
+
+_CHECKS = {
+    'education': check_education_loan,
+    'home': check_home_loan,
+    'car': check_car_loan,
+    'personal': check_personal_loan,
+    'business': check_business_loan,
+}
 
 
 def check_loan_approval(loan_type: str, data: Dict) -> Dict:
@@ -426,21 +408,15 @@ def check_loan_approval(loan_type: str, data: Dict) -> Dict:
     Returns:
         Dictionary with 'approved' (bool) and 'reason' (str)
     """
-    loan_type = loan_type.lower()
-    
-    if loan_type == 'education':
-        return check_education_loan(data)
-    elif loan_type == 'home':
-        return check_home_loan(data)
-    elif loan_type == 'car':
-        return check_car_loan(data)
-    elif loan_type == 'personal':
-        return check_personal_loan(data)
-    elif loan_type == 'business':
-        return check_business_loan(data)
-    else:
+    # Callers normally pass the lowercase name already, so only
+    # normalise the case when the direct lookup misses
+    check = _CHECKS.get(loan_type)
+    if check is None:
+        loan_type = loan_type.lower()
+        check = _CHECKS.get(loan_type)
+    if check is None:
         return {
             'approved': False,
             'reason': f'Unknown loan type: {loan_type}'
         }
-
+    return check(data)
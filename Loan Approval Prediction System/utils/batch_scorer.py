@@ -0,0 +1,145 @@
+"""
+Micro-batching of concurrent scoring requests.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Live scorers, reset in forked children (see _reset_after_fork)
+_scorers = weakref.WeakSet()
+
+
+class BatchScorer:
+    """
+    Coalesces concurrent single-record scoring calls into batched calls.
+    
+    Callers block in score() while a background worker collects queued
+    records into one batch and passes them to score_batch in a single call.
+    Under light load a record is scored as soon as it arrives; under
+    concurrent load, records queued while the previous batch was being
+    scored are picked up together.
+    
+    The worker thread doesn't survive fork(); a forked child (e.g. a
+    gunicorn worker forked from a preloaded master) starts its own worker
+    on first use.
+    """
+    
+    def __init__(
+        self,
+        score_batch: Callable[[List[Dict]], Sequence[Any]],
+        max_batch: int = 32,
+        max_wait_ms: float = 0.0
+    ):
+        """
+        Args:
+            score_batch: Function scoring a list of records, returning one result per record
+            max_batch: Maximum number of records scored in one call
+            max_wait_ms: How long to wait for more records before scoring a partial batch
+        """
+        self.score_batch = score_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        _scorers.add(self)
+    
+    def score(self, record: Dict) -> Any:
+        """Score a single record, blocking until its batch has been processed."""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((record, future))
+        return future.result()
+    
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name='batch-scorer', daemon=True
+                )
+                self._worker.start()
+    
+    def _reset_after_fork(self) -> None:
+        # The parent's queued records belong to callers in the parent, and
+        # its lock may have been held by another thread at fork time
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def _collect(self) -> List:
+        """Block for the first record, then gather the rest of the batch."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            try:
+                self._score(batch)
+            except BaseException as e:
+                # Never leave a caller waiting on its future
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                if not isinstance(e, Exception):
+                    # The worker is exiting; the next score() starts a new one
+                    with self._worker_lock:
+                        self._worker = None
+                    raise
+    
+    def _score(self, batch: List) -> None:
+        """Resolve every future in batch with its result or error."""
+        try:
+            results = self._score_records([record for record, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # Score the records one at a time, so only the records that
+            # fail get an error, not everything batched with them
+            for record, future in batch:
+                try:
+                    result, = self._score_records([record])
+                except Exception as record_error:
+                    future.set_exception(record_error)
+                else:
+                    future.set_result(result)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+    
+    def _score_records(self, records: List[Dict]) -> Sequence[Any]:
+        results = self.score_batch(records)
+        if len(results) != len(records):
+            raise RuntimeError(f"score_batch returned {len(results)} results for {len(records)} records")
+        return results
+
+
+def _reset_scorers_after_fork() -> None:
+    for scorer in list(_scorers):
+        scorer._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_scorers_after_fork)
@@ -2,21 +2,93 @@
 Data loading utilities for the Loan Approval Prediction System.
 """
 
+import os
 import pandas as pd
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq  # also enables pandas' multithreaded 'pyarrow' CSV engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False  # pyarrow not installed, use pandas' C parser and no Parquet cache
+
 logger = logging.getLogger(__name__)
 
+# Parquet schema metadata key recording which CSV the cache was built from
+CACHE_SOURCE_KEY = b'loan_dataset.source'
+
+# Column types of the loan dataset, so read_csv doesn't have to infer them.
+# Numeric columns are float64 because real data can have missing values.
+DATASET_DTYPES = {
+    'Loan_ID': 'str',
+    'Gender': 'str',
+    'Married': 'str',
+    'Dependents': 'str',
+    'Education': 'str',
+    'Self_Employed': 'str',
+    'ApplicantIncome': 'float64',
+    'CoapplicantIncome': 'float64',
+    'LoanAmount': 'float64',
+    'Loan_Amount_Term': 'float64',
+    'Credit_History': 'float64',
+    'Property_Area': 'str',
+    'Loan_Status': 'str',
+}
+
+
+def _read_options(file_path: str, exclude_columns: Iterable[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Columns to parse from the CSV header (minus exclude_columns) and their known dtypes."""
+    exclude_columns = set(exclude_columns)
+    columns = [col for col in pd.read_csv(file_path, nrows=0).columns if col not in exclude_columns]
+    return columns, {col: DATASET_DTYPES[col] for col in columns if col in DATASET_DTYPES}
 
-def load_dataset(file_path: str) -> pd.DataFrame:
+
+def _source_signature(path: Path) -> bytes:
+    """Size and nanosecond mtime of the CSV, stored in (and compared against) the cache."""
+    stat = path.stat()
+    return f'{stat.st_size}:{stat.st_mtime_ns}'.encode()
+
+
+def _cache_matches(cache_path: Path, signature: bytes) -> bool:
+    """Whether the Parquet cache exists and was built from the CSV with this signature."""
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except Exception:
+        return False  # missing or unreadable cache: rebuild it
+    return metadata.get(CACHE_SOURCE_KEY) == signature
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: Path, signature: bytes) -> None:
+    """Write the Parquet sidecar atomically; failures only cost the cache."""
+    tmp_path = cache_path.with_name(f'.{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), CACHE_SOURCE_KEY: signature}
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+        logger.info("Cached dataset as %s", cache_path)
+    except Exception as e:
+        logger.warning("Could not write dataset cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_dataset(file_path: str, exclude_columns: Iterable[str] = (), use_cache: bool = True) -> pd.DataFrame:
     """
     Load loan dataset from CSV file.
     
+    Known columns are parsed with the types in DATASET_DTYPES. When pyarrow
+    is installed, the CSV is parsed with the pyarrow engine and the parsed
+    frame is cached as a zstd-compressed Parquet file next to it (same name,
+    .parquet suffix); later loads read that cache while the CSV's size and
+    mtime still match the ones recorded in it.
+    
     Args:
         file_path: Path to the CSV file
+        exclude_columns: Columns not to parse at all (e.g. 'Loan_ID')
+        use_cache: Read and write the Parquet cache (requires pyarrow)
         
     Returns:
         DataFrame containing the loan data
@@ -30,21 +102,72 @@ def load_dataset(file_path: str) -> pd.DataFrame:
         if not path.exists():
             raise FileNotFoundError(f"Dataset file not found: {file_path}")
         
-        df = pd.read_csv(file_path)
-        logger.info(f"Successfully loaded dataset with {len(df)} records")
+        cache_path = path.with_suffix('.parquet')
+        use_cache = use_cache and PYARROW_AVAILABLE and path.suffix.lower() == '.csv'
+        # Taken before parsing, so a CSV rewritten mid-read leaves a stale signature
+        signature = _source_signature(path) if use_cache else None
+        if use_cache and _cache_matches(cache_path, signature):
+            exclude_columns = set(exclude_columns)
+            columns = [col for col in pq.read_schema(cache_path).names if col not in exclude_columns]
+            df = pd.read_parquet(cache_path, columns=columns)
+        elif use_cache:
+            # Cache every column so any exclude_columns can be served from it
+            columns, dtypes = _read_options(file_path, ())
+            df = pd.read_csv(file_path, dtype=dtypes, engine='pyarrow')
+            _write_parquet_cache(df, cache_path, signature)
+            df = df.drop(columns=list(exclude_columns), errors='ignore')
+        else:
+            columns, dtypes = _read_options(file_path, exclude_columns)
+            df = pd.read_csv(
+                file_path,
+                usecols=columns,
+                dtype=dtypes,
+                engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+            )
+        logger.info("Successfully loaded dataset with %d records", len(df))
         return df
     except Exception as e:
-        logger.error(f"Error loading dataset: {str(e)}")
+        logger.error("Error loading dataset: %s", e)
         raise
 
 
-def split_features_target(df: pd.DataFrame, target_column: str = 'Loan_Status') -> Tuple[pd.DataFrame, pd.Series]:
+def load_dataset_chunks(file_path: str, chunksize: int = 100_000,
+                        exclude_columns: Iterable[str] = ()) -> Iterator[pd.DataFrame]:
+    """
+    Load a loan dataset CSV in chunks, for files too large to hold in memory.
+    
+    Columns are parsed like load_dataset (the pyarrow engine can't stream,
+    so the C parser is always used).
+    
+    Args:
+        file_path: Path to the CSV file
+        chunksize: Rows per yielded DataFrame
+        exclude_columns: Columns not to parse at all (e.g. 'Loan_ID')
+        
+    Yields:
+        DataFrame for each chunk of up to chunksize rows
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"Dataset file not found: {file_path}")
+    
+    columns, dtypes = _read_options(file_path, exclude_columns)
+    with pd.read_csv(file_path, usecols=columns, dtype=dtypes, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def split_features_target(df: pd.DataFrame, target_column: str = 'Loan_Status',
+                          downcast: bool = True) -> Tuple[pd.DataFrame, pd.Series]:
     """
     Split dataset into features and target variable.
     
     Args:
         df: Input DataFrame
         target_column: Name of the target column
+        downcast: Store numeric features as float32 (incomes, amounts and
+            terms fit comfortably), halving their memory during training
         
     Returns:
         Tuple of (features DataFrame, target Series)
@@ -55,6 +178,10 @@ def split_features_target(df: pd.DataFrame, target_column: str = 'Loan_Status')
     X = df.drop(columns=[target_column, 'Loan_ID'], errors='ignore')
     y = df[target_column]
     
+    if downcast:
+        numeric_cols = X.select_dtypes(include=['float64', 'int64']).columns
+        X = X.astype(dict.fromkeys(numeric_cols, 'float32'))
+    
     return X, y
 
 
@@ -68,8 +195,8 @@ def save_dataset(df: pd.DataFrame, file_path: str) -> None:
     """
     try:
         df.to_csv(file_path, index=False)
-        logger.info(f"Dataset saved to {file_path}")
+        logger.info("Dataset saved to %s", file_path)
     except Exception as e:
-        logger.error(f"Error saving dataset: {str(e)}")
+        logger.error("Error saving dataset: %s", e)
         raise
 
@@ -4,15 +4,48 @@ Email service for sending notifications via SMTP.
 
 import smtplib
 import logging
+import queue
+import re
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import os
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Attachments larger than this are skipped rather than read into memory
+MAX_ATTACHMENT_BYTES = int(os.environ.get('MAX_ATTACHMENT_BYTES', str(10 * 1024 * 1024)))
+
+LOAN_TYPE_NAMES = {
+    'education': 'Education Loan',
+    'home': 'Home Loan',
+    'car': 'Car Loan',
+    'personal': 'Personal Loan',
+    'business': 'Business Loan'
+}
+
+STATUS_INFO = {
+    'approved': {
+        'title': '🎉 Application Approved!',
+        'color': '#4caf50',
+        'message': 'Congratulations! Your loan application has been approved.'
+    },
+    'rejected': {
+        'title': 'Application Status Update',
+        'color': '#f44336',
+        'message': 'We regret to inform you that your loan application has been rejected.'
+    },
+    'pending': {
+        'title': 'Application Under Review',
+        'color': '#ff9800',
+        'message': 'Your application is currently under review.'
+    }
+}
+
 
 class EmailService:
     """Service for sending emails via SMTP."""
@@ -27,6 +60,11 @@ class EmailService:
         self.from_email = os.environ.get('FROM_EMAIL', self.smtp_username)
         self.from_name = os.environ.get('FROM_NAME', 'Loan Application System')
         
+        # Idle authenticated connections, reused across sends to skip the
+        # TCP/STARTTLS/AUTH round trips
+        self.pool_size = int(os.environ.get('SMTP_POOL_SIZE', '4'))
+        self._pool: queue.Queue = queue.Queue(maxsize=self.pool_size)
+        
         # Check if SMTP is configured
         self.enabled = bool(self.smtp_username and self.smtp_password)
         
@@ -34,6 +72,155 @@ class EmailService:
             logger.warning("SMTP not configured. Email notifications will be disabled.")
             logger.info("To enable SMTP, set environment variables: SMTP_USERNAME, SMTP_PASSWORD")
     
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> MIMEMultipart:
+        """Build a MIME message with plain text and HTML parts."""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Create plain text version if not provided
+        if not body_text:
+            # Simple HTML to text conversion
+            body_text = _HTML_TAG_RE.sub('', body_html)
+            body_text = body_text.replace('&nbsp;', ' ')
+        
+        # Add body parts
+        part1 = MIMEText(body_text, 'plain')
+        part2 = MIMEText(body_html, 'html')
+        msg.attach(part1)
+        msg.attach(part2)
+        
+        # Add attachments if any
+        if attachments:
+            for file_path in attachments:
+                try:
+                    f = open(file_path, 'rb')
+                except OSError:
+                    continue  # Missing or unreadable attachments are skipped
+                with f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size > MAX_ATTACHMENT_BYTES:
+                        logger.warning("Attachment %s skipped: %d bytes exceeds limit", file_path, size)
+                        continue
+                    part = MIMEBase('application', 'octet-stream')
+                    part.set_payload(f.read())
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename= {os.path.basename(file_path)}'
+                )
+                msg.attach(part)
+        
+        return msg
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new authenticated SMTP connection."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            if self.smtp_use_tls:
+                server.starttls()
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        """Close a connection, ignoring errors from a dead socket."""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def _checkout(self) -> smtplib.SMTP:
+        """Take a live connection from the pool, or open a new one."""
+        while True:
+            try:
+                server = self._pool.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            self._close(server)
+    
+    def _checkin(self, server: smtplib.SMTP) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait(server)
+        except queue.Full:
+            self._close(server)
+    
+    def close(self) -> None:
+        """Close all pooled SMTP connections."""
+        while True:
+            try:
+                server = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+    
+    def _deliver(self, messages: List[MIMEMultipart]) -> bool:
+        """
+        Send one or more messages over a single pooled SMTP connection.
+        
+        If the server drops the connection mid-batch (e.g. a pooled session
+        timed out after its NOOP check), the unsent messages are retried
+        once on a fresh connection.
+        
+        Args:
+            messages: Messages to send
+        
+        Returns:
+            True if all messages were sent successfully, False otherwise
+        """
+        server = None
+        sent = 0
+        retried = False
+        try:
+            server = self._checkout()
+            while sent < len(messages):
+                msg = messages[sent]
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    if retried:
+                        raise
+                    retried = True
+                    logger.info("SMTP connection dropped, reconnecting")
+                    self._close(server)
+                    server = None
+                    server = self._connect()
+                    continue
+                sent += 1
+                logger.info("Email sent successfully to %s", msg['To'])
+            
+            self._checkin(server)
+            return True
+            
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error("SMTP authentication failed: %s", e)
+        except smtplib.SMTPException as e:
+            logger.error("SMTP error: %s", e)
+        except Exception as e:
+            logger.error("Error sending email: %s", e)
+        
+        # Don't return a connection in an unknown state to the pool
+        if server is not None:
+            self._close(server)
+        return False
+    
     def send_email(
         self,
         to_email: str,
@@ -56,62 +243,16 @@ class EmailService:
             True if email sent successfully, False otherwise
         """
         if not self.enabled:
-            logger.warning(f"Email not sent to {to_email}: SMTP not configured")
+            logger.warning("Email not sent to %s: SMTP not configured", to_email)
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Create plain text version if not provided
-            if not body_text:
-                # Simple HTML to text conversion
-                import re
-                body_text = re.sub(r'<[^>]+>', '', body_html)
-                body_text = body_text.replace('&nbsp;', ' ')
-            
-            # Add body parts
-            part1 = MIMEText(body_text, 'plain')
-            part2 = MIMEText(body_html, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
-            
-            # Add attachments if any
-            if attachments:
-                for file_path in attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, 'rb') as f:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(f.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(file_path)}'
-                            )
-                            msg.attach(part)
-            
-            # Connect to SMTP server and send
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.smtp_use_tls:
-                    server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-            
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
-            return False
-        except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {e}")
-            return False
+            msg = self._build_message(to_email, subject, body_html, body_text, attachments)
         except Exception as e:
-            logger.error(f"Error sending email: {e}")
+            logger.error("Error building email: %s", e)
             return False
+        
+        return self._deliver([msg])
     
     def send_application_confirmation(
         self,
@@ -136,15 +277,21 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        loan_type_names = {
-            'education': 'Education Loan',
-            'home': 'Home Loan',
-            'car': 'Car Loan',
-            'personal': 'Personal Loan',
-            'business': 'Business Loan'
-        }
-        
-        loan_type_display = loan_type_names.get(loan_type, loan_type.title())
+        subject, html_body = self._render_application_confirmation(
+            applicant_name, application_id, loan_type, loan_amount, emi_info
+        )
+        return self.send_email(to_email, subject, html_body)
+    
+    def _render_application_confirmation(
+        self,
+        applicant_name: str,
+        application_id: str,
+        loan_type: str,
+        loan_amount: float,
+        emi_info: Optional[dict] = None
+    ) -> Tuple[str, str]:
+        """Render the confirmation email; returns (subject, html_body)."""
+        loan_type_display = LOAN_TYPE_NAMES.get(loan_type, loan_type.title())
         
         # HTML email template
         html_body = f"""
@@ -206,7 +353,7 @@ class EmailService:
         
         subject = f"Loan Application Confirmation - {application_id[:8]}"
         
-        return self.send_email(to_email, subject, html_body)
+        return subject, html_body
     
     def send_status_update(
         self,
@@ -228,39 +375,29 @@ class EmailService:
             loan_type: Type of loan
             status: New status (approved/rejected/pending)
             remarks: Additional remarks (optional)
+            approval_reason: Reason from the approval engine (optional)
         
         Returns:
             True if email sent successfully, False otherwise
         """
-        loan_type_names = {
-            'education': 'Education Loan',
-            'home': 'Home Loan',
-            'car': 'Car Loan',
-            'personal': 'Personal Loan',
-            'business': 'Business Loan'
-        }
-        
-        loan_type_display = loan_type_names.get(loan_type, loan_type.title())
-        
-        status_info = {
-            'approved': {
-                'title': '🎉 Application Approved!',
-                'color': '#4caf50',
-                'message': 'Congratulations! Your loan application has been approved.'
-            },
-            'rejected': {
-                'title': 'Application Status Update',
-                'color': '#f44336',
-                'message': 'We regret to inform you that your loan application has been rejected.'
-            },
-            'pending': {
-                'title': 'Application Under Review',
-                'color': '#ff9800',
-                'message': 'Your application is currently under review.'
-            }
-        }
-        
-        info = status_info.get(status.lower(), status_info['pending'])
+        subject, html_body = self._render_status_update(
+            applicant_name, application_id, loan_type, status, remarks, approval_reason
+        )
+        return self.send_email(to_email, subject, html_body)
+    
+    def _render_status_update(
+        self,
+        applicant_name: str,
+        application_id: str,
+        loan_type: str,
+        status: str,
+        remarks: Optional[str] = None,
+        approval_reason: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Render the status update email; returns (subject, html_body)."""
+        loan_type_display = LOAN_TYPE_NAMES.get(loan_type, loan_type.title())
+        
+        info = STATUS_INFO.get(status.lower(), STATUS_INFO['pending'])
         
         # Build approval/rejection details section
         details_section = ""
@@ -333,7 +470,57 @@ class EmailService:
         
         subject = f"Loan Application Status Update - {status.upper()}"
         
-        return self.send_email(to_email, subject, html_body)
+        return subject, html_body
+    
+    def send_application_result(
+        self,
+        to_email: str,
+        applicant_name: str,
+        application_id: str,
+        loan_type: str,
+        loan_amount: float,
+        status: str,
+        emi_info: Optional[dict] = None,
+        approval_reason: Optional[str] = None
+    ) -> bool:
+        """
+        Send the confirmation and status update emails for a new application.
+        
+        Both messages are delivered over a single SMTP session so the
+        connection, TLS handshake and login happen once per application.
+        
+        Args:
+            to_email: Applicant email address
+            applicant_name: Applicant name
+            application_id: Application ID
+            loan_type: Type of loan
+            loan_amount: Loan amount requested
+            status: Decision from the approval engine (approved/rejected)
+            emi_info: EMI information dictionary (optional)
+            approval_reason: Reason from the approval engine (optional)
+        
+        Returns:
+            True if both emails were sent successfully, False otherwise
+        """
+        if not self.enabled:
+            logger.warning("Email not sent to %s: SMTP not configured", to_email)
+            return False
+        
+        try:
+            messages = [
+                self._build_message(to_email, *self._render_application_confirmation(
+                    applicant_name, application_id, loan_type, loan_amount, emi_info
+                )),
+                self._build_message(to_email, *self._render_status_update(
+                    applicant_name, application_id, loan_type, status,
+                    approval_reason=approval_reason
+                ))
+            ]
+        except Exception as e:
+            logger.error("Error building email: %s", e)
+            return False
+        
+        return self._deliver(messages)
 
 
 # Global email service instance
@@ -5,6 +5,61 @@ EMI (Equated Monthly Installment) Calculator utility.
 import math
 from typing import Dict, Optional
 
+import numpy as np
+
+# Typical annual interest rates in percent (can be customized)
+INTEREST_RATES = {
+    'education': 8.5,   # Education loans typically have lower rates
+    'home': 9.0,        # Home loans
+    'car': 10.5,        # Car loans
+    'personal': 12.0,   # Personal loans (higher risk)
+    'business': 11.5    # Business loans
+}
+
+# Typical amounts, tenures and rates per loan type
+LOAN_DETAILS = {
+    'education': {
+        'min_amount': 10000,
+        'max_amount': 5000000,
+        'min_tenure_years': 1,
+        'max_tenure_years': 20,
+        'typical_rate': 8.5,
+        'description': 'Education loans help finance your studies'
+    },
+    'home': {
+        'min_amount': 500000,
+        'max_amount': 50000000,
+        'min_tenure_years': 5,
+        'max_tenure_years': 30,
+        'typical_rate': 9.0,
+        'description': 'Home loans for buying or constructing your dream home'
+    },
+    'car': {
+        'min_amount': 50000,
+        'max_amount': 10000000,
+        'min_tenure_years': 1,
+        'max_tenure_years': 7,
+        'typical_rate': 10.5,
+        'description': 'Car loans for new or used vehicles'
+    },
+    'personal': {
+        'min_amount': 10000,
+        'max_amount': 5000000,
+        'min_tenure_months': 6,
+        'max_tenure_months': 60,
+        'typical_rate': 12.0,
+        'description': 'Personal loans for various purposes'
+    },
+    'business': {
+        'min_amount': 100000,
+        'max_amount': 50000000,
+        'min_tenure_years': 1,
+        'max_tenure_years': 10,
+        'typical_rate': 11.5,
+        'description': 'Business loans to grow your enterprise'
+    }
+}
+
 
 def calculate_emi(principal: float, annual_rate: float, tenure_months: int) -> Dict:
     """
@@ -33,7 +88,8 @@ def calculate_emi(principal: float, annual_rate: float, tenure_months: int) -> D
     if monthly_rate == 0:
         emi = principal / tenure_months
     else:
-        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+        growth = (1 + monthly_rate) ** tenure_months
+        emi = principal * monthly_rate * growth / (growth - 1)
     
     total_amount = emi * tenure_months
     total_interest = total_amount - principal
@@ -49,6 +105,58 @@ def calculate_emi(principal: float, annual_rate: float, tenure_months: int) -> D
     }
 
 
+def _round_paise(values: np.ndarray) -> np.ndarray:
+    """
+    Round to 2 decimals exactly like round(value, 2). np.round scales by 100
+    first, which can break near-ties the other way, so those few values are
+    rounded with Python's round.
+    """
+    rounded = np.array(np.round(values, 2))
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, 2) for value in values[near_tie].tolist()]
+    return rounded
+
+
+def calculate_emi_batch(principals, annual_rates, tenure_months) -> Dict[str, np.ndarray]:
+    """
+    Calculate EMIs for many loans at once (e.g. quotes for every stored
+    application), with the same formula and rounding as calculate_emi.
+    
+    Args:
+        principals: Loan amounts
+        annual_rates: Annual interest rates in percent (array or one rate for all)
+        tenure_months: Loan tenures in months
+    
+    Returns:
+        Dictionary of 'emi', 'total_amount' and 'total_interest' arrays;
+        all three are 0 for loans whose principal or tenure isn't positive
+    """
+    principals = np.asarray(principals, dtype=np.float64)
+    monthly_rates = np.asarray(annual_rates, dtype=np.float64) / 100 / 12
+    tenure_months = np.asarray(tenure_months, dtype=np.float64)
+    principals, monthly_rates, tenure_months = np.broadcast_arrays(principals, monthly_rates, tenure_months)
+    valid = (principals > 0) & (tenure_months > 0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = np.power(1 + monthly_rates, tenure_months)
+        emi = np.where(
+            monthly_rates == 0,
+            principals / tenure_months,
+            principals * monthly_rates * growth / (growth - 1)
+        )
+        emi = np.where(valid, emi, 0.0)
+    total_amount = emi * tenure_months
+    total_interest = np.where(valid, total_amount - principals, 0.0)
+    
+    return {
+        'emi': _round_paise(emi),
+        'total_amount': _round_paise(total_amount),
+        'total_interest': _round_paise(total_interest),
+    }
+
+
 def calculate_emi_for_loan_type(loan_type: str, loan_amount: float, tenure: int, tenure_unit: str = 'years') -> Dict:
     """
     Calculate EMI for different loan types with typical interest rates.
@@ -62,22 +170,13 @@ def calculate_emi_for_loan_type(loan_type: str, loan_amount: float, tenure: int,
     Returns:
         Dictionary with EMI calculation results
     """
-    # Typical interest rates (can be customized)
-    interest_rates = {
-        'education': 8.5,   # Education loans typically have lower rates
-        'home': 9.0,        # Home loans
-        'car': 10.5,        # Car loans
-        'personal': 12.0,   # Personal loans (higher risk)
-        'business': 11.5    # Business loans
-    }
-    
     # Convert tenure to months if needed
     if tenure_unit == 'years':
         tenure_months = tenure * 12
     else:
         tenure_months = tenure
     
-    rate = interest_rates.get(loan_type.lower(), 10.0)  # Default 10% if type not found
+    rate = INTEREST_RATES.get(loan_type.lower(), 10.0)  # Default 10% if type not found
     
     result = calculate_emi(loan_amount, rate, tenure_months)
     result['loan_type'] = loan_type
@@ -87,49 +186,6 @@ def calculate_emi_for_loan_type(loan_type: str, loan_amount: float, tenure: int,
 
 
 def get_loan_details(loan_type: str) -> Dict:
-    """Get typical loan details for a loan type."""
-    details = {
-        'education': {
-            'min_amount': 10000,
-            'max_amount': 5000000,
-            'min_tenure_years': 1,
-            'max_tenure_years': 20,
-            'typical_rate': 8.5,
-            'description': 'Education loans help finance your studies'
-        },
-        'home': {
-            'min_amount': 500000,
-            'max_amount': 50000000,
-            'min_tenure_years': 5,
-            'max_tenure_years': 30,
-            'typical_rate': 9.0,
-            'description': 'Home loans for buying or constructing your dream home'
-        },
-        'car': {
-            'min_amount': 50000,
-            'max_amount': 10000000,
-            'min_tenure_years': 1,
-            'max_tenure_years': 7,
-            'typical_rate': 10.5,
-            'description': 'Car loans for new or used vehicles'
-        },
-        'personal': {
-            'min_amount': 10000,
-            'max_amount': 5000000,
-            'min_tenure_months': 6,
-            'max_tenure_months': 60,
-            'typical_rate': 12.0,
-            'description': 'Personal loans for various purposes'
-        },
-        'business': {
-            'min_amount': 100000,
-            'max_amount': 50000000,
-            'min_tenure_years': 1,
-            'max_tenure_years': 10,
-            'typical_rate': 11.5,
-            'description': 'Business loans to grow your enterprise'
-        }
-    }
-    
-    return details.get(loan_type.lower(), {})
+    """Get typical loan details for a loan type (a shared dict; don't modify it)."""
+    return LOAN_DETAILS.get(loan_type.lower(), {})
 
@@ -0,0 +1,54 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False  # orjson not installed, Flask's default provider is used
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that parses request bodies and serializes responses with orjson.
+    
+    Keys keep their insertion order, numpy scalars/arrays are serialized
+    natively, and anything else falls back to Flask's default handler.
+    Calls that pass json.dumps-specific keyword arguments are delegated to
+    the stdlib implementation.
+    """
+    
+    sort_keys = False
+    
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or UTF-8 bytes."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the arguments as JSON and return a response object."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
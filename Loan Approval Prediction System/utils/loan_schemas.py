@@ -3,13 +3,61 @@ Data schemas for different loan types.
 """
 
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
-import uuid
+import os
+import sys
 
+# Slotted instances (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
-class EducationLoanApplication:
+
+def _new_application_id() -> str:
+    """
+    Random version 4 UUID string, formatted like str(uuid.uuid4()) but
+    without building a UUID object (about half the cost).
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+
+class _ApplicationRecord:
+    """Dictionary conversion shared by the loan application schemas."""
+    __slots__ = ()
+    
+    def _record(self, now: Optional[str] = None, **extra) -> Dict:
+        # All fields are scalars, so a shallow copy matches asdict() without
+        # its recursive deepcopy
+        if self.submitted_at is not None:
+            now = self.submitted_at
+        elif now is None:
+            now = datetime.now().isoformat()
+        return {
+            **{name: getattr(self, name) for name in self.__dataclass_fields__},
+            'application_id': self.application_id if self.application_id is not None else _new_application_id(),
+            'submitted_at': now,
+            **extra
+        }
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return self._record()
+    
+    def as_result_dict(self, emi_info: Optional[Dict], now: Optional[str] = None) -> Dict:
+        """
+        Convert to the stored application record, including EMI details, in a single build.
+        
+        now is used as submitted_at when the application has none, so a batch
+        can share one timestamp; the current time is used if it isn't given.
+        """
+        return self._record(now, emi_info=emi_info)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class EducationLoanApplication(_ApplicationRecord):
     """Schema for Education Loan Application."""
     # Applicant Details
     full_name: str
@@ -45,19 +93,10 @@ class EducationLoanApplication:
     loan_type: str = "education"
     submitted_at: Optional[str] = None
     status: str = "pending"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.application_id is None:
-            data['application_id'] = str(uuid.uuid4())
-        if self.submitted_at is None:
-            data['submitted_at'] = datetime.now().isoformat()
-        return data
 
 
-@dataclass
-class HomeLoanApplication:
+@dataclass(**_DATACLASS_OPTIONS)
+class HomeLoanApplication(_ApplicationRecord):
     """Schema for Home Loan Application."""
     # Personal Details
     full_name: str
@@ -99,19 +138,10 @@ class HomeLoanApplication:
     loan_type: str = "home"
     submitted_at: Optional[str] = None
     status: str = "pending"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.application_id is None:
-            data['application_id'] = str(uuid.uuid4())
-        if self.submitted_at is None:
-            data['submitted_at'] = datetime.now().isoformat()
-        return data
 
 
-@dataclass
-class CarLoanApplication:
+@dataclass(**_DATACLASS_OPTIONS)
+class CarLoanApplication(_ApplicationRecord):
     """Schema for Car Loan Application."""
     # Personal Details
     full_name: str
@@ -149,19 +179,10 @@ class CarLoanApplication:
     loan_type: str = "car"
     submitted_at: Optional[str] = None
     status: str = "pending"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.application_id is None:
-            data['application_id'] = str(uuid.uuid4())
-        if self.submitted_at is None:
-            data['submitted_at'] = datetime.now().isoformat()
-        return data
 
 
-@dataclass
-class PersonalLoanApplication:
+@dataclass(**_DATACLASS_OPTIONS)
+class PersonalLoanApplication(_ApplicationRecord):
     """Schema for Personal Loan Application."""
     # Personal Details
     full_name: str
@@ -189,19 +210,10 @@ class PersonalLoanApplication:
     loan_type: str = "personal"
     submitted_at: Optional[str] = None
     status: str = "pending"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.application_id is None:
-            data['application_id'] = str(uuid.uuid4())
-        if self.submitted_at is None:
-            data['submitted_at'] = datetime.now().isoformat()
-        return data
 
 
-@dataclass
-class BusinessLoanApplication:
+@dataclass(**_DATACLASS_OPTIONS)
+class BusinessLoanApplication(_ApplicationRecord):
     """Schema for Business Loan Application."""
     # Business Details
     business_name: str
@@ -234,13 +246,4 @@ class BusinessLoanApplication:
     loan_type: str = "business"
     submitted_at: Optional[str] = None
     status: str = "pending"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.application_id is None:
-            data['application_id'] = str(uuid.uuid4())
-        if self.submitted_at is None:
-            data['submitted_at'] = datetime.now().isoformat()
-        return data
 
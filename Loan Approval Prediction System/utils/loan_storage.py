@@ -4,18 +4,33 @@ Storage utilities for loan applications.
 
 import json
 import logging
+import mmap
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # orjson not installed, the json module is used
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False  # e.g. Windows: writes are only serialized within one process
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Storage file path - prefer project root, fallback to temp directory
 # OneDrive may prevent file writes, so we use temp directory as reliable fallback
-import os
 import tempfile
+import threading
 
 PROJECT_ROOT = Path(os.getcwd())
 PROJECT_STORAGE_FILE = PROJECT_ROOT / 'applications.json'
@@ -24,6 +39,35 @@ TEMP_STORAGE_FILE = Path(tempfile.gettempdir()) / 'loan_applications.json'
 # Try project root first, use temp if project root is not writable
 STORAGE_FILE = PROJECT_STORAGE_FILE
 
+# Serializes read-modify-write cycles on the storage file within this
+# process; _storage_lock() adds a file lock shared with other processes
+_write_lock = threading.RLock()
+_pending_lock = threading.Lock()
+_pending_saves: List[Dict] = []
+
+# Changes since the storage file was last rewritten are appended to a journal
+# next to it (applications.ndjson), one JSON record per line:
+#   {"op": "add", "application": {...}}
+#   {"op": "update", "application_id": "...", "fields": {...}}
+#   {"op": "delete", "application_id": "..."}
+# so saving or updating an application writes one line, not the whole file.
+# Once the journal holds more records than JOURNAL_COMPACT_RATIO of the
+# applications (and at least JOURNAL_COMPACT_MIN), it is folded back into
+# the storage file. Replaying a record that is already reflected in the
+# storage file is a no-op, so an interrupted compaction is harmless.
+JOURNAL_COMPACT_MIN = int(os.environ.get('JOURNAL_COMPACT_MIN', '100'))
+JOURNAL_COMPACT_RATIO = float(os.environ.get('JOURNAL_COMPACT_RATIO', '0.25'))
+
+# Storage files at least this large are parsed from a memory map (with orjson),
+# saving a copy of the whole file into a bytes object
+MMAP_MIN_BYTES = 1 << 20
+
+# Parsed storage file plus journal, reused until either changes. Keys are
+# (path, inode, mtime, size), so changes by other processes are noticed;
+# journal growth is read incrementally from journal_offset.
+_cache_lock = threading.Lock()
+_cache: Dict = {}
+
 
 def ensure_storage_dir():
     """Ensure storage file location is accessible (no directory creation needed)."""
@@ -33,76 +77,359 @@ def ensure_storage_dir():
     logger.debug(f"Storage file will be at: {STORAGE_FILE}")
 
 
+def _journal_path(storage_file: Path) -> Path:
+    """Journal of changes not yet folded into storage_file."""
+    return storage_file.with_suffix('.ndjson')
+
+
+@contextmanager
+def _storage_lock():
+    """
+    Hold _write_lock and, where fcntl is available, an exclusive lock on a
+    lock file next to the storage file, so read-modify-write cycles (journal
+    appends, compaction, rewrites) of several worker processes don't
+    interleave. Not reentrant.
+    """
+    with _write_lock:
+        lock_file = None
+        if FCNTL_AVAILABLE:
+            try:
+                lock_file = open(get_storage_file_path().with_suffix('.lock'), 'ab')
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.warning(f"Could not lock applications storage ({e}), continuing without a file lock")
+                if lock_file is not None:
+                    lock_file.close()
+                    lock_file = None
+        try:
+            yield
+        finally:
+            if lock_file is not None:
+                lock_file.close()  # Releases the lock
+
+
 def get_storage_file_path():
     """Get the storage file path, checking both locations."""
-    # Check if project root file exists
-    if PROJECT_STORAGE_FILE.exists():
+    # Check if project root file (or its journal) exists
+    if PROJECT_STORAGE_FILE.exists() or _journal_path(PROJECT_STORAGE_FILE).exists():
         return PROJECT_STORAGE_FILE
-    # Check if temp file exists
-    if TEMP_STORAGE_FILE.exists():
+    # Check if temp file (or its journal) exists
+    if TEMP_STORAGE_FILE.exists() or _journal_path(TEMP_STORAGE_FILE).exists():
         return TEMP_STORAGE_FILE
     # Default to project root for new files
     return PROJECT_STORAGE_FILE
 
-def load_applications() -> List[Dict]:
-    """Load all applications from storage."""
+def _dumps(obj, indent: bool = True) -> bytes:
+    """Serialize as UTF-8 JSON (2-space indented, or on one line), with str() for unknown types."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json handles
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _loads(raw):
+    """Parse the storage file contents (bytes, or a memoryview when orjson is available)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN/Infinity written by older versions
+    return json.loads(bytes(raw))
+
+
+def _read_json(f):
+    """
+    Parse an open storage file. Large files are mapped rather than read, so
+    orjson parses the page cache directly. The storage file is only ever
+    replaced, never truncated in place, so the mapping stays valid.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if ORJSON_AVAILABLE and size and size >= MMAP_MIN_BYTES:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _loads(view)
+    return _loads(f.read())
+
+
+def _file_key(path: Path) -> Optional[Tuple]:
+    """Identity of the current version of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _index_by_id(applications: List[Dict]) -> Dict[str, int]:
+    """Position of the first application with each application_id."""
+    index = {}
+    for position, application in enumerate(applications):
+        index.setdefault(application.get('application_id'), position)
+    return index
+
+
+def _replay(applications: List[Dict], index: Dict[str, int], lines: List[bytes]) -> List[Dict]:
+    """
+    Apply journal lines to applications (a private copy) and its index, in
+    place. Adds of an application_id that is already present are skipped.
+    
+    Returns:
+        The updated applications list
+    """
+    for line in lines:
+        try:
+            record = _loads(line)
+            op = record['op']
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Skipping unreadable applications journal record: {e}")
+            continue
+        if op == 'add':
+            application = record['application']
+            application_id = application.get('application_id')
+            if application_id not in index:
+                index[application_id] = len(applications)
+                applications.append(application)
+        elif op == 'update':
+            position = index.get(record['application_id'])
+            if position is not None:
+                applications[position] = {**applications[position], **record['fields']}
+        elif op == 'delete' and record['application_id'] in index:
+            applications = [app for app in applications if app.get('application_id') != record['application_id']]
+            index.clear()
+            index.update(_index_by_id(applications))
+    return applications
+
+
+def _cached_applications() -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    The stored applications and the position of each application_id.
+    
+    The storage file is parsed at most once per version; new journal
+    records are read from where the previous call stopped. Both returned
+    objects are shared with the cache and must not be modified.
+    """
     ensure_storage_dir()
     
     storage_file = get_storage_file_path()
+    journal = _journal_path(storage_file)
+    
+    # Taken before reading, so a concurrent change only causes a re-read
+    key = _file_key(storage_file)
+    journal_key = _file_key(journal)
+    with _cache_lock:
+        cached = dict(_cache)
+    if cached and cached['key'] == key and cached['journal_key'] == journal_key:
+        return cached['applications'], cached['index']
+    
+    cached_journal = cached.get('journal_key')
+    if (cached and cached['key'] == key and journal_key and cached_journal
+            and cached_journal[:2] == journal_key[:2] and journal_key[3] >= cached['journal_offset']):
+        # Only the journal grew: apply the new records to a copy
+        applications = list(cached['applications'])
+        index = dict(cached['index'])
+        offset = cached['journal_offset']
+        records = cached['journal_records']
+    else:
+        applications, offset, records = [], 0, 0
+        if key is not None:
+            try:
+                with open(storage_file, 'rb') as f:
+                    applications = _read_json(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.error(f"Error loading applications: {e}")
+                return [], {}
+            if not isinstance(applications, list):
+                applications = []
+        index = _index_by_id(applications)
+    
+    if journal_key is not None:
+        try:
+            with open(journal, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+        except IOError as e:
+            logger.error(f"Error loading applications journal: {e}")
+            tail = b''
+        # A last line without a newline is still being written
+        complete = tail[:tail.rfind(b'\n') + 1]
+        lines = complete.splitlines()
+        applications = _replay(applications, index, lines)
+        offset += len(complete)
+        records += len(lines)
+    
+    with _cache_lock:
+        _cache.update(key=key, journal_key=journal_key, journal_offset=offset, journal_records=records,
+                      applications=applications, index=index)
+    return applications, index
+
+
+def load_applications() -> List[Dict]:
+    """
+    Load all applications from storage.
     
-    if not storage_file.exists():
-        return []
+    Returns a new list, but the application dicts are shared with the
+    storage cache; copy one before modifying it.
+    """
+    return list(_cached_applications()[0])
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """
+    Write data to path through a temporary file, so readers never see a
+    partial file. The data is flushed to disk before the rename, so a crash
+    leaves either the old or the new file, never an empty one.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_applications(applications: List[Dict]) -> Optional[str]:
+    """
+    Write the full applications list to storage.
+    
+    Tries the project root first and falls back to the temp directory.
     
+    Returns:
+        Path written to, or None if both locations failed
+    """
+    data = _dumps(applications)
     try:
-        with open(storage_file, 'r', encoding='utf-8') as f:
-            applications = json.load(f)
-            return applications if isinstance(applications, list) else []
-    except (json.JSONDecodeError, IOError) as e:
-        logger.error(f"Error loading applications: {e}")
-        return []
+        # Try to write to project root
+        storage_file_path = str(PROJECT_STORAGE_FILE)
+        _replace_file(storage_file_path, data)
+        return storage_file_path
+    except (IOError, OSError, PermissionError) as e:
+        # If project root write fails (e.g., OneDrive restrictions), use temp directory
+        logger.warning(f"Cannot write to project directory ({e}), using temp directory instead")
+        storage_file_path = str(TEMP_STORAGE_FILE)
+        try:
+            _replace_file(storage_file_path, data)
+            return storage_file_path
+        except Exception as temp_error:
+            logger.error(f"Error saving to temp directory: {temp_error}")
+            return None
+
+
+def _compact_journal() -> None:
+    """Fold a large journal back into the storage file. Caller holds _storage_lock()."""
+    applications = _cached_applications()[0]
+    with _cache_lock:
+        records = _cache.get('journal_records', 0)
+        offset = _cache.get('journal_offset', 0)
+    if records < max(JOURNAL_COMPACT_MIN, JOURNAL_COMPACT_RATIO * len(applications)):
+        return
+    
+    storage_file = get_storage_file_path()
+    journal = _journal_path(storage_file)
+    try:
+        _replace_file(str(storage_file), _dumps(applications))
+        # Other processes append under the same lock, so the journal only
+        # differs from what was read if one wrote without fcntl; keep it then,
+        # its records are folded in by the next compaction
+        if os.path.getsize(journal) == offset:
+            os.remove(journal)
+    except OSError as e:
+        logger.warning(f"Could not compact applications journal: {e}")
+
+
+def _record_changes(records: List[Dict], applications: List[Dict]) -> Optional[str]:
+    """
+    Save changes by appending records to the journal. If the journal can't
+    be written, the storage file is rewritten with applications (the state
+    after the changes) instead. Caller holds _storage_lock(), so
+    applications includes every change made by other processes.
+    
+    Returns:
+        Path written to, or None if the changes could not be saved
+    """
+    storage_file = get_storage_file_path()
+    journal = _journal_path(storage_file)
+    data = b''.join(_dumps(record, indent=False) + b'\n' for record in records)
+    try:
+        with open(journal, 'ab') as f:
+            f.write(data)
+    except OSError as e:
+        logger.warning(f"Cannot append to applications journal ({e}), rewriting storage file")
+        storage_file_path = _write_applications(applications)
+        # The rewritten file already includes the journal
+        if storage_file_path is not None:
+            try:
+                os.remove(journal)
+            except OSError:
+                pass
+        return storage_file_path
+    _compact_journal()
+    return str(storage_file)
 
 
 def save_application(application: Dict) -> bool:
-    """Save a new application to storage."""
+    """
+    Save a new application to storage.
+    
+    Concurrent saves are group-committed: whichever caller holds the write
+    lock flushes every application queued so far in a single journal write,
+    and each caller returns once its own application has been written.
+    """
+    return save_applications([application])
+
+
+def save_applications(applications: List[Dict]) -> bool:
+    """
+    Save several new applications to storage in a single journal write.
+    
+    The applications are queued together, so they are always written in the
+    same group commit and either all of them are saved or none are.
+    """
+    if not applications:
+        return True
+    
+    # Clean application data for JSON serialization
+    entries = [{'application': clean_for_json(application), 'saved': None} for application in applications]
+    with _pending_lock:
+        _pending_saves.extend(entries)
+    
+    with _storage_lock():
+        if entries[0]['saved'] is None:
+            with _pending_lock:
+                batch = list(_pending_saves)
+                _pending_saves.clear()
+            saved = _commit_batch([item['application'] for item in batch])
+            for item in batch:
+                item['saved'] = saved
+    
+    return entries[0]['saved']
+
+
+def _commit_batch(batch: List[Dict]) -> bool:
+    """Append a batch of cleaned applications to storage. Caller holds _storage_lock()."""
     try:
         ensure_storage_dir()
         applications = load_applications()
+        applications.extend(batch)
         
-        # Clean application data for JSON serialization
-        cleaned_application = clean_for_json(application)
-        
-        # Add application
-        applications.append(cleaned_application)
-        
-        # Try saving to project root first, fallback to temp directory
-        storage_file = PROJECT_STORAGE_FILE
-        storage_file_path = str(storage_file)
-        
-        try:
-            # Try to write to project root
-            with open(storage_file_path, 'w', encoding='utf-8') as f:
-                json.dump(applications, f, indent=2, ensure_ascii=False, default=str)
-            logger.info(f"Application saved: {cleaned_application.get('application_id')} to {storage_file_path}")
-            return True
-        except (IOError, OSError, PermissionError) as e:
-            # If project root write fails (e.g., OneDrive restrictions), use temp directory
-            logger.warning(f"Cannot write to project directory ({e}), using temp directory instead")
-            storage_file = TEMP_STORAGE_FILE
-            storage_file_path = str(storage_file)
-            
-            try:
-                with open(storage_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(applications, f, indent=2, ensure_ascii=False, default=str)
-                logger.info(f"Application saved to temp location: {cleaned_application.get('application_id')} to {storage_file_path}")
-                return True
-            except Exception as temp_error:
-                logger.error(f"Error saving to temp directory: {temp_error}")
-                raise temp_error
+        records = [{'op': 'add', 'application': application} for application in batch]
+        storage_file_path = _record_changes(records, applications)
+        if storage_file_path is None:
+            return False
+        for application in batch:
+            logger.info(f"Application saved: {application.get('application_id')} to {storage_file_path}")
+        return True
         
     except Exception as e:
-        logger.error(f"Error saving application: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error saving application: {e}")
         return False
 
 
@@ -121,7 +448,7 @@ def clean_for_json(obj):
 
 def get_applications_by_type(loan_type: str) -> List[Dict]:
     """Get all applications of a specific loan type."""
-    applications = load_applications()
+    applications = _cached_applications()[0]
     return [app for app in applications if app.get('loan_type') == loan_type]
 
 
@@ -130,33 +457,70 @@ def get_all_applications() -> List[Dict]:
     return load_applications()
 
 
+def get_applications_page(after: Optional[str] = None, limit: int = 50,
+                          loan_type: Optional[str] = None) -> Optional[List[Dict]]:
+    """
+    Get one page of applications, newest first.
+    
+    Args:
+        after: application_id of the last entry on the previous page, or
+            None for the first page
+        limit: Maximum number of applications to return
+        loan_type: Only include applications of this loan type
+        
+    Returns:
+        Up to limit applications submitted before the cursor, or None if
+        the cursor names no stored application (e.g. it was deleted since)
+    """
+    applications, index = _cached_applications()
+    end = len(applications)
+    if after is not None:
+        end = index.get(after)
+        if end is None:
+            return None
+    
+    page = []
+    for i in range(end - 1, -1, -1):
+        app = applications[i]
+        if loan_type and app.get('loan_type') != loan_type:
+            continue
+        page.append(app)
+        if len(page) >= limit:
+            break
+    return page
+
+
 def get_application_by_id(application_id: str) -> Optional[Dict]:
     """Get a specific application by ID."""
-    applications = load_applications()
-    for app in applications:
-        if app.get('application_id') == application_id:
-            return app
-    return None
+    applications, index = _cached_applications()
+    position = index.get(application_id)
+    return None if position is None else applications[position]
 
 
 def update_application_status(application_id: str, status: str) -> bool:
     """Update application status."""
     try:
-        applications = load_applications()
-        storage_file = get_storage_file_path()
-        
-        for app in applications:
-            if app.get('application_id') == application_id:
-                app['status'] = status
-                app['updated_at'] = datetime.now().isoformat()
-                
-                with open(storage_file, 'w', encoding='utf-8') as f:
-                    json.dump(applications, f, indent=2, ensure_ascii=False)
-                
-                logger.info(f"Application status updated: {application_id} -> {status}")
+        with _storage_lock():
+            applications, index = _cached_applications()
+            position = index.get(application_id)
+            if position is None:
+                return False
+            if applications[position].get('status') == status:
+                # Nothing to write (e.g. a repeated admin action)
+                logger.debug(f"Application status unchanged: {application_id} -> {status}")
                 return True
-        
-        return False
+            
+            fields = {'status': status, 'updated_at': datetime.now().isoformat()}
+            # Updated copy, only written out if the journal can't be
+            applications = list(applications)
+            applications[position] = {**applications[position], **fields}
+            
+            record = {'op': 'update', 'application_id': application_id, 'fields': fields}
+            if _record_changes([record], applications) is None:
+                return False
+            
+            logger.info(f"Application status updated: {application_id} -> {status}")
+            return True
     except Exception as e:
         logger.error(f"Error updating application status: {e}")
         return False
@@ -165,40 +529,27 @@ def update_application_status(application_id: str, status: str) -> bool:
 def delete_application(application_id: str) -> bool:
     """Delete an application by ID."""
     try:
-        applications = load_applications()
-        storage_file = get_storage_file_path()
-        
-        # Find and remove the application
-        initial_count = len(applications)
-        applications = [app for app in applications if app.get('application_id') != application_id]
-        
-        # Check if application was found and removed
-        if len(applications) == initial_count:
-            logger.warning(f"Application not found for deletion: {application_id}")
-            return False
+        with _storage_lock():
+            applications = _cached_applications()[0]
+            
+            # Find and remove the application
+            initial_count = len(applications)
+            applications = [app for app in applications if app.get('application_id') != application_id]
+            
+            # Check if application was found and removed
+            if len(applications) == initial_count:
+                logger.warning(f"Application not found for deletion: {application_id}")
+                return False
+            
+            # Save the deletion
+            record = {'op': 'delete', 'application_id': application_id}
+            if _record_changes([record], applications) is None:
+                return False
         
-        # Save updated applications list
-        try:
-            with open(storage_file, 'w', encoding='utf-8') as f:
-                json.dump(applications, f, indent=2, ensure_ascii=False, default=str)
-            logger.info(f"Application deleted: {application_id}")
-            return True
-        except (IOError, OSError, PermissionError) as e:
-            # If project root write fails, try temp directory
-            logger.warning(f"Cannot write to project directory ({e}), using temp directory instead")
-            temp_storage_file = TEMP_STORAGE_FILE
-            try:
-                with open(str(temp_storage_file), 'w', encoding='utf-8') as f:
-                    json.dump(applications, f, indent=2, ensure_ascii=False, default=str)
-                logger.info(f"Application deleted from temp location: {application_id}")
-                return True
-            except Exception as temp_error:
-                logger.error(f"Error saving to temp directory: {temp_error}")
-                raise temp_error
+        logger.info(f"Application deleted: {application_id}")
+        return True
         
     except Exception as e:
-        logger.error(f"Error deleting application: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting application: {e}")
         return False
 
@@ -4,12 +4,142 @@ Validators for different loan types.
 
 import re
 import logging
-from typing import Dict, Tuple, Optional
-from datetime import datetime
+from typing import Callable, Dict, Tuple, Optional
+from datetime import date, datetime
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False  # google-re2 not installed, emails are matched with the re module
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Compiled once at import. Backtracking in re is bounded for addresses up to
+# the RFC 5321 length limit (a few microseconds at worst), and re is much
+# cheaper to call than the re2 wrapper; longer input goes to RE2, which
+# matches in linear time, so a crafted address can't make matching slow.
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_LONG_EMAIL_RE = re2.compile(_EMAIL_PATTERN) if RE2_AVAILABLE else _EMAIL_RE
+_MAX_EMAIL_LENGTH = 254
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+# Each validator is a table of checks, run in order; the first failure is
+# reported. Steps:
+#   ('required', fields, allow_zero)     present and non-empty (numeric 0 counts if allow_zero)
+#   ('non_negative', fields)             present numeric fields that may be 0
+#   ('int_range', field, min, max, range_message, invalid_message)
+#   ('optional_int_range', field, min, max, range_message, invalid_message)
+#                                        only checked when the field is given
+#   ('check', field, function, message)  function(value) must be true
+#   ('choice', field, choices, message)
+#   ('any_of', fields, message)          at least one field is given
+#   ('ranges', ((field, min, max), ...)) numeric bounds
+# The tables are compiled into one function per loan type at import (see
+# _compile_validator), after the validator classes whose helpers they use.
+
+
+def _compile_validator(steps: Tuple, loan_type: str) -> Callable[[Dict], Tuple[bool, Optional[str]]]:
+    """
+    Compile a validation table into a function returning (is_valid, error_message).
+    
+    The generated code checks each field inline, with its bounds, choices
+    and messages as literals, instead of looping over the tables and
+    calling a helper per step for every application.
+    """
+    namespace = {}
+    lines = [f'def _validate_{loan_type}(data):']
+    parsed = set()  # fields already converted with float() into a local
+    
+    def fail(message):
+        lines.append(f'        return False, {message!r}')
+    
+    for i, (kind, *args) in enumerate(steps):
+        if kind == 'required':
+            fields, allow_zero = args
+            for field in fields:
+                missing = f"Missing required field: {field}"
+                lines.append(f'    if {field!r} not in data:')
+                fail(missing)
+                lines.append(f'    value = data[{field!r}]')
+                if allow_zero:
+                    lines.append('    if not value and not isinstance(value, (int, float)):')
+                else:
+                    lines.append('    if not value:')
+                fail(missing)
+        elif kind == 'non_negative':
+            for field in args[0]:
+                missing = f"Missing required field: {field}"
+                local = f'number_{field}'
+                lines.append(f'    if {field!r} not in data:')
+                fail(missing)
+                lines += [
+                    f'    value = data[{field!r}]',
+                    '    try:',
+                    f'        {local} = float(value)',
+                    '    except (ValueError, TypeError):',
+                    "        if value is None or value == '':",
+                    f'            return False, {missing!r}',
+                    f'        {local} = None  # Reported as invalid by the range check',
+                    '    else:',
+                    f'        if {local} < 0:',
+                    f'            return False, {field + " cannot be negative"!r}',
+                ]
+                parsed.add(field)
+        elif kind in ('int_range', 'optional_int_range'):
+            field, low, high, range_message, invalid_message = args
+            indent = '    '
+            if kind == 'optional_int_range':
+                lines.append(f'    if {field!r} in data and data[{field!r}]:')
+                indent = '        '
+            lines += [
+                f'{indent}try:',
+                f'{indent}    value = int(data[{field!r}])',
+                f'{indent}except (ValueError, TypeError):',
+                f'{indent}    return False, {invalid_message!r}',
+                f'{indent}if value < {low!r} or value > {high!r}:',
+                f'{indent}    return False, {range_message!r}',
+            ]
+        elif kind == 'check':
+            field, function, message = args
+            namespace[f'_check_{i}'] = function
+            lines.append(f'    if not _check_{i}(data[{field!r}]):')
+            fail(message)
+        elif kind == 'choice':
+            field, choices, message = args
+            lines.append(f'    if data[{field!r}] not in {tuple(choices)!r}:')
+            fail(message)
+        elif kind == 'any_of':
+            fields, message = args
+            lines.append(f"    if {' and '.join(f'not data.get({field!r})' for field in fields)}:")
+            fail(message)
+        elif kind == 'ranges':
+            for field, low, high in args[0]:
+                if field in parsed:
+                    value = f'number_{field}'
+                    lines.append(f'    if {value} is None:')
+                    fail(f"Invalid {field}")
+                else:
+                    value = 'value'
+                    lines += [
+                        '    try:',
+                        f'        value = float(data[{field!r}])',
+                        '    except (ValueError, TypeError):',
+                        f'        return False, {"Invalid " + field!r}',
+                    ]
+                lines.append(f'    if {value} < {low!r} or {value} > {high!r}:')
+                fail(f"{field} must be between {low} and {high}")
+        else:
+            raise ValueError(f"Unknown validation step: {kind}")
+    
+    lines.append('    return True, None')
+    
+    exec(compile('\n'.join(lines), f'<{loan_type} validator>', 'exec'), namespace)
+    return namespace[f'_validate_{loan_type}']
+
 
 class EducationLoanValidator:
     """Validator for Education Loan applications."""
@@ -17,98 +147,28 @@ class EducationLoanValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        # The pattern allows exactly one '@'; most malformed input fails here
+        if not isinstance(email, str) or email.count('@') != 1:
+            return False
+        pattern = _EMAIL_RE if len(email) <= _MAX_EMAIL_LENGTH else _LONG_EMAIL_RE
+        return pattern.fullmatch(email) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Validate phone number (10 digits)."""
-        phone_clean = re.sub(r'[^\d]', '', phone)
+        # Fewer than 10 characters can't hold 10 digits, and an all-digit
+        # string needs no cleaning (isdecimal() matches exactly what \d does)
+        if len(phone) < 10:
+            return False
+        if phone.isdecimal():
+            return True
+        phone_clean = _NON_DIGIT_RE.sub('', phone)
         return len(phone_clean) >= 10
     
     @staticmethod
     def validate(data: Dict) -> Tuple[bool, Optional[str]]:
         """Validate education loan application data."""
-        # Required fields (non-numeric)
-        required_fields = [
-            'full_name', 'age', 'gender', 'phone_number', 'email',
-            'course_name', 'course_duration', 'institution_name', 'institution_type',
-            'co_borrower_name', 'co_borrower_occupation', 'existing_loan',
-            'loan_amount_required', 'repayment_period', 'purpose'
-        ]
-        
-        # Check non-numeric required fields
-        for field in required_fields:
-            if field not in data or (not isinstance(data[field], (int, float)) and not data[field]):
-                return False, f"Missing required field: {field}"
-        
-        # Check numeric required fields (allow 0 for students who don't have income)
-        numeric_required_fields = [
-            'applicant_annual_income', 'parent_guardian_income', 'co_borrower_annual_income'
-        ]
-        
-        for field in numeric_required_fields:
-            if field not in data:
-                return False, f"Missing required field: {field}"
-            # Allow 0 or positive numbers, but not None, empty string, or negative
-            try:
-                value = float(data[field])
-                if value < 0:
-                    return False, f"{field} cannot be negative"
-            except (ValueError, TypeError):
-                if data[field] is None or data[field] == '':
-                    return False, f"Missing required field: {field}"
-        
-        # Validate age
-        try:
-            age = int(data['age'])
-            if age < 16 or age > 65:
-                return False, "Age must be between 16 and 65"
-        except (ValueError, TypeError):
-            return False, "Invalid age"
-        
-        # Validate email
-        if not EducationLoanValidator.validate_email(data['email']):
-            return False, "Invalid email format"
-        
-        # Validate phone
-        if not EducationLoanValidator.validate_phone(data['phone_number']):
-            return False, "Invalid phone number"
-        
-        # Validate gender
-        if data['gender'] not in ['Male', 'Female', 'Other']:
-            return False, "Invalid gender"
-        
-        # Validate institution_type
-        if data['institution_type'] not in ['Government', 'Private', 'Abroad']:
-            return False, "Invalid institution type"
-        
-        # Validate existing_loan
-        if data['existing_loan'] not in ['Yes', 'No']:
-            return False, "Invalid existing_loan value (must be Yes or No)"
-        
-        # Validate numeric fields
-        numeric_fields = {
-            'course_duration': (1, 10),
-            'applicant_annual_income': (0, 10000000),  # Allow 0 for students
-            'parent_guardian_income': (0, 10000000),
-            'co_borrower_annual_income': (0, 10000000),
-            'loan_amount_required': (10000, 5000000),
-            'repayment_period': (1, 20)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            try:
-                value = float(data[field])
-                # Special case: allow 0 for applicant_annual_income (students may have no income)
-                if field == 'applicant_annual_income' and value == 0:
-                    continue  # Skip validation for 0 income
-                if value < min_val or value > max_val:
-                    return False, f"{field} must be between {min_val} and {max_val}"
-            except (ValueError, TypeError):
-                return False, f"Invalid {field}"
-        
-        return True, None
+        return _validate_education(data)
 
 
 class HomeLoanValidator:
@@ -117,98 +177,7 @@ class HomeLoanValidator:
     @staticmethod
     def validate(data: Dict) -> Tuple[bool, Optional[str]]:
         """Validate home loan application data."""
-        # Check non-numeric required fields
-        non_numeric_fields = [
-            'full_name', 'gender', 'marital_status', 'phone_number', 'email',
-            'employment_type', 'company_business_name', 'property_type',
-            'property_location', 'ownership_type', 'existing_emi'
-        ]
-        
-        for field in non_numeric_fields:
-            if field not in data or (not isinstance(data[field], (int, float)) and not data[field]):
-                return False, f"Missing required field: {field}"
-        
-        # Check numeric required fields (allow 0 for co_applicant_income)
-        numeric_required_fields = ['age', 'work_experience', 'annual_income', 'property_value',
-                                  'down_payment_amount', 'co_applicant_income', 'loan_amount_required', 'loan_tenure']
-        
-        for field in numeric_required_fields:
-            if field not in data:
-                return False, f"Missing required field: {field}"
-            # Allow 0 or positive numbers, but not None, empty string, or negative
-            try:
-                value = float(data[field])
-                if value < 0:
-                    return False, f"{field} cannot be negative"
-            except (ValueError, TypeError):
-                if data[field] is None or data[field] == '':
-                    return False, f"Missing required field: {field}"
-        
-        # Validate age
-        try:
-            age = int(data['age'])
-            if age < 18 or age > 70:
-                return False, "Age must be between 18 and 70"
-        except (ValueError, TypeError):
-            return False, "Invalid age"
-        
-        # Validate email
-        if not EducationLoanValidator.validate_email(data['email']):
-            return False, "Invalid email format"
-        
-        # Validate phone
-        if not EducationLoanValidator.validate_phone(data['phone_number']):
-            return False, "Invalid phone number"
-        
-        # Validate marital_status
-        if data['marital_status'] not in ['Single', 'Married', 'Divorced', 'Widowed']:
-            return False, "Invalid marital status"
-        
-        # Validate employment_type
-        if data['employment_type'] not in ['Salaried', 'Self-Employed']:
-            return False, "Invalid employment type"
-        
-        # Validate property_type
-        if data['property_type'] not in ['Flat', 'House', 'Plot']:
-            return False, "Invalid property type"
-        
-        # Validate ownership_type
-        if data['ownership_type'] not in ['New', 'Resale', 'Under Construction']:
-            return False, "Invalid ownership type"
-        
-        # Validate existing_emi
-        if data['existing_emi'] not in ['Yes', 'No']:
-            return False, "Invalid existing_emi value"
-        
-        # Validate numeric fields
-        numeric_fields = {
-            'work_experience': (0, 50),
-            'annual_income': (100000, 10000000),
-            'property_value': (500000, 50000000),
-            'down_payment_amount': (0, 50000000),
-            'co_applicant_income': (0, 10000000),
-            'loan_amount_required': (500000, 50000000),
-            'loan_tenure': (5, 30)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            try:
-                value = float(data[field])
-                if value < min_val or value > max_val:
-                    return False, f"{field} must be between {min_val} and {max_val}"
-            except (ValueError, TypeError):
-                return False, f"Invalid {field}"
-        
-        # Validate credit_score if provided
-        if 'credit_score' in data and data['credit_score']:
-            try:
-                score = int(data['credit_score'])
-                if score < 300 or score > 850:
-                    return False, "Credit score must be between 300 and 850"
-            except (ValueError, TypeError):
-                return False, "Invalid credit score"
-        
-        return True, None
+        return _validate_home(data)
 
 
 class CarLoanValidator:
@@ -217,66 +186,7 @@ class CarLoanValidator:
     @staticmethod
     def validate(data: Dict) -> Tuple[bool, Optional[str]]:
         """Validate car loan application data."""
-        required_fields = [
-            'full_name', 'age', 'gender', 'phone_number', 'email',
-            'employment_type', 'work_experience',
-            'car_type', 'brand', 'model', 'car_price', 'registration_city',
-            'loan_amount_required', 'loan_tenure', 'down_payment', 'existing_loans'
-        ]
-        
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return False, f"Missing required field: {field}"
-        
-        # Validate age
-        try:
-            age = int(data['age'])
-            if age < 18 or age > 70:
-                return False, "Age must be between 18 and 70"
-        except (ValueError, TypeError):
-            return False, "Invalid age"
-        
-        # Validate email
-        if not EducationLoanValidator.validate_email(data['email']):
-            return False, "Invalid email format"
-        
-        # Validate phone
-        if not EducationLoanValidator.validate_phone(data['phone_number']):
-            return False, "Invalid phone number"
-        
-        # Validate car_type
-        if data['car_type'] not in ['New', 'Used']:
-            return False, "Invalid car type"
-        
-        # Validate existing_loans
-        if data['existing_loans'] not in ['Yes', 'No']:
-            return False, "Invalid existing_loans value"
-        
-        # Validate income (either monthly or annual)
-        has_monthly = 'monthly_income' in data and data['monthly_income']
-        has_annual = 'annual_income' in data and data['annual_income']
-        
-        if not has_monthly and not has_annual:
-            return False, "Either monthly_income or annual_income is required"
-        
-        # Validate numeric fields
-        numeric_fields = {
-            'work_experience': (0, 50),
-            'car_price': (100000, 10000000),
-            'loan_amount_required': (50000, 10000000),
-            'loan_tenure': (12, 84),  # 1-7 years in months
-            'down_payment': (0, 10000000)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            try:
-                value = float(data[field])
-                if value < min_val or value > max_val:
-                    return False, f"{field} must be between {min_val} and {max_val}"
-            except (ValueError, TypeError):
-                return False, f"Invalid {field}"
-        
-        return True, None
+        return _validate_car(data)
 
 
 class PersonalLoanValidator:
@@ -285,6 +195,17 @@ class PersonalLoanValidator:
     @staticmethod
     def validate_date(date_string: str) -> bool:
         """Validate date in YYYY-MM-DD format."""
+        # Zero-padded dates are checked without strptime, which re-parses the
+        # format on every call; date() still rejects days like Feb 30
+        if len(date_string) == 10 and date_string[4] == '-' and date_string[7] == '-':
+            year, month, day = date_string[:4], date_string[5:7], date_string[8:]
+            if year.isdecimal() and month.isdecimal() and day.isdecimal():
+                try:
+                    date(int(year), int(month), int(day))
+                    return True
+                except ValueError:
+                    return False
+        
         try:
             datetime.strptime(date_string, '%Y-%m-%d')
             return True
@@ -294,66 +215,7 @@ class PersonalLoanValidator:
     @staticmethod
     def validate(data: Dict) -> Tuple[bool, Optional[str]]:
         """Validate personal loan application data."""
-        required_fields = [
-            'full_name', 'date_of_birth', 'gender', 'phone', 'email',
-            'employment_type', 'monthly_income', 'work_experience', 'existing_emi',
-            'loan_amount_required', 'loan_tenure', 'loan_purpose'
-        ]
-        
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return False, f"Missing required field: {field}"
-        
-        # Validate date_of_birth
-        if not PersonalLoanValidator.validate_date(data['date_of_birth']):
-            return False, "Invalid date_of_birth format (must be YYYY-MM-DD)"
-        
-        # Validate email
-        if not EducationLoanValidator.validate_email(data['email']):
-            return False, "Invalid email format"
-        
-        # Validate phone
-        if not EducationLoanValidator.validate_phone(data['phone']):
-            return False, "Invalid phone number"
-        
-        # Validate gender
-        if data['gender'] not in ['Male', 'Female', 'Other']:
-            return False, "Invalid gender"
-        
-        # Validate employment_type
-        if data['employment_type'] not in ['Salaried', 'Self-Employed', 'Business']:
-            return False, "Invalid employment type"
-        
-        # Validate existing_emi
-        if data['existing_emi'] not in ['Yes', 'No']:
-            return False, "Invalid existing_emi value"
-        
-        # Validate numeric fields
-        numeric_fields = {
-            'monthly_income': (10000, 5000000),
-            'work_experience': (0, 50),
-            'loan_amount_required': (10000, 5000000),
-            'loan_tenure': (6, 60)  # months
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            try:
-                value = float(data[field])
-                if value < min_val or value > max_val:
-                    return False, f"{field} must be between {min_val} and {max_val}"
-            except (ValueError, TypeError):
-                return False, f"Invalid {field}"
-        
-        # Validate credit_score if provided
-        if 'credit_score' in data and data['credit_score']:
-            try:
-                score = int(data['credit_score'])
-                if score < 300 or score > 850:
-                    return False, "Credit score must be between 300 and 850"
-            except (ValueError, TypeError):
-                return False, "Invalid credit score"
-        
-        return True, None
+        return _validate_personal(data)
 
 
 class BusinessLoanValidator:
@@ -381,57 +243,136 @@ class BusinessLoanValidator:
     @staticmethod
     def validate(data: Dict) -> Tuple[bool, Optional[str]]:
         """Validate business loan application data."""
-        required_fields = [
-            'business_name', 'business_type', 'business_age', 'annual_turnover',
-            'gst_number', 'business_address',
-            'owner_name', 'phone_number', 'email',
-            'existing_loans', 'credit_score', 'loan_amount_required', 'loan_tenure', 'loan_purpose'
-        ]
-        
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return False, f"Missing required field: {field}"
-        
-        # Validate email
-        if not EducationLoanValidator.validate_email(data['email']):
-            return False, "Invalid email format"
-        
-        # Validate phone
-        if not EducationLoanValidator.validate_phone(data['phone_number']):
-            return False, "Invalid phone number"
-        
-        # Validate GST number
-        if not BusinessLoanValidator.validate_gst(data['gst_number']):
-            return False, "Invalid GST number format (must be 15 characters)"
-        
-        # Validate existing_loans
-        if data['existing_loans'] not in ['Yes', 'No']:
-            return False, "Invalid existing_loans value"
-        
-        # Validate credit_score
-        if 'credit_score' in data and data['credit_score']:
-            try:
-                score = int(data['credit_score'])
-                if score < 300 or score > 900:
-                    return False, "Credit score must be between 300 and 900"
-            except (ValueError, TypeError):
-                return False, "Invalid credit score"
-        
-        # Validate numeric fields
-        numeric_fields = {
-            'business_age': (0, 100),
-            'annual_turnover': (100000, 100000000),
-            'loan_amount_required': (100000, 50000000),
-            'loan_tenure': (1, 10)  # years
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            try:
-                value = float(data[field])
-                if value < min_val or value > max_val:
-                    return False, f"{field} must be between {min_val} and {max_val}"
-            except (ValueError, TypeError):
-                return False, f"Invalid {field}"
-        
-        return True, None
+        return _validate_business(data)
+
+
+_EMAIL_CHECK = ('check', 'email', EducationLoanValidator.validate_email, "Invalid email format")
+_YES_NO = ('Yes', 'No')
+_GENDERS = ('Male', 'Female', 'Other')
+_CREDIT_SCORE_CHECK = ('optional_int_range', 'credit_score', 300, 850,
+                       "Credit score must be between 300 and 850", "Invalid credit score")
+
+EDUCATION_CHECKS = (
+    ('required', (
+        'full_name', 'age', 'gender', 'phone_number', 'email',
+        'course_name', 'course_duration', 'institution_name', 'institution_type',
+        'co_borrower_name', 'co_borrower_occupation', 'existing_loan',
+        'loan_amount_required', 'repayment_period', 'purpose'
+    ), True),
+    # Incomes may be 0 for students who don't have income
+    ('non_negative', ('applicant_annual_income', 'parent_guardian_income', 'co_borrower_annual_income')),
+    ('int_range', 'age', 16, 65, "Age must be between 16 and 65", "Invalid age"),
+    _EMAIL_CHECK,
+    ('check', 'phone_number', EducationLoanValidator.validate_phone, "Invalid phone number"),
+    ('choice', 'gender', _GENDERS, "Invalid gender"),
+    ('choice', 'institution_type', ('Government', 'Private', 'Abroad'), "Invalid institution type"),
+    ('choice', 'existing_loan', _YES_NO, "Invalid existing_loan value (must be Yes or No)"),
+    ('ranges', (
+        ('course_duration', 1, 10),
+        ('applicant_annual_income', 0, 10000000),  # Allow 0 for students
+        ('parent_guardian_income', 0, 10000000),
+        ('co_borrower_annual_income', 0, 10000000),
+        ('loan_amount_required', 10000, 5000000),
+        ('repayment_period', 1, 20)
+    )),
+)
+
+HOME_CHECKS = (
+    ('required', (
+        'full_name', 'gender', 'marital_status', 'phone_number', 'email',
+        'employment_type', 'company_business_name', 'property_type',
+        'property_location', 'ownership_type', 'existing_emi'
+    ), True),
+    # co_applicant_income may be 0
+    ('non_negative', ('age', 'work_experience', 'annual_income', 'property_value',
+                      'down_payment_amount', 'co_applicant_income', 'loan_amount_required', 'loan_tenure')),
+    ('int_range', 'age', 18, 70, "Age must be between 18 and 70", "Invalid age"),
+    _EMAIL_CHECK,
+    ('check', 'phone_number', EducationLoanValidator.validate_phone, "Invalid phone number"),
+    ('choice', 'marital_status', ('Single', 'Married', 'Divorced', 'Widowed'), "Invalid marital status"),
+    ('choice', 'employment_type', ('Salaried', 'Self-Employed'), "Invalid employment type"),
+    ('choice', 'property_type', ('Flat', 'House', 'Plot'), "Invalid property type"),
+    ('choice', 'ownership_type', ('New', 'Resale', 'Under Construction'), "Invalid ownership type"),
+    ('choice', 'existing_emi', _YES_NO, "Invalid existing_emi value"),
+    ('ranges', (
+        ('work_experience', 0, 50),
+        ('annual_income', 100000, 10000000),
+        ('property_value', 500000, 50000000),
+        ('down_payment_amount', 0, 50000000),
+        ('co_applicant_income', 0, 10000000),
+        ('loan_amount_required', 500000, 50000000),
+        ('loan_tenure', 5, 30)
+    )),
+    _CREDIT_SCORE_CHECK,
+)
+
+CAR_CHECKS = (
+    ('required', (
+        'full_name', 'age', 'gender', 'phone_number', 'email',
+        'employment_type', 'work_experience',
+        'car_type', 'brand', 'model', 'car_price', 'registration_city',
+        'loan_amount_required', 'loan_tenure', 'down_payment', 'existing_loans'
+    ), False),
+    ('int_range', 'age', 18, 70, "Age must be between 18 and 70", "Invalid age"),
+    _EMAIL_CHECK,
+    ('check', 'phone_number', EducationLoanValidator.validate_phone, "Invalid phone number"),
+    ('choice', 'car_type', ('New', 'Used'), "Invalid car type"),
+    ('choice', 'existing_loans', _YES_NO, "Invalid existing_loans value"),
+    ('any_of', ('monthly_income', 'annual_income'), "Either monthly_income or annual_income is required"),
+    ('ranges', (
+        ('work_experience', 0, 50),
+        ('car_price', 100000, 10000000),
+        ('loan_amount_required', 50000, 10000000),
+        ('loan_tenure', 12, 84),  # 1-7 years in months
+        ('down_payment', 0, 10000000)
+    )),
+)
+
+PERSONAL_CHECKS = (
+    ('required', (
+        'full_name', 'date_of_birth', 'gender', 'phone', 'email',
+        'employment_type', 'monthly_income', 'work_experience', 'existing_emi',
+        'loan_amount_required', 'loan_tenure', 'loan_purpose'
+    ), False),
+    ('check', 'date_of_birth', PersonalLoanValidator.validate_date,
+     "Invalid date_of_birth format (must be YYYY-MM-DD)"),
+    _EMAIL_CHECK,
+    ('check', 'phone', EducationLoanValidator.validate_phone, "Invalid phone number"),
+    ('choice', 'gender', _GENDERS, "Invalid gender"),
+    ('choice', 'employment_type', ('Salaried', 'Self-Employed', 'Business'), "Invalid employment type"),
+    ('choice', 'existing_emi', _YES_NO, "Invalid existing_emi value"),
+    ('ranges', (
+        ('monthly_income', 10000, 5000000),
+        ('work_experience', 0, 50),
+        ('loan_amount_required', 10000, 5000000),
+        ('loan_tenure', 6, 60)  # months
+    )),
+    _CREDIT_SCORE_CHECK,
+)
+
+BUSINESS_CHECKS = (
+    ('required', (
+        'business_name', 'business_type', 'business_age', 'annual_turnover',
+        'gst_number', 'business_address',
+        'owner_name', 'phone_number', 'email',
+        'existing_loans', 'credit_score', 'loan_amount_required', 'loan_tenure', 'loan_purpose'
+    ), False),
+    _EMAIL_CHECK,
+    ('check', 'phone_number', EducationLoanValidator.validate_phone, "Invalid phone number"),
+    ('check', 'gst_number', BusinessLoanValidator.validate_gst, "Invalid GST number format (must be 15 characters)"),
+    ('choice', 'existing_loans', _YES_NO, "Invalid existing_loans value"),
+    ('optional_int_range', 'credit_score', 300, 900,
+     "Credit score must be between 300 and 900", "Invalid credit score"),
+    ('ranges', (
+        ('business_age', 0, 100),
+        ('annual_turnover', 100000, 100000000),
+        ('loan_amount_required', 100000, 50000000),
+        ('loan_tenure', 1, 10)  # years
+    )),
+)
 
+_validate_education = _compile_validator(EDUCATION_CHECKS, 'education')
+_validate_home = _compile_validator(HOME_CHECKS, 'home')
+_validate_car = _compile_validator(CAR_CHECKS, 'car')
+_validate_personal = _compile_validator(PERSONAL_CHECKS, 'personal')
+_validate_business = _compile_validator(BUSINESS_CHECKS, 'business')
@@ -0,0 +1,54 @@
+"""
+Sampling of repeated exception tracebacks in logs.
+"""
+
+import logging
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+
+class SampledTracebackFormatter(logging.Formatter):
+    """
+    Log formatter that keeps one traceback in every `rate` for each call site.
+    
+    Records are never dropped or modified; repeated errors from the same
+    file and line are formatted without their traceback, so a burst of
+    identical failures doesn't pay for formatting and writing the same
+    stack over and over. Each record is counted once, however many
+    handlers share the formatter.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, rate: int = 100):
+        super().__init__(fmt, datefmt)
+        self.rate = max(1, rate)
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._occurrences = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+    
+    def _occurrence(self, record: logging.LogRecord) -> int:
+        """How many records from this call site were seen up to and including record."""
+        with self._lock:
+            occurrence = self._occurrences.get(record)
+            if occurrence is None:
+                key = (record.pathname, record.lineno)
+                occurrence = self._counts.get(key, 0) + 1
+                self._counts[key] = occurrence
+                self._occurrences[record] = occurrence
+        return occurrence
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if not record.exc_info:
+            return super().format(record)
+        
+        occurrence = self._occurrence(record)
+        if (occurrence - 1) % self.rate == 0:
+            return super().format(record)
+        
+        # Format a copy, so other handlers still get the traceback
+        sampled = logging.makeLogRecord(record.__dict__)
+        sampled.msg = f"{record.getMessage()} (traceback sampled out, {occurrence} occurrences)"
+        sampled.args = None
+        sampled.exc_info = None
+        sampled.exc_text = None
+        return super().format(sampled)
@@ -0,0 +1,59 @@
+"""
+Password hashing for user accounts.
+"""
+
+import base64
+import hashlib
+from typing import Optional
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False  # bcrypt not installed, werkzeug pbkdf2:sha256 is used
+
+BCRYPT_ROUNDS = 12
+
+# bcrypt only reads the first 72 bytes of a password (bcrypt >= 5 raises
+# ValueError on longer ones), so the password is hashed with SHA-256 first
+# and bcrypt gets the base64 digest (44 bytes, no NUL bytes). The prefix
+# tells these hashes apart from plain bcrypt hashes stored earlier.
+PREHASHED_PREFIX = 'bcrypt-sha256$'
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _prehash(password: str) -> bytes:
+    return base64.b64encode(hashlib.sha256(password.encode('utf-8')).digest())
+
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage (bcrypt, or pbkdf2:sha256 without bcrypt)."""
+    if BCRYPT_AVAILABLE:
+        hashed = bcrypt.hashpw(_prehash(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+        return PREHASHED_PREFIX + hashed.decode('ascii')
+    return generate_password_hash(password, method='pbkdf2:sha256')
+
+
+def check_password(password_hash: Optional[str], password: Optional[str]) -> bool:
+    """Whether password matches a hash from hash_password or an older scheme."""
+    if not password_hash or password is None:
+        return False
+    if password_hash.startswith(PREHASHED_PREFIX):
+        if not BCRYPT_AVAILABLE:
+            return False
+        return bcrypt.checkpw(_prehash(password), password_hash[len(PREHASHED_PREFIX):].encode('ascii'))
+    if password_hash.startswith('$2'):
+        # Plain bcrypt hash, which only covered the first 72 bytes
+        if not BCRYPT_AVAILABLE:
+            return False
+        secret = password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+        return bcrypt.checkpw(secret, password_hash.encode('ascii'))
+    # Legacy werkzeug hash
+    return check_password_hash(password_hash, password)
+
+
+def needs_rehash(password_hash: Optional[str]) -> bool:
+    """Whether a stored hash should be replaced by hash_password() at the next login."""
+    return BCRYPT_AVAILABLE and not (password_hash or '').startswith(PREHASHED_PREFIX)
@@ -3,8 +3,17 @@ Input validation utilities for loan application data.
 """
 
 import logging
+import re
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from typing import Annotated
+    from typing_extensions import TypedDict
+    from pydantic import ConfigDict, Field, StringConstraints, TypeAdapter, ValidationError
+    PYDANTIC_AVAILABLE = True
+except ImportError:
+    PYDANTIC_AVAILABLE = False  # pydantic v2 not installed, parse_application uses the Python checks
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -75,23 +84,26 @@ class LoanApplicationValidator:
         if data['Property_Area'] not in LoanApplicationValidator.VALID_PROPERTY_AREA:
             return False, f"Invalid Property_Area. Must be one of: {LoanApplicationValidator.VALID_PROPERTY_AREA}"
         
-        # Validate numeric fields
+        # Validate numeric fields (bounds bound locally, each is compared twice)
+        min_income, max_income = LoanApplicationValidator.MIN_INCOME, LoanApplicationValidator.MAX_INCOME
+        min_amount, max_amount = LoanApplicationValidator.MIN_LOAN_AMOUNT, LoanApplicationValidator.MAX_LOAN_AMOUNT
+        min_term, max_term = LoanApplicationValidator.MIN_LOAN_TERM, LoanApplicationValidator.MAX_LOAN_TERM
         try:
             applicant_income = float(data['ApplicantIncome'])
-            if applicant_income < LoanApplicationValidator.MIN_INCOME or applicant_income > LoanApplicationValidator.MAX_INCOME:
-                return False, f"ApplicantIncome must be between {LoanApplicationValidator.MIN_INCOME} and {LoanApplicationValidator.MAX_INCOME}"
+            if applicant_income < min_income or applicant_income > max_income:
+                return False, f"ApplicantIncome must be between {min_income} and {max_income}"
             
             coapplicant_income = float(data['CoapplicantIncome'])
-            if coapplicant_income < LoanApplicationValidator.MIN_INCOME or coapplicant_income > LoanApplicationValidator.MAX_INCOME:
-                return False, f"CoapplicantIncome must be between {LoanApplicationValidator.MIN_INCOME} and {LoanApplicationValidator.MAX_INCOME}"
+            if coapplicant_income < min_income or coapplicant_income > max_income:
+                return False, f"CoapplicantIncome must be between {min_income} and {max_income}"
             
             loan_amount = float(data['LoanAmount'])
-            if loan_amount < LoanApplicationValidator.MIN_LOAN_AMOUNT or loan_amount > LoanApplicationValidator.MAX_LOAN_AMOUNT:
-                return False, f"LoanAmount must be between {LoanApplicationValidator.MIN_LOAN_AMOUNT} and {LoanApplicationValidator.MAX_LOAN_AMOUNT}"
+            if loan_amount < min_amount or loan_amount > max_amount:
+                return False, f"LoanAmount must be between {min_amount} and {max_amount}"
             
             loan_term = float(data['Loan_Amount_Term'])
-            if loan_term < LoanApplicationValidator.MIN_LOAN_TERM or loan_term > LoanApplicationValidator.MAX_LOAN_TERM:
-                return False, f"Loan_Amount_Term must be between {LoanApplicationValidator.MIN_LOAN_TERM} and {LoanApplicationValidator.MAX_LOAN_TERM}"
+            if loan_term < min_term or loan_term > max_term:
+                return False, f"Loan_Amount_Term must be between {min_term} and {max_term}"
             
             credit_history = float(data['Credit_History'])
             if credit_history not in LoanApplicationValidator.VALID_CREDIT_HISTORY:
@@ -102,6 +114,50 @@ class LoanApplicationValidator:
         
         return True, None
     
+    # Checks applied by the pydantic schema (see _build_predict_schema)
+    CATEGORICAL_FIELDS = {
+        'Gender': VALID_GENDERS,
+        'Married': VALID_MARRIED,
+        'Dependents': VALID_DEPENDENTS,
+        'Education': VALID_EDUCATION,
+        'Self_Employed': VALID_SELF_EMPLOYED,
+        'Property_Area': VALID_PROPERTY_AREA,
+    }
+    NUMERIC_RANGES = {
+        'ApplicantIncome': (MIN_INCOME, MAX_INCOME),
+        'CoapplicantIncome': (MIN_INCOME, MAX_INCOME),
+        'LoanAmount': (MIN_LOAN_AMOUNT, MAX_LOAN_AMOUNT),
+        'Loan_Amount_Term': (MIN_LOAN_TERM, MAX_LOAN_TERM),
+    }
+    
+    @staticmethod
+    def parse_application(data: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Sanitize and validate an application in one step.
+        
+        Equivalent to sanitize_input() followed by validate_application(),
+        with the same error messages. When pydantic v2 is installed valid
+        applications are checked by pydantic-core's compiled validator;
+        rejected ones are rechecked by the two-step path, so the error (and
+        the outcome for inputs pydantic parses differently, such as NaN or
+        non-ASCII digits) is exactly that of validate_application().
+        
+        Args:
+            data: Raw input dictionary
+            
+        Returns:
+            Tuple of (sanitized data or None, error message or None)
+        """
+        if _PREDICT_SCHEMA is not None:
+            try:
+                return _PREDICT_SCHEMA.validate_python(data), None
+            except ValidationError:
+                pass
+        
+        sanitized = LoanApplicationValidator.sanitize_input(data)
+        is_valid, error_message = LoanApplicationValidator.validate_application(sanitized)
+        return (sanitized, None) if is_valid else (None, error_message)
+    
     @staticmethod
     def sanitize_input(data: Dict) -> Dict:
         """
@@ -136,3 +192,29 @@ class LoanApplicationValidator:
         
         return sanitized
 
+
+def _build_predict_schema():
+    """
+    Build the pydantic validator for sanitize_input + validate_application.
+    
+    It must never accept an application the two-step path rejects, or
+    return different data for it; rejected applications are rechecked by
+    the two-step path. Its whitespace stripping removes a subset of what
+    str.strip() does.
+    """
+    fields = {}
+    for field, values in LoanApplicationValidator.CATEGORICAL_FIELDS.items():
+        pattern = '^(?:' + '|'.join(re.escape(value) for value in values) + ')$'
+        # sanitize_input strips the string fields, but not Dependents
+        strip = field != 'Dependents'
+        fields[field] = Annotated[str, StringConstraints(strip_whitespace=strip, pattern=pattern)]
+    for field, (low, high) in LoanApplicationValidator.NUMERIC_RANGES.items():
+        fields[field] = Annotated[float, Field(ge=low, le=high)]
+    fields['Credit_History'] = Annotated[float, Field(ge=0, le=1, multiple_of=1)]
+    # A TypedDict validates straight to a plain dict, skipping model instances
+    schema = TypedDict('PredictApplication', fields)
+    schema.__pydantic_config__ = ConfigDict(coerce_numbers_to_str=True)
+    return TypeAdapter(schema)
+
+
+_PREDICT_SCHEMA = _build_predict_schema() if PYDANTIC_AVAILABLE else None
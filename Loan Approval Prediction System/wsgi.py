@@ -1,12 +1,18 @@
-""
+"""
 WSGI config for Loan Approval Prediction System.
+
+Serve with gunicorn, loading the model in the master process before the
+workers fork:
+
+    gunicorn -w 4 --preload wsgi:application
+
+For local development run app.py directly.
 """
 
 from app import app, load_model
 
-if __name__ == "__main__":
-    # Load the ML model when starting the application
-    load_model()
-    
-    # Run the Flask development server
-    app.run(debug=True, host='0.0.0.0', port=5000)
+# Load the ML model at import so preloaded workers share it; without a model
+# the app still serves applications without the prediction feature
+load_model()
+
+application = app